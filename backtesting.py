@@ -27,6 +27,7 @@ from alpaca.data.timeframe import TimeFrame
 from pathlib import Path
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.dataflows.trading_calendar import get_exchange_calendar
 import matplotlib.ticker as ticker
 import matplotlib.dates as mdates
 import concurrent.futures
@@ -436,6 +437,17 @@ def main():
         choices=["low", "medium", "high", "no_guidance"],
         help="Risk level for the trading strategy (low, medium, high, no_guidance)",
     )
+    parser.add_argument(
+        "--llm_cassette",
+        default=None,
+        choices=["record", "replay", "replay_or_record"],
+        help="Record LLM responses, or replay them from a previous run.",
+    )
+    parser.add_argument(
+        "--llm_cassette_path",
+        default=None,
+        help="Cassette file. Defaults to data_cache_dir/llm_cassette.sqlite",
+    )
     args = parser.parse_args()
 
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -452,6 +464,8 @@ def main():
     config["max_debate_rounds"] = 1
     config["online_tools"] = True
     config["risk_level"] = args.risk_level
+    config["llm_cassette_mode"] = args.llm_cassette
+    config["llm_cassette_path"] = args.llm_cassette_path
 
     agent = TradingAgentsGraph(
         selected_analysts=args.selected_analysts, debug=True, config=config
@@ -463,10 +477,17 @@ def main():
     end_date = args.end_date
     initial_cash = args.initial_cash
 
+    trading_days = get_exchange_calendar().trading_days_between(start_date, end_date)
+    if not trading_days:
+        raise ValueError(f"No trading days between {start_date} and {end_date}")
+
     # Request historical bars
     print("Fetching historical bars...")
     bars_df = fetch_bars(data_client, symbol, start_date, end_date)
-    print(f"Retrieved {len(bars_df)} trading days of data.")
+    print(f"Retrieved {len(bars_df)} of {len(trading_days)} trading days of data.")
+    missing_days = sorted(set(trading_days) - set(bars_df.index.strftime("%Y-%m-%d")))
+    if missing_days:
+        print(f"Warning: no bars for {symbol} on trading days {missing_days}")
 
     # Request SPY as baseline
     spy_request = StockBarsRequest(
@@ -0,0 +1,185 @@
+"""
+End-to-end `propagate` throughput with the scripted offline chat model and
+toolkit: per-node wall time and allocations, and the framework overhead of
+each decision (wall time not spent inside the chat model).
+
+python -m benchmarks.graph_throughput_benchmark --tickers AAPL MSFT --dates 2024-05-01 2024-05-02
+python -m benchmarks.graph_throughput_benchmark --analysts market news --no_tracemalloc
+python -m benchmarks.graph_throughput_benchmark --parallel_analysts \
+    --parallel_debate_openings --parallel_risk_openings --llm_latency 0.2
+
+Nothing leaves the machine: the graph runs with llm_provider "fake" and a
+FakeToolkit, in a temporary working directory holding the Chroma memories and
+the state logs.
+"""
+
+import os
+import copy
+import argparse
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph.fake_llm import FakeToolkit
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+
+class NodeTimer(BaseCallbackHandler):
+    """Wall time and traced allocations of every graph node and chat model call."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = {}
+        self.node_seconds = defaultdict(float)
+        self.node_bytes = defaultdict(int)
+        self.node_calls = defaultdict(int)
+        # wall time with at least one chat model call in flight, so calls
+        # overlapping in parallel branches are not counted twice
+        self.llm_seconds = 0.0
+        self.llm_calls = 0
+        self._llm_active = 0
+        self._llm_since = 0.0
+
+    @staticmethod
+    def traced_bytes():
+        return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+    def on_chain_start(self, serialized, inputs, *, run_id, metadata=None, **kwargs):
+        # the run of a node itself, not of the runnables nested inside it
+        name = kwargs.get("name")
+        if metadata and name and metadata.get("langgraph_node") == name:
+            with self._lock:
+                self._started[run_id] = (name, time.perf_counter(), self.traced_bytes())
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        with self._lock:
+            started = self._started.pop(run_id, None)
+            if started is not None:
+                name, start, traced = started
+                self.node_seconds[name] += time.perf_counter() - start
+                self.node_bytes[name] += self.traced_bytes() - traced
+                self.node_calls[name] += 1
+
+    on_chain_error = on_chain_end
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        with self._lock:
+            self._started[run_id] = ("llm", time.perf_counter(), 0)
+            if self._llm_active == 0:
+                self._llm_since = time.perf_counter()
+            self._llm_active += 1
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        with self._lock:
+            if self._started.pop(run_id, None) is not None:
+                self.llm_calls += 1
+                self._llm_active -= 1
+                if self._llm_active == 0:
+                    self.llm_seconds += time.perf_counter() - self._llm_since
+
+    on_llm_error = on_llm_end
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline graph runs.")
+    parser.add_argument(
+        "--tickers", default=["AAPL", "MSFT", "NVDA", "TSLA"], nargs="+"
+    )
+    parser.add_argument(
+        "--dates", default=["2024-05-01", "2024-05-02", "2024-05-03"], nargs="+"
+    )
+    parser.add_argument(
+        "--analysts", default=["market", "social", "news", "fundamentals"], nargs="+"
+    )
+    parser.add_argument("--online_tools", action="store_true")
+    parser.add_argument("--parallel_analysts", action="store_true")
+    parser.add_argument("--parallel_debate_openings", action="store_true")
+    parser.add_argument("--parallel_risk_openings", action="store_true")
+    parser.add_argument(
+        "--llm_latency", default=0.0, type=float, help="seconds slept per LLM call"
+    )
+    parser.add_argument("--report_sentences", default=12, type=int)
+    parser.add_argument("--tool_rows", default=40, type=int)
+    parser.add_argument("--no_tracemalloc", action="store_true")
+    args = parser.parse_args()
+
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config.update(
+        llm_provider="fake",
+        online_tools=args.online_tools,
+        parallel_analysts=args.parallel_analysts,
+        parallel_debate_openings=args.parallel_debate_openings,
+        parallel_risk_openings=args.parallel_risk_openings,
+        response_cache=False,
+        llm_cassette_mode=None,
+    )
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        config["memory_dir"] = os.path.join(work_dir, "chroma")
+        try:
+            timer = NodeTimer()
+            start = time.perf_counter()
+            graph = TradingAgentsGraph(
+                args.analysts,
+                config=config,
+                callbacks=[timer],
+                toolkit=FakeToolkit(config, rows=args.tool_rows),
+            )
+            for llm in (graph.quick_thinking_llm, graph.deep_thinking_llm):
+                llm.report_sentences = args.report_sentences
+                llm.latency = args.llm_latency
+            setup = time.perf_counter() - start
+
+            if not args.no_tracemalloc:
+                tracemalloc.start()
+            decisions = []
+            for ticker in args.tickers:
+                for trade_date in args.dates:
+                    llm_before = timer.llm_seconds
+                    if tracemalloc.is_tracing():
+                        tracemalloc.reset_peak()
+                    traced = timer.traced_bytes()
+                    start = time.perf_counter()
+                    _, decision = graph.propagate(ticker, trade_date)
+                    wall = time.perf_counter() - start
+                    peak = (
+                        tracemalloc.get_traced_memory()[1] - traced
+                        if tracemalloc.is_tracing()
+                        else 0
+                    )
+                    decisions.append((wall, timer.llm_seconds - llm_before, peak))
+            tracemalloc.stop()
+        finally:
+            os.chdir(cwd)
+
+    n = len(decisions)
+    print(f"graph setup: {setup * 1000:.1f} ms, {n} decisions\n")
+    print(f"{'node':<28}{'calls':>7}{'total ms':>11}{'ms/call':>10}{'KiB/call':>10}")
+    for name in sorted(timer.node_seconds, key=timer.node_seconds.get, reverse=True):
+        calls = timer.node_calls[name]
+        print(
+            f"{name:<28}{calls:>7}{timer.node_seconds[name] * 1000:>11.1f}"
+            f"{timer.node_seconds[name] / calls * 1000:>10.2f}"
+            f"{timer.node_bytes[name] / calls / 1024:>10.1f}"
+        )
+
+    wall = sum(decision[0] for decision in decisions)
+    llm = sum(decision[1] for decision in decisions)
+    print(
+        f"\nper decision: {wall / n * 1000:.1f} ms wall, "
+        f"{llm / n * 1000:.1f} ms waiting on {timer.llm_calls / n:.0f} chat model calls, "
+        f"{(wall - llm) / n * 1000:.1f} ms framework overhead, "
+        f"{max(decision[2] for decision in decisions) / 1024:.0f} KiB peak traced"
+    )
+    print(f"throughput: {n / wall:.1f} decisions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Near-duplicate news collapsing on synthetic corpora: time per call and how well
+the syndicated copies of each story are recovered.
+
+python -m benchmarks.news_dedup_benchmark --stories 1000 5000 --copies 4
+
+Each story is a random text of 30-60 words; its copies get a few words
+replaced and, for half of them, a wire-service prefix.
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+
+from tradingagents.dataflows.news_dedup import (
+    cluster_signatures,
+    collapse_near_duplicates,
+    minhash,
+)
+
+
+def make_corpus(n_stories, max_copies, edits, seed=0):
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(20_000)]
+    items = []
+    for story in range(n_stories):
+        words = rng.choices(vocabulary, k=rng.randint(30, 60))
+        items.append({"text": " ".join(words), "story": story})
+        for _ in range(rng.randint(0, max_copies)):
+            copy = list(words)
+            for _ in range(edits):
+                copy[rng.randrange(len(copy))] = rng.choice(vocabulary)
+            if rng.random() < 0.5:
+                copy = ["reuters"] + copy
+            items.append({"text": " ".join(copy), "story": story})
+    rng.shuffle(items)
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark news deduplication.")
+    parser.add_argument("--stories", default=[100, 1000, 5000], nargs="+", type=int)
+    parser.add_argument("--copies", default=4, type=int)
+    parser.add_argument("--edits", default=2, type=int)
+    args = parser.parse_args()
+
+    print(
+        f"{'items':>8}{'stories':>9}{'found':>8}{'merged wrong':>14}"
+        f"{'split':>7}{'ms':>10}{'us/item':>9}"
+    )
+    for n_stories in args.stories:
+        items = make_corpus(n_stories, args.copies, args.edits)
+        start = time.perf_counter()
+        found = collapse_near_duplicates(items, lambda item: item["text"])
+        elapsed = time.perf_counter() - start
+
+        # clusters mixing stories, and stories spread over several clusters
+        labels = cluster_signatures([minhash(item["text"]) for item in items])
+        stories_per_cluster = defaultdict(set)
+        clusters_per_story = defaultdict(set)
+        for item, label in zip(items, labels):
+            stories_per_cluster[label].add(item["story"])
+            clusters_per_story[item["story"]].add(label)
+        merged_wrong = sum(len(s) > 1 for s in stories_per_cluster.values())
+        split = sum(len(c) - 1 for c in clusters_per_story.values())
+        print(
+            f"{len(items):>8}{n_stories:>9}{len(found):>8}{merged_wrong:>14}"
+            f"{split:>7}{elapsed * 1000:>10.1f}{elapsed / len(items) * 1e6:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
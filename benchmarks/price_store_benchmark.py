@@ -0,0 +1,107 @@
+"""
+Per-call load time of the offline price files: CSV parsing, Parquet reads of the
+price store (with the in-memory frame cache cleared before every call), and the
+frame cache hits that repeated loads of the same file are served from.
+
+python -m benchmarks.price_store_benchmark --repeat 20
+python -m benchmarks.price_store_benchmark --price_dir /path/to/market_data/price_data
+
+If the price directory holds no bundled files, a synthetic ten-year file is
+generated in a temporary directory so the benchmark can still run.
+"""
+
+import os
+import argparse
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+from tradingagents.dataflows.config import get_config
+from tradingagents.dataflows.frame_cache import frame_cache
+from tradingagents.dataflows.price_store import (
+    PRICE_DATA_START,
+    PRICE_DATA_END,
+    convert_all_price_csvs,
+    load_price_data,
+    price_csv_path,
+)
+
+
+def write_synthetic_price_csv(symbol, price_dir):
+    dates = pd.bdate_range(PRICE_DATA_START, PRICE_DATA_END)
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, len(dates)))
+    pd.DataFrame(
+        {
+            "Date": dates.strftime("%Y-%m-%d 00:00:00-05:00"),
+            "Open": close + rng.normal(0, 0.5, len(dates)),
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 10_000_000, len(dates)),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        }
+    ).to_csv(price_csv_path(symbol, price_dir), index=False)
+
+
+def load_csv(symbol, price_dir):
+    """The per-call load the readers did before the price store."""
+    data = pd.read_csv(price_csv_path(symbol, price_dir))
+    data["Date"] = pd.to_datetime(data["Date"], utc=True)
+    return data
+
+
+def time_per_call(fn, repeat, setup=None):
+    total = 0.0
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        total += time.perf_counter() - start
+    return total / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline price loading.")
+    parser.add_argument(
+        "--price_dir",
+        default=os.path.join(get_config()["data_dir"], "market_data", "price_data"),
+    )
+    parser.add_argument("--repeat", default=20, type=int)
+    args = parser.parse_args()
+
+    price_dir = args.price_dir
+    symbols = convert_all_price_csvs(price_dir) if os.path.isdir(price_dir) else []
+    if not symbols:
+        price_dir = tempfile.mkdtemp()
+        write_synthetic_price_csv("SYNTH", price_dir)
+        symbols = convert_all_price_csvs(price_dir)
+        print(f"No bundled price files found, using a synthetic file in {price_dir}")
+
+    print(f"{'symbol':<10}{'rows':>8}  {'load':<14}{'ms/call':>10}{'vs csv':>10}")
+    for symbol in symbols:
+        rows = len(load_price_data(symbol, price_dir))
+        csv_ms = time_per_call(lambda: load_csv(symbol, price_dir), args.repeat)
+        # Parquet read of the store, not served from the frame cache
+        store_ms = time_per_call(
+            lambda: load_price_data(symbol, price_dir),
+            args.repeat,
+            setup=frame_cache.clear,
+        )
+        load_price_data(symbol, price_dir)
+        cached_ms = time_per_call(
+            lambda: load_price_data(symbol, price_dir), args.repeat
+        )
+        for load, ms in (
+            ("csv", csv_ms),
+            ("parquet store", store_ms),
+            ("frame cache", cached_ms),
+        ):
+            print(f"{symbol:<10}{rows:>8}  {load:<14}{ms:>10.2f}{csv_ms / ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
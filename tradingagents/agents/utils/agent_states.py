@@ -1,4 +1,4 @@
-from typing import Annotated, Sequence
+from typing import Annotated, Dict, Sequence
 from datetime import date, timedelta, datetime
 from typing_extensions import TypedDict, Optional
 from langchain_openai import ChatOpenAI
@@ -7,6 +7,11 @@ from langgraph.prebuilt import ToolNode
 from langgraph.graph import END, StateGraph, START, MessagesState
 
 
+def merge_openings(left: Dict[str, str], right: Dict[str, str]) -> Dict[str, str]:
+    """Reducer of the opening statements that debaters write concurrently."""
+    return {**(left or {}), **(right or {})}
+
+
 # Researcher team state
 class InvestDebateState(TypedDict):
     bull_history: Annotated[
@@ -66,6 +71,8 @@ class AgentState(MessagesState):
         InvestDebateState, "Current state of the debate on if to invest or not"
     ]
     investment_plan: Annotated[str, "Plan generated by the Analyst"]
+    # speaker -> opening statement, when the researchers open concurrently
+    investment_openings: Annotated[Dict[str, str], merge_openings]
 
     trader_investment_plan: Annotated[str, "Plan generated by the Trader"]
 
@@ -74,3 +81,5 @@ class AgentState(MessagesState):
         RiskDebateState, "Current state of the debate on evaluating risk"
     ]
     final_trade_decision: Annotated[str, "Final decision made by the Risk Analysts"]
+    # speaker -> opening statement, when the risk debaters open concurrently
+    risk_openings: Annotated[Dict[str, str], merge_openings]
@@ -7,8 +7,12 @@ from chromadb.errors import NotFoundError
 
 
 class FinancialSituationMemory:
-    def __init__(self, name, collection=None):
-        self.client = OpenAI()
+    def __init__(self, name, collection=None, cassette=None, embedding_fn=None):
+        self._client = None
+        # record/replay store of the embeddings, see graph/llm_cassette.py
+        self.cassette = cassette
+        # replaces the OpenAI embeddings when set, e.g. by offline runs
+        self.embedding_fn = embedding_fn
         self.chroma_client = chromadb.Client(Settings(allow_reset=True))
 
         if collection is not None:
@@ -27,12 +31,28 @@ class FinancialSituationMemory:
                     raise
         self._lock = threading.Lock()
 
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = OpenAI()
+        return self._client
+
     def get_embedding(self, text):
         """Get OpenAI embedding for a text"""
-        response = self.client.embeddings.create(
-            model="text-embedding-ada-002", input=text
+        if self.embedding_fn is not None:
+            return self.embedding_fn(text)
+
+        def embed():
+            response = self.client.embeddings.create(
+                model="text-embedding-ada-002", input=text
+            )
+            return response.data[0].embedding
+
+        if self.cassette is None:
+            return embed()
+        return self.cassette.call(
+            {"embedding": "text-embedding-ada-002", "input": text}, embed
         )
-        return response.data[0].embedding
 
     def add_situations(self, situations_and_advice):
         """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
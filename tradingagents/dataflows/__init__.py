@@ -1,8 +1,17 @@
 from .finnhub_utils import get_data_in_range
+from .finnhub_store import import_finnhub_data
 from .googlenews_utils import getNewsData, getNewsData_api
 from .yfin_utils import YFinanceUtils
 from .reddit_utils import fetch_top_from_category
+from .reddit_index import build_reddit_indexes
+from .mention_matcher import MentionMatcher
 from .stockstats_utils import StockstatsUtils
+from .price_store import load_price_data, convert_all_price_csvs
+from .indicator_store import build_all_indicator_matrices, get_indicator_window
+from .incremental_indicators import IncrementalIndicators, update_indicators
+from .frame_cache import frame_cache
+from .trading_calendar import TradingCalendar, get_exchange_calendar
+from .fundamentals_store import build_fundamentals_store, get_latest_statement
 from .yfin_utils import YFinanceUtils
 
 from .interface import (
@@ -18,6 +27,7 @@ from .interface import (
     get_simfin_balance_sheet,
     get_simfin_cashflow,
     get_simfin_income_statements,
+    get_simfin_statements_batch,
     # Technical analysis functions
     get_stock_stats_indicators_window,
     get_stockstats_indicator,
@@ -39,6 +49,7 @@ __all__ = [
     "get_simfin_balance_sheet",
     "get_simfin_cashflow",
     "get_simfin_income_statements",
+    "get_simfin_statements_batch",
     # Technical analysis functions
     "get_stock_stats_indicators_window",
     "get_stockstats_indicator",
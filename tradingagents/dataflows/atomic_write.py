@@ -0,0 +1,37 @@
+import os
+import json
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+
+@contextmanager
+def atomic_path(path: str) -> Iterator[str]:
+    """
+    Temporary path to write the new content of `path` to. When the block
+    succeeds it replaces `path` through an atomic rename, so concurrent readers
+    never see a partial file; otherwise it is removed. The name is unique per
+    call, so concurrent writers (threads or processes) never share it, and it
+    sits next to `path` so the rename stays on one filesystem.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_json_atomic(value: Any, path: str) -> None:
+    """Write value to path as JSON, through an atomic rename."""
+    with atomic_path(path) as tmp_path, open(tmp_path, "w") as f:
+        json.dump(value, f)
@@ -0,0 +1,187 @@
+import os
+import json
+import sqlite3
+import threading
+from contextlib import closing
+from typing import Annotated, Dict, List, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS finnhub_data (
+    ticker TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    period TEXT NOT NULL,
+    date TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS finnhub_data_range
+    ON finnhub_data (ticker, data_type, period, date);
+CREATE TABLE IF NOT EXISTS finnhub_sources (
+    ticker TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    period TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    PRIMARY KEY (ticker, data_type, period)
+);
+"""
+
+# Serializes imports within the process, SQLite locks across processes
+_import_lock = threading.Lock()
+# Stores whose schema was created by this process
+_initialized_stores = set()
+_schema_lock = threading.Lock()
+
+
+def finnhub_json_path(
+    ticker: str, data_type: str, data_dir: str, period: Optional[str] = None
+) -> str:
+    """Path of the formatted Finnhub JSON file of a ticker."""
+    if period:
+        file_name = f"{ticker}_{period}_data_formatted.json"
+    else:
+        file_name = f"{ticker}_data_formatted.json"
+    return os.path.join(data_dir, "finnhub_data", data_type, file_name)
+
+
+def finnhub_store_path(data_dir: str) -> str:
+    """Path of the SQLite store holding every imported Finnhub file."""
+    return os.path.join(data_dir, "finnhub_data", "finnhub.sqlite")
+
+
+def _connect(data_dir: str) -> sqlite3.Connection:
+    store_path = finnhub_store_path(data_dir)
+    os.makedirs(os.path.dirname(store_path), exist_ok=True)
+    exists = os.path.exists(store_path)
+    conn = sqlite3.connect(store_path, timeout=30)
+    # the schema is created once per store, not on every query connection
+    with _schema_lock:
+        if not exists or store_path not in _initialized_stores:
+            conn.executescript(_SCHEMA)
+            _initialized_stores.add(store_path)
+    return conn
+
+
+def import_finnhub_file(
+    conn: sqlite3.Connection,
+    ticker: str,
+    data_type: str,
+    data_dir: str,
+    period: Optional[str] = None,
+) -> int:
+    """
+    (Re)import one formatted JSON file, keeping the key order of the file.
+    Days without entries are skipped.
+    Returns:
+        int: number of imported days
+    """
+    json_path = finnhub_json_path(ticker, data_type, data_dir, period)
+    mtime = os.path.getmtime(json_path)
+    with open(json_path, "r") as f:
+        data = json.load(f)
+
+    rows = [
+        (ticker, data_type, period or "", date, seq, json.dumps(value))
+        for seq, (date, value) in enumerate(data.items())
+        if len(value) > 0
+    ]
+    with conn:
+        conn.execute(
+            "DELETE FROM finnhub_data WHERE ticker = ? AND data_type = ? AND period = ?",
+            (ticker, data_type, period or ""),
+        )
+        conn.executemany("INSERT INTO finnhub_data VALUES (?, ?, ?, ?, ?, ?)", rows)
+        conn.execute(
+            "INSERT OR REPLACE INTO finnhub_sources VALUES (?, ?, ?, ?)",
+            (ticker, data_type, period or "", mtime),
+        )
+    return len(rows)
+
+
+def import_finnhub_data(
+    data_dir: Annotated[str, "directory holding the finnhub_data folder"],
+) -> List[str]:
+    """
+    Import every formatted JSON file under finnhub_data into the store.
+    Returns:
+        list: imported files, relative to finnhub_data
+    """
+    root = os.path.join(data_dir, "finnhub_data")
+    imported = []
+    with closing(_connect(data_dir)) as conn:
+        for data_type in sorted(os.listdir(root)):
+            if not os.path.isdir(os.path.join(root, data_type)):
+                continue
+            for file_name in sorted(os.listdir(os.path.join(root, data_type))):
+                if not file_name.endswith("_data_formatted.json"):
+                    continue
+                ticker = file_name[: -len("_data_formatted.json")]
+                period = None
+                for suffix in ("_annual", "_quarterly"):
+                    if ticker.endswith(suffix):
+                        ticker, period = ticker[: -len(suffix)], suffix[1:]
+                with _import_lock:
+                    import_finnhub_file(conn, ticker, data_type, data_dir, period)
+                imported.append(os.path.join(data_type, file_name))
+    return imported
+
+
+def _ensure_imported(
+    conn: sqlite3.Connection,
+    ticker: str,
+    data_type: str,
+    data_dir: str,
+    period: Optional[str],
+) -> None:
+    """Import the JSON file of a ticker when it is newer than the stored copy."""
+    json_path = finnhub_json_path(ticker, data_type, data_dir, period)
+    key = (ticker, data_type, period or "")
+
+    def is_current():
+        stored = conn.execute(
+            "SELECT mtime FROM finnhub_sources WHERE ticker = ? AND data_type = ? AND period = ?",
+            key,
+        ).fetchone()
+        if not os.path.exists(json_path):
+            if stored is None:
+                raise FileNotFoundError(f"No finnhub {data_type} data for {ticker}")
+            return True
+        return stored is not None and stored[0] == os.path.getmtime(json_path)
+
+    if is_current():
+        return
+    with _import_lock:
+        # another thread may have imported the file while we waited
+        if not is_current():
+            import_finnhub_file(conn, ticker, data_type, data_dir, period)
+
+
+def query_range(
+    ticker: Annotated[str, "ticker symbol"],
+    start_date: Annotated[str, "Start date in YYYY-MM-DD format"],
+    end_date: Annotated[str, "End date in YYYY-MM-DD format"],
+    data_type: Annotated[str, "finnhub data type, e.g. news_data"],
+    data_dir: Annotated[str, "directory holding the finnhub_data folder"],
+    period: Annotated[Optional[str], "annual / quarterly, if any"] = None,
+) -> Dict[str, list]:
+    """
+    Read the non-empty days of a ticker between start_date and end_date (both
+    inclusive) through the (ticker, data_type, period, date) index, in the key
+    order of the source file.
+    """
+    with closing(_connect(data_dir)) as conn:
+        _ensure_imported(conn, ticker, data_type, data_dir, period)
+        rows = conn.execute(
+            "SELECT date, payload FROM finnhub_data "
+            "WHERE ticker = ? AND data_type = ? AND period = ? AND date BETWEEN ? AND ? "
+            "ORDER BY seq",
+            (ticker, data_type, period or "", start_date, end_date),
+        ).fetchall()
+    return {date: json.loads(payload) for date, payload in rows}
+
+
+if __name__ == "__main__":
+    from .config import get_config
+
+    data_dir = get_config()["data_dir"]
+    imported = import_finnhub_data(data_dir)
+    print(f"Imported {len(imported)} finnhub files into {finnhub_store_path(data_dir)}")
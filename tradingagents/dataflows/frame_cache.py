@@ -0,0 +1,75 @@
+import os
+import threading
+import pandas as pd
+from collections import OrderedDict
+from typing import Annotated, Callable, Dict
+
+# Maximum number of parsed frames kept in memory by the shared cache
+FRAME_CACHE_SIZE = 128
+
+
+class FrameCache:
+    """
+    Thread-safe, size-bounded LRU cache of DataFrames loaded from files.
+
+    Entries are keyed by file path and tagged with the file's modification time,
+    so a file rewritten on disk is reloaded on the next access. Callers receive a
+    copy of the cached frame and are free to modify it.
+    """
+
+    def __init__(self, max_entries: int = FRAME_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        path: Annotated[str, "file the frame is loaded from"],
+        loader: Annotated[Callable[[str], pd.DataFrame], "parses the file"],
+    ) -> pd.DataFrame:
+        """Return the frame stored in `path`, loading it on a miss."""
+        mtime = os.path.getmtime(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == mtime:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1].copy()
+            self.misses += 1
+
+        # parse outside the lock so loads of different files run concurrently
+        frame = loader(path)
+
+        with self._lock:
+            self._entries[path] = (mtime, frame)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return frame.copy()
+
+    def invalidate(self, path: str) -> None:
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+
+# Shared by every price and indicator reader of the process
+frame_cache = FrameCache()
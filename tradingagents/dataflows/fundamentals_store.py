@@ -0,0 +1,193 @@
+import os
+import threading
+import pandas as pd
+from collections import defaultdict
+from typing import Annotated, List, Optional
+from .frame_cache import frame_cache
+from .price_store import write_parquet_atomic
+
+# statement name -> (SimFin folder, file name template of the US-wide CSV)
+SIMFIN_STATEMENTS = {
+    "balance_sheet": ("balance_sheet", "us-balance-{freq}.csv"),
+    "cashflow": ("cash_flow", "us-cashflow-{freq}.csv"),
+    "income": ("income_statements", "us-income-{freq}.csv"),
+}
+SIMFIN_FREQS = ["annual", "quarterly"]
+
+# Serializes the (re)build of the same statement store within the process
+_build_locks = defaultdict(threading.Lock)
+_build_locks_guard = threading.Lock()
+
+
+def simfin_csv_path(statement: str, freq: str, data_dir: str) -> str:
+    """Path of the raw US-wide SimFin CSV of a statement."""
+    folder, file_name = SIMFIN_STATEMENTS[statement]
+    return os.path.join(
+        data_dir,
+        "fundamental_data",
+        "simfin_data_all",
+        folder,
+        "companies",
+        "us",
+        file_name.format(freq=freq),
+    )
+
+
+def fundamentals_store_dir(statement: str, freq: str, data_dir: str) -> str:
+    """Directory holding the per-ticker partitions of a statement."""
+    return os.path.join(data_dir, "fundamental_data", "simfin_store", statement, freq)
+
+
+def _partition_path(store_dir: str, ticker: str) -> str:
+    return os.path.join(store_dir, f"{ticker.replace(os.sep, '_')}.parquet")
+
+
+def _manifest_path(store_dir: str) -> str:
+    # written last, its mtime marks a complete build
+    return os.path.join(store_dir, "_BUILT")
+
+
+def parse_simfin_csv(csv_path: str) -> pd.DataFrame:
+    """Parse a SimFin CSV, normalizing its date columns to UTC midnight."""
+    df = pd.read_csv(csv_path, sep=";")
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+    return df
+
+
+def build_fundamentals_store(
+    statement: Annotated[str, "balance_sheet / cashflow / income"],
+    freq: Annotated[str, "annual / quarterly"],
+    data_dir: Annotated[str, "root data directory"],
+) -> List[str]:
+    """
+    Split the US-wide CSV of a statement into one Parquet file per ticker, each
+    sorted by Publish Date. The original row labels are kept.
+    Returns:
+        list: tickers written to the store
+    """
+    store_dir = fundamentals_store_dir(statement, freq, data_dir)
+    df = parse_simfin_csv(simfin_csv_path(statement, freq, data_dir))
+    df = df.sort_values("Publish Date", kind="mergesort")
+
+    tickers = []
+    for ticker, statements in df.groupby("Ticker", sort=True):
+        write_parquet_atomic(statements, _partition_path(store_dir, ticker))
+        tickers.append(ticker)
+
+    with open(_manifest_path(store_dir), "w") as f:
+        f.write("\n".join(tickers))
+    return tickers
+
+
+def _ensure_store(statement: str, freq: str, data_dir: str) -> str:
+    """Build the store of a statement when it is missing or older than its CSV."""
+    store_dir = fundamentals_store_dir(statement, freq, data_dir)
+    manifest = _manifest_path(store_dir)
+    csv_path = simfin_csv_path(statement, freq, data_dir)
+
+    def is_fresh():
+        return os.path.exists(manifest) and (
+            not os.path.exists(csv_path)
+            or os.path.getmtime(manifest) >= os.path.getmtime(csv_path)
+        )
+
+    if not is_fresh():
+        with _build_locks_guard:
+            lock = _build_locks[(statement, freq, data_dir)]
+        with lock:
+            if not is_fresh():
+                build_fundamentals_store(statement, freq, data_dir)
+    return store_dir
+
+
+def load_ticker_statements(
+    ticker: Annotated[str, "ticker symbol"],
+    statement: Annotated[str, "balance_sheet / cashflow / income"],
+    freq: Annotated[str, "annual / quarterly"],
+    data_dir: Annotated[str, "root data directory"],
+) -> pd.DataFrame:
+    """All statements of a ticker, sorted by Publish Date (empty if unknown)."""
+    store_dir = _ensure_store(statement, freq, data_dir)
+    path = _partition_path(store_dir, ticker)
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    return frame_cache.get(path, pd.read_parquet)
+
+
+def get_statements_as_of(
+    pairs: Annotated[pd.DataFrame, "frame with 'Ticker' and 'Date' columns"],
+    statement: Annotated[str, "balance_sheet / cashflow / income"],
+    freq: Annotated[str, "annual / quarterly"],
+    data_dir: Annotated[str, "root data directory"],
+) -> pd.DataFrame:
+    """
+    Batched as-of lookup: for every (Ticker, Date) pair, the latest statement of
+    the ticker published on or before Date, found with one merge-as-of pass.
+    When several statements share that Publish Date, the first one in file order
+    wins. The result is aligned with `pairs`, holds the statement columns plus
+    "Statement Row" (the row label in the SimFin CSV), and is NaN where no
+    statement was published yet.
+    """
+    partitions = [
+        load_ticker_statements(ticker, statement, freq, data_dir)
+        for ticker in pairs["Ticker"].unique()
+    ]
+    partitions = [partition for partition in partitions if not partition.empty]
+    if not partitions:
+        return pd.DataFrame({"Statement Row": float("nan")}, index=pairs.index)
+
+    statements = pd.concat(partitions)
+    statements = statements.drop_duplicates(["Ticker", "Publish Date"], keep="first")
+    statements["Statement Row"] = statements.index
+    statements = statements.sort_values("Publish Date", kind="mergesort")
+
+    left = pd.DataFrame(
+        {
+            "Ticker": pairs["Ticker"].values,
+            "As Of": pd.to_datetime(pairs["Date"].values, utc=True)
+            .normalize()
+            .astype(statements["Publish Date"].dtype),
+            "Pair": range(len(pairs)),
+        }
+    ).sort_values("As Of", kind="mergesort")
+
+    merged = pd.merge_asof(
+        left,
+        statements,
+        left_on="As Of",
+        right_on="Publish Date",
+        by="Ticker",
+        direction="backward",
+    ).sort_values("Pair")
+    merged.index = pairs.index
+    return merged[list(statements.columns)]
+
+
+def get_latest_statement(
+    ticker: Annotated[str, "ticker symbol"],
+    statement: Annotated[str, "balance_sheet / cashflow / income"],
+    freq: Annotated[str, "annual / quarterly"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    data_dir: Annotated[str, "root data directory"],
+) -> Optional[pd.Series]:
+    """
+    Latest statement of a ticker published on or before curr_date, named by its
+    row label in the SimFin CSV, or None if there is none.
+    """
+    pairs = pd.DataFrame({"Ticker": [ticker], "Date": [curr_date]})
+    latest = get_statements_as_of(pairs, statement, freq, data_dir).iloc[0]
+    if pd.isna(latest["Statement Row"]):
+        return None
+    return latest.drop("Statement Row").rename(latest["Statement Row"])
+
+
+if __name__ == "__main__":
+    from .config import get_config
+
+    data_dir = get_config()["data_dir"]
+    for statement in SIMFIN_STATEMENTS:
+        for freq in SIMFIN_FREQS:
+            if os.path.exists(simfin_csv_path(statement, freq, data_dir)):
+                tickers = build_fundamentals_store(statement, freq, data_dir)
+                print(f"Built {freq} {statement} store for {len(tickers)} tickers")
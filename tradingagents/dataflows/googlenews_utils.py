@@ -1,37 +1,67 @@
 import json
-import requests
+import math
 import os
+import re
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import time
-import random
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    retry_if_result,
-)
-
-
-def is_rate_limited(response):
-    """Check if the response indicates rate limiting (status code 429)"""
-    return response.status_code == 429
-
-
-@retry(
-    retry=(retry_if_result(is_rate_limited)),
-    wait=wait_exponential(multiplier=1, min=4, max=60),
-    stop=stop_after_attempt(5),
-)
+from . import http_client
+from .response_cache import cached_response
+
+# NewsAPI result pages requested concurrently; the vendor token bucket still
+# bounds the request rate, the pool only keeps pages in flight while others wait
+PAGE_WORKERS = 4
+GOOGLE_PAGE_SIZE = 10
+# The "Next" link of a Google result page, found without parsing the page
+GOOGLE_NEXT_LINK = re.compile(rb"""id=["']?pnnext\b""")
+# NewsAPI serves at most this many pages of 100 articles per query
+NEWSAPI_MAX_PAGES = 10
+
+_page_pool = ThreadPoolExecutor(max_workers=PAGE_WORKERS, thread_name_prefix="news")
+# HTML parsing runs here, off the threads waiting on the network
+_parse_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="news-parse")
+
+
 def make_request(url, headers):
-    """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
-    return response
+    """Fetch a Google page through the shared, rate-limited HTTP client"""
+    return http_client.get("google", url, headers=headers)
+
+
+def parse_google_page(content):
+    """
+    Parse one Google News result page.
+    Returns:
+        tuple: (results of the page, whether the page links to a next page)
+    """
+    soup = BeautifulSoup(content, "html.parser")
+    news_results = []
+    for el in soup.select("div.SoaBEf"):
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            news_results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
 
+    # Check for the "Next" link (pagination)
+    has_next = soup.find("a", id="pnnext") is not None
+    return news_results, has_next
 
+
+@cached_response("google", as_of="end_date")
 def getNewsData(query, start_date, end_date):
     """
     Scrape Google News search results for a given query and date range.
@@ -57,61 +87,42 @@ def getNewsData(query, start_date, end_date):
         )
     }
 
-    news_results = []
+    # Google does not tell how many pages there are: a page is only requested
+    # once the previous one links to it, so no request (and no token of the
+    # google rate limit) is spent past the last page. Only the parsing of the
+    # pages runs ahead, on the parse pool.
+    parsed_pages = []
     page = 0
     while True:
-        offset = page * 10
+        # a parsed page without results ends the search
+        if any(future.done() and not future.result()[0] for future in parsed_pages):
+            break
         url = (
             f"https://www.google.com/search?q={query}"
             f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
+            f"&tbm=nws&start={page * GOOGLE_PAGE_SIZE}"
         )
-
         try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
-                break
-
-            page += 1
-
+            content = make_request(url, headers).content
         except Exception as e:
             print(f"Failed after multiple retries: {e}")
             break
+        parsed_pages.append(_parse_pool.submit(parse_google_page, content))
+        if not GOOGLE_NEXT_LINK.search(content):
+            break
+        page += 1
+
+    news_results = []
+    for future in parsed_pages:
+        results_on_page, has_next = future.result()
+        news_results.extend(results_on_page)
+        if not results_on_page or not has_next:
+            break  # No more results found
 
     return news_results
 
 
+@cached_response("newsapi", as_of="end_date")
 def getNewsData_api(query, start_date, end_date):
     """
     Fetch news articles for a given query and date range using NewsAPI.
@@ -143,16 +154,25 @@ def getNewsData_api(query, start_date, end_date):
         "apiKey": api_key,
     }
 
-    news_results = []
-    page = 1
-    while True:
-        params["page"] = page
-        response = requests.get(url, params=params)
+    def fetch_page(page):
+        response = http_client.get("newsapi", url, params={**params, "page": page})
         if response.status_code != 200:
             print(f"API error: {response.status_code} - {response.text}")
-            break
-        data = response.json()
-        articles = data.get("articles", [])
+            return None
+        return response.json()
+
+    data = fetch_page(1)
+    if data is None:
+        return []
+    # The first page reveals the number of results, the others are fetched at once
+    n_pages = min(
+        math.ceil(data.get("totalResults", 0) / params["pageSize"]), NEWSAPI_MAX_PAGES
+    )
+    pages = [data] + list(_page_pool.map(fetch_page, range(2, n_pages + 1)))
+
+    news_results = []
+    for data in pages:
+        articles = data.get("articles", []) if data is not None else []
         if not articles:
             break
         for article in articles:
@@ -165,8 +185,5 @@ def getNewsData_api(query, start_date, end_date):
                     "source": article.get("source", {}).get("name"),
                 }
             )
-        if len(articles) < params["pageSize"]:
-            break  # No more pages
-        page += 1
 
     return news_results
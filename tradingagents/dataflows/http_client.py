@@ -0,0 +1,179 @@
+import time
+import random
+import threading
+import requests
+from collections import defaultdict, deque
+from email.utils import parsedate_to_datetime
+from typing import Annotated, Dict, Optional
+from requests.adapters import HTTPAdapter
+from .rate_limit import TokenBucket
+
+# vendor -> (requests per second, burst size), shared by every thread of the process
+VENDOR_RATE_LIMITS = {
+    "finnhub": (1.0, 30),  # free tier: 60 calls per minute
+    "newsapi": (1.0, 5),
+    "google": (0.25, 1),  # scraping: one page every ~4 seconds
+    "reddit": (100 / 60, 100),  # OAuth clients: 100 requests per minute
+}
+DEFAULT_RATE_LIMIT = (5.0, 10)
+
+# Connections kept alive per host and vendor
+POOL_MAXSIZE = 16
+DEFAULT_TIMEOUT = 30
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+# Latencies kept per vendor for the percentiles of the metrics
+LATENCY_WINDOW = 1000
+
+_sessions: Dict[str, requests.Session] = {}
+_buckets: Dict[str, TokenBucket] = {}
+_registry_lock = threading.Lock()
+
+
+class HttpMetrics:
+    """Thread-safe per-vendor request counters and latency percentiles."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._lock = threading.Lock()
+        self._counts = defaultdict(lambda: defaultdict(int))
+        self._latencies = defaultdict(lambda: deque(maxlen=window))
+
+    def record(self, vendor: str, latency: float, status: Optional[int]) -> None:
+        with self._lock:
+            counts = self._counts[vendor]
+            counts["requests"] += 1
+            counts["total_latency"] += latency
+            if status is None:
+                counts["failures"] += 1
+            elif status == 429:
+                counts["rate_limited"] += 1
+            elif status >= 400:
+                counts["errors"] += 1
+            self._latencies[vendor].append(latency)
+
+    def record_wait(self, vendor: str, waited: float) -> None:
+        with self._lock:
+            self._counts[vendor]["throttle_wait"] += waited
+
+    def stats(self, vendor: str) -> Dict[str, float]:
+        """Requests, failures, 429s, errors, throttling wait and latencies (s)."""
+        with self._lock:
+            counts = dict(self._counts[vendor])
+            latencies = sorted(self._latencies[vendor])
+        requests_made = counts.get("requests", 0)
+
+        def percentile(q):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+        return {
+            "requests": requests_made,
+            "failures": counts.get("failures", 0),
+            "rate_limited": counts.get("rate_limited", 0),
+            "errors": counts.get("errors", 0),
+            "throttle_wait": counts.get("throttle_wait", 0.0),
+            "mean_latency": (
+                counts.get("total_latency", 0.0) / requests_made
+                if requests_made
+                else 0.0
+            ),
+            "p50_latency": percentile(0.5),
+            "p95_latency": percentile(0.95),
+            "max_latency": latencies[-1] if latencies else 0.0,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._latencies.clear()
+
+
+http_metrics = HttpMetrics()
+
+
+def set_rate_limit(
+    vendor: Annotated[str, "vendor name, e.g. finnhub"],
+    rate: Annotated[float, "requests per second"],
+    capacity: Annotated[float, "burst size"],
+) -> None:
+    """Replace the process-wide token bucket of a vendor."""
+    with _registry_lock:
+        _buckets[vendor] = TokenBucket(rate, capacity)
+
+
+def get_rate_limiter(vendor: str) -> TokenBucket:
+    with _registry_lock:
+        bucket = _buckets.get(vendor)
+        if bucket is None:
+            bucket = TokenBucket(*VENDOR_RATE_LIMITS.get(vendor, DEFAULT_RATE_LIMIT))
+            _buckets[vendor] = bucket
+        return bucket
+
+
+def get_session(vendor: str) -> requests.Session:
+    """Process-wide keep-alive session of a vendor."""
+    with _registry_lock:
+        session = _sessions.get(vendor)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[vendor] = session
+        return session
+
+
+def _retry_delay(response: requests.Response, attempt: int, backoff_base: float):
+    """Retry-After when the server sends one, else full-jitter exponential backoff."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(float(retry_after), BACKOFF_MAX)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                return min(max(delay, 0.0), BACKOFF_MAX)
+            except (TypeError, ValueError):
+                pass
+    return random.uniform(0, min(BACKOFF_MAX, backoff_base * 2**attempt))
+
+
+def request(
+    vendor: Annotated[str, "vendor the request is rate limited and pooled as"],
+    method: Annotated[str, "HTTP method"],
+    url: Annotated[str, "request URL"],
+    max_retries: Annotated[int, "retries of 429 responses"] = MAX_RETRIES,
+    backoff_base: Annotated[float, "first backoff, in seconds"] = BACKOFF_BASE,
+    **kwargs,
+) -> requests.Response:
+    """
+    Send a request through the pooled session and token bucket of a vendor,
+    retrying 429 responses with jittered backoff. The last response is returned
+    whatever its status; connection errors are raised.
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    session = get_session(vendor)
+    bucket = get_rate_limiter(vendor)
+
+    attempt = 0
+    while True:
+        http_metrics.record_wait(vendor, bucket.acquire())
+        start = time.perf_counter()
+        try:
+            response = session.request(method, url, **kwargs)
+        except requests.RequestException:
+            http_metrics.record(vendor, time.perf_counter() - start, None)
+            raise
+        http_metrics.record(vendor, time.perf_counter() - start, response.status_code)
+
+        if response.status_code != 429 or attempt >= max_retries:
+            return response
+        time.sleep(_retry_delay(response, attempt, backoff_base))
+        attempt += 1
+
+
+def get(vendor: str, url: str, **kwargs) -> requests.Response:
+    """GET through the shared client, see request()."""
+    return request(vendor, "GET", url, **kwargs)
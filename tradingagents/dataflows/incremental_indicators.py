@@ -0,0 +1,240 @@
+import os
+import json
+import pandas as pd
+from collections import deque
+from typing import Annotated, Dict, Optional
+from .atomic_write import write_json_atomic
+from .config import get_config
+
+# Indicators the engine can advance bar by bar, named as in stockstats
+INCREMENTAL_INDICATORS = [
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "atr",
+    "mfi",
+]
+
+# Bumped whenever the layout of the checkpoint changes
+CHECKPOINT_VERSION = 1
+
+# Periods used by stockstats for the default indicator names
+MACD_SHORT, MACD_LONG, MACD_SIGNAL = 12, 26, 9
+RSI_WINDOW = 14
+ATR_WINDOW = 14
+MFI_WINDOW = 14
+
+
+class _Ewm:
+    """
+    Exponentially weighted mean matching pandas' `ewm(adjust=True).mean()`,
+    which stockstats uses for both EMA (span) and SMMA (alpha = 1 / window).
+    The adjusted mean is the ratio of two running sums, each updated in O(1).
+    """
+
+    def __init__(self, alpha: float, num: float = 0.0, den: float = 0.0):
+        self.alpha = alpha
+        self.num = num
+        self.den = den
+
+    @classmethod
+    def from_span(cls, span: int) -> "_Ewm":
+        return cls(2.0 / (span + 1.0))
+
+    @classmethod
+    def from_window(cls, window: int) -> "_Ewm":
+        return cls(1.0 / window)
+
+    def update(self, value: float) -> float:
+        decay = 1.0 - self.alpha
+        self.num = value + decay * self.num
+        self.den = 1.0 + decay * self.den
+        return self.num / self.den
+
+    def state(self) -> list:
+        return [self.alpha, self.num, self.den]
+
+
+class IncrementalIndicators:
+    """
+    Carried-over state of the INCREMENTAL_INDICATORS for one symbol.
+
+    Each call to `update` consumes the next bar and returns the indicator values
+    for that bar, numerically equivalent to stockstats run over the full history.
+    The state can be checkpointed so a daily run only advances the newest bars.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.last_date: Optional[str] = None
+        self.bars = 0
+        self.prev_close: Optional[float] = None
+        self.prev_tp: Optional[float] = None
+        self.ewm = {
+            "close_10_ema": _Ewm.from_span(10),
+            "ema_short": _Ewm.from_span(MACD_SHORT),
+            "ema_long": _Ewm.from_span(MACD_LONG),
+            "macds": _Ewm.from_span(MACD_SIGNAL),
+            "rsi_up": _Ewm.from_window(RSI_WINDOW),
+            "rsi_down": _Ewm.from_window(RSI_WINDOW),
+            "atr": _Ewm.from_window(ATR_WINDOW),
+        }
+        self.pos_flows = deque(maxlen=MFI_WINDOW)
+        self.neg_flows = deque(maxlen=MFI_WINDOW)
+        self.values: Dict[str, float] = {}
+
+    def update(
+        self,
+        date: Annotated[str, "trading date of the bar, YYYY-mm-dd"],
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> Dict[str, float]:
+        """Advance the state by one bar and return the indicator values on it."""
+        if self.last_date is not None and date <= self.last_date:
+            raise ValueError(
+                f"Bar {date} for {self.symbol} is not after the last processed bar {self.last_date}"
+            )
+
+        first_bar = self.prev_close is None
+        values = {"close_10_ema": self.ewm["close_10_ema"].update(close)}
+
+        macd = self.ewm["ema_short"].update(close) - self.ewm["ema_long"].update(close)
+        macds = self.ewm["macds"].update(macd)
+        values.update(macd=macd, macds=macds, macdh=macd - macds)
+
+        diff = 0.0 if first_bar else close - self.prev_close
+        up = self.ewm["rsi_up"].update(max(diff, 0.0))
+        down = self.ewm["rsi_down"].update(max(-diff, 0.0))
+        values["rsi"] = 50.0 if first_bar or up + down == 0 else 100 * up / (up + down)
+
+        true_range = high - low
+        if not first_bar:
+            true_range = max(
+                true_range, abs(high - self.prev_close), abs(low - self.prev_close)
+            )
+        values["atr"] = self.ewm["atr"].update(true_range)
+
+        tp = (high + low + close) / 3.0
+        tp_diff = 0.0 if first_bar else tp - self.prev_tp
+        self.pos_flows.append(tp * volume if tp_diff > 0 else 0.0)
+        self.neg_flows.append(tp * volume if tp_diff < 0 else 0.0)
+        pos_sum, neg_sum = sum(self.pos_flows), sum(self.neg_flows)
+        if self.bars < MFI_WINDOW or pos_sum + neg_sum <= 0:
+            values["mfi"] = 0.5
+        else:
+            values["mfi"] = pos_sum / (pos_sum + neg_sum)
+
+        self.last_date = date
+        self.bars += 1
+        self.prev_close = close
+        self.prev_tp = tp
+        self.values = values
+        return values
+
+    def update_frame(
+        self,
+        data: Annotated[pd.DataFrame, "price history indexed by trading date"],
+    ) -> pd.DataFrame:
+        """
+        Advance the state over the bars of `data` after the last processed one.
+        Returns:
+            pd.DataFrame: indicator values of the new bars, indexed by date
+        """
+        dates = data.index.strftime("%Y-%m-%d")
+        new = dates > self.last_date if self.last_date is not None else slice(None)
+        data, dates = data[new], dates[new]
+
+        rows = [
+            self.update(date, high, low, close, volume)
+            for date, high, low, close, volume in zip(
+                dates,
+                data["High"].to_numpy(dtype=float),
+                data["Low"].to_numpy(dtype=float),
+                data["Close"].to_numpy(dtype=float),
+                data["Volume"].to_numpy(dtype=float),
+            )
+        ]
+        return pd.DataFrame(
+            rows,
+            index=pd.DatetimeIndex(pd.to_datetime(dates), name="Date"),
+            columns=INCREMENTAL_INDICATORS,
+        )
+
+    def to_checkpoint(self) -> dict:
+        """Serialize the state to a JSON compatible dict."""
+        return {
+            "version": CHECKPOINT_VERSION,
+            "symbol": self.symbol,
+            "last_date": self.last_date,
+            "bars": self.bars,
+            "prev_close": self.prev_close,
+            "prev_tp": self.prev_tp,
+            "ewm": {name: ewm.state() for name, ewm in self.ewm.items()},
+            "pos_flows": list(self.pos_flows),
+            "neg_flows": list(self.neg_flows),
+            "values": self.values,
+        }
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: dict) -> "IncrementalIndicators":
+        """Restore the state serialized by `to_checkpoint`."""
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported indicator checkpoint version {checkpoint.get('version')}"
+            )
+        engine = cls(checkpoint["symbol"])
+        engine.last_date = checkpoint["last_date"]
+        engine.bars = checkpoint["bars"]
+        engine.prev_close = checkpoint["prev_close"]
+        engine.prev_tp = checkpoint["prev_tp"]
+        engine.ewm = {name: _Ewm(*state) for name, state in checkpoint["ewm"].items()}
+        engine.pos_flows.extend(checkpoint["pos_flows"])
+        engine.neg_flows.extend(checkpoint["neg_flows"])
+        engine.values = checkpoint["values"]
+        return engine
+
+
+def checkpoint_path(symbol: str, checkpoint_dir: str) -> str:
+    """Path of the incremental indicator checkpoint of a symbol."""
+    return os.path.join(checkpoint_dir, f"{symbol}-indicator-state.json")
+
+
+def save_checkpoint(engine: IncrementalIndicators, checkpoint_dir: str) -> str:
+    path = checkpoint_path(engine.symbol, checkpoint_dir)
+    write_json_atomic(engine.to_checkpoint(), path)
+    return path
+
+
+def load_checkpoint(symbol: str, checkpoint_dir: str) -> IncrementalIndicators:
+    """Load a symbol's checkpoint, or a fresh state when none is stored."""
+    path = checkpoint_path(symbol, checkpoint_dir)
+    if not os.path.exists(path):
+        return IncrementalIndicators(symbol)
+    with open(path) as f:
+        return IncrementalIndicators.from_checkpoint(json.load(f))
+
+
+def update_indicators(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    data: Annotated[pd.DataFrame, "price history indexed by trading date"],
+    checkpoint_dir: Annotated[
+        Optional[str], "directory of the checkpoints, defaults to data_cache_dir"
+    ] = None,
+) -> pd.DataFrame:
+    """
+    Advance a symbol's checkpointed indicator state over the bars of `data` that
+    it has not seen yet and persist the new state. `data` may hold the full
+    history, only the bars after the checkpoint are processed.
+    Returns:
+        pd.DataFrame: indicator values of the newly processed bars
+    """
+    checkpoint_dir = checkpoint_dir or get_config()["data_cache_dir"]
+    engine = load_checkpoint(symbol, checkpoint_dir)
+    new_values = engine.update_frame(data)
+    if not new_values.empty:
+        save_checkpoint(engine, checkpoint_dir)
+    return new_values
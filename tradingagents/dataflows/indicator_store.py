@@ -0,0 +1,158 @@
+import os
+import pandas as pd
+from stockstats import wrap
+from typing import Annotated, List
+from .config import get_config
+from .frame_cache import frame_cache
+from .price_store import (
+    load_online_price_data,
+    load_price_data,
+    online_cache_path,
+    price_csv_path,
+    price_parquet_path,
+    write_parquet_atomic,
+    PRICE_FILE_STEM,
+)
+
+# Indicators the market analyst can request, see best_ind_params in interface.py
+SUPPORTED_INDICATORS = [
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+]
+
+
+def indicator_matrix_path(symbol: str, store_dir: str) -> str:
+    """Path of the persisted (date x indicator) matrix of a symbol."""
+    return os.path.join(store_dir, f"{symbol}-indicators.parquet")
+
+
+def compute_indicator_matrix(
+    data: Annotated[pd.DataFrame, "price history indexed by trading date"],
+) -> pd.DataFrame:
+    """
+    Compute every supported indicator in one pass over the price history.
+    Indicators sharing intermediate series (e.g. the MACD family) reuse the
+    columns stockstats has already computed.
+    """
+    stock_df = wrap(data.copy())
+    return pd.DataFrame(
+        {indicator: stock_df[indicator].values for indicator in SUPPORTED_INDICATORS},
+        index=data.index,
+    )
+
+
+def _source_paths(symbol: str, data_dir: str, online: bool) -> List[str]:
+    if online:
+        return [online_cache_path(symbol, get_config()["data_cache_dir"])]
+    return [price_csv_path(symbol, data_dir), price_parquet_path(symbol, data_dir)]
+
+
+def _store_dir(data_dir: str, online: bool) -> str:
+    return get_config()["data_cache_dir"] if online else data_dir
+
+
+def build_indicator_matrix(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    data_dir: Annotated[str, "directory where the offline price files are stored"],
+    online: Annotated[bool, "whether to use the online price cache"] = False,
+) -> pd.DataFrame:
+    """Compute and persist the indicator matrix of a symbol."""
+    if online:
+        data = load_online_price_data(symbol, get_config()["data_cache_dir"])
+    else:
+        data = load_price_data(symbol, data_dir)
+
+    matrix = compute_indicator_matrix(data)
+    write_parquet_atomic(
+        matrix, indicator_matrix_path(symbol, _store_dir(data_dir, online))
+    )
+    return matrix
+
+
+def build_all_indicator_matrices(
+    data_dir: Annotated[str, "directory where the offline price files are stored"],
+) -> List[str]:
+    """
+    Batch job building the indicator matrix of every offline price file.
+    Returns:
+        list: symbols whose matrix was built
+    """
+    symbols = set()
+    for file_name in os.listdir(data_dir):
+        for extension in (".csv", ".parquet"):
+            suffix = PRICE_FILE_STEM.format(symbol="") + extension
+            if file_name.endswith(suffix):
+                symbols.add(file_name[: -len(suffix)])
+
+    for symbol in sorted(symbols):
+        build_indicator_matrix(symbol, data_dir)
+    return sorted(symbols)
+
+
+def load_indicator_matrix(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    data_dir: Annotated[str, "directory where the offline price files are stored"],
+    online: Annotated[bool, "whether to use the online price cache"] = False,
+) -> pd.DataFrame:
+    """
+    Load the indicator matrix of a symbol, rebuilding it when the underlying
+    price data is newer than the persisted matrix.
+    """
+    if online:
+        # brings the online price cache up to date before comparing timestamps
+        load_online_price_data(symbol, get_config()["data_cache_dir"])
+
+    matrix_path = indicator_matrix_path(symbol, _store_dir(data_dir, online))
+    source_mtimes = [
+        os.path.getmtime(path)
+        for path in _source_paths(symbol, data_dir, online)
+        if os.path.exists(path)
+    ]
+    if (
+        source_mtimes
+        and os.path.exists(matrix_path)
+        and os.path.getmtime(matrix_path) >= max(source_mtimes)
+    ):
+        return frame_cache.get(matrix_path, pd.read_parquet)
+
+    return build_indicator_matrix(symbol, data_dir, online)
+
+
+def get_indicator_window(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicator: Annotated[str, "one of SUPPORTED_INDICATORS"],
+    start_date: Annotated[str, "start date of the window, YYYY-mm-dd"],
+    end_date: Annotated[str, "end date of the window, YYYY-mm-dd"],
+    data_dir: Annotated[str, "directory where the offline price files are stored"],
+    online: Annotated[bool, "whether to use the online price cache"] = False,
+) -> pd.Series:
+    """
+    Look up an indicator on the trading days between start_date and end_date
+    (inclusive), indexed by YYYY-mm-dd date strings in ascending order.
+    """
+    if indicator not in SUPPORTED_INDICATORS:
+        raise ValueError(
+            f"Indicator {indicator} is not precomputed. Please choose from: {SUPPORTED_INDICATORS}"
+        )
+
+    values = load_indicator_matrix(symbol, data_dir, online)[indicator]
+    values = values.loc[start_date:end_date]
+    values.index = values.index.strftime("%Y-%m-%d").rename("Date")
+    return values
+
+
+if __name__ == "__main__":
+    price_dir = os.path.join(get_config()["data_dir"], "market_data", "price_data")
+    built = build_all_indicator_matrices(price_dir)
+    print(f"Built indicator matrices for {len(built)} symbols in {price_dir}: {built}")
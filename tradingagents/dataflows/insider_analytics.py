@@ -0,0 +1,97 @@
+import pandas as pd
+from typing import Annotated, Dict, List, Sequence
+
+# Fields identifying one reported insider transaction, shared by its duplicates
+TRANSACTION_KEY = (
+    "id",
+    "name",
+    "filingDate",
+    "transactionDate",
+    "transactionCode",
+    "change",
+    "share",
+    "transactionPrice",
+    "isDerivative",
+)
+# Fields identifying one monthly insider sentiment record
+SENTIMENT_KEY = ("symbol", "year", "month", "change", "mspr")
+
+AGGREGATE_COLUMNS = [
+    "transactions",
+    "buys",
+    "sells",
+    "net_shares",
+    "net_value",
+    "last_transaction",
+]
+
+
+def dedupe_entries(
+    data: Annotated[Dict[str, list], "finnhub entries per day"],
+    key_fields: Annotated[Sequence[str], "fields forming the identity of an entry"],
+) -> List[dict]:
+    """
+    Flatten the entries of every day and keep the first occurrence of each key,
+    in a single pass with a hash set.
+    """
+    seen = set()
+    entries = []
+    for day_entries in data.values():
+        for entry in day_entries:
+            key = tuple(repr(entry.get(field)) for field in key_fields)
+            if key not in seen:
+                seen.add(key)
+                entries.append(entry)
+    return entries
+
+
+def transactions_frame(entries: List[dict]) -> pd.DataFrame:
+    """Typed frame of insider transactions, one row per deduplicated entry."""
+    df = pd.DataFrame(entries, columns=list(TRANSACTION_KEY))
+    df["change"] = pd.to_numeric(df["change"], errors="coerce").fillna(0)
+    df["transactionPrice"] = pd.to_numeric(
+        df["transactionPrice"], errors="coerce"
+    ).fillna(0.0)
+    df["transactionDate"] = pd.to_datetime(
+        df["transactionDate"].fillna(df["filingDate"]), errors="coerce"
+    )
+    return df
+
+
+def _aggregate(df: pd.DataFrame, by) -> pd.DataFrame:
+    grouped = df.assign(
+        buy=df["change"] > 0,
+        sell=df["change"] < 0,
+        value=df["change"] * df["transactionPrice"],
+    ).groupby(by, sort=True)
+    summary = pd.DataFrame(
+        {
+            "transactions": grouped.size(),
+            "buys": grouped["buy"].sum(),
+            "sells": grouped["sell"].sum(),
+            "net_shares": grouped["change"].sum(),
+            "net_value": grouped["value"].sum().round(2),
+            "last_transaction": grouped["transactionDate"]
+            .max()
+            .dt.strftime("%Y-%m-%d"),
+        }
+    )
+    return summary[AGGREGATE_COLUMNS]
+
+
+def summarize_insider_transactions(
+    entries: Annotated[List[dict], "deduplicated finnhub insider transactions"],
+) -> Dict[str, pd.DataFrame]:
+    """
+    Per-insider and per-month aggregates of insider transactions: number of
+    transactions, buys and sells (by the sign of the share change), net shares
+    and net notional value (change x transaction price).
+    """
+    df = transactions_frame(entries)
+    by_insider = _aggregate(df, "name").sort_values(
+        "net_value", key=lambda value: value.abs(), ascending=False
+    )
+    by_month = _aggregate(
+        df, df["transactionDate"].dt.strftime("%Y-%m").rename("month")
+    )
+    return {"by_insider": by_insider, "by_month": by_month}
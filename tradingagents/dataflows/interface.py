@@ -1,11 +1,28 @@
 from typing import Annotated, Dict
-from .reddit_utils import fetch_top_from_category, fetch_top_from_category_online
+from .reddit_utils import (
+    fetch_top_from_category_window,
+    fetch_top_from_category_online_window,
+)
 from .yfin_utils import *
 from .stockstats_utils import *
 from .googlenews_utils import *
 from .finnhub_utils import get_data_in_range
+from . import http_client
+from .response_cache import cached_response
+from .news_dedup import collapse_near_duplicates, story_suffix
+from .price_store import load_price_data, slice_price_data, PRICE_DATA_END
+from .indicator_store import get_indicator_window, SUPPORTED_INDICATORS
+from .trading_calendar import get_exchange_calendar
+from .insider_analytics import (
+    dedupe_entries,
+    summarize_insider_transactions,
+    SENTIMENT_KEY,
+    TRANSACTION_KEY,
+)
+from .fundamentals_store import get_latest_statement, get_statements_as_of
 from dateutil.relativedelta import relativedelta
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 import json
 import os
@@ -16,6 +33,11 @@ from openai import OpenAI
 from .config import get_config, set_config, DATA_DIR
 
 
+def _news_text(*fields):
+    """Text of a news item fingerprinted by the near-duplicate collapsing."""
+    return lambda item: " ".join(str(item.get(field) or "") for field in fields)
+
+
 def get_finnhub_news(
     ticker: Annotated[
         str,
@@ -54,19 +76,29 @@ def get_finnhub_news(
     if len(result) == 0:
         return ""
 
+    # syndicated copies of a story are shown once
+    entries = [dict(entry, day=day) for day, data in result.items() for entry in data]
+    stories = collapse_near_duplicates(
+        entries, _news_text("headline", "summary"), lambda entry: entry.get("source")
+    )
+
     combined_result = ""
-    for day, data in result.items():
-        if len(data) == 0:
-            continue
-        for entry in data:
-            current_news = (
-                "### " + entry["headline"] + f" ({day})" + "\n" + entry["summary"]
-            )
-            combined_result += current_news + "\n\n"
+    for story in stories:
+        entry = story["item"]
+        current_news = (
+            "### "
+            + entry["headline"]
+            + f" ({entry['day']})"
+            + story_suffix(story)
+            + "\n"
+            + entry["summary"]
+        )
+        combined_result += current_news + "\n\n"
 
     return f"## {ticker} News, from {before} to {curr_date}:\n" + str(combined_result)
 
 
+@cached_response("finnhub", as_of="curr_date")
 def get_finnhub_news_online(
     ticker: str,
     curr_date: str,
@@ -107,7 +139,7 @@ def get_finnhub_news_online(
         f"?symbol={ticker.upper()}&from={start_date_str}&to={end_date_str}&token={api_key}"
     )
 
-    response = requests.get(url)
+    response = http_client.get("finnhub", url)
     if response.status_code != 200:
         raise RuntimeError(
             f"Finnhub API error: {response.status_code} - {response.text}"
@@ -117,8 +149,15 @@ def get_finnhub_news_online(
     if not news_data or not isinstance(news_data, list):
         return ""
 
+    stories = collapse_near_duplicates(
+        news_data,
+        _news_text("headline", "summary"),
+        lambda entry: entry.get("source"),
+    )
+
     combined_result = ""
-    for entry in news_data:
+    for story in stories:
+        entry = story["item"]
         headline = entry.get("headline", "")
         summary = entry.get("summary", "")
         datetime_str = (
@@ -128,7 +167,9 @@ def get_finnhub_news_online(
         )
         if not headline:
             continue
-        current_news = f"### {headline} ({datetime_str})\n{summary}"
+        current_news = (
+            f"### {headline} ({datetime_str}){story_suffix(story)}\n{summary}"
+        )
         combined_result += current_news + "\n\n"
 
     if not combined_result:
@@ -169,12 +210,8 @@ def get_finnhub_company_insider_sentiment(
         return ""
 
     result_str = ""
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
-                seen_dicts.append(entry)
+    for entry in dedupe_entries(data, SENTIMENT_KEY):
+        result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
 
     return (
         f"## {ticker} Insider Sentiment Data for {before} to {curr_date}:\n"
@@ -212,19 +249,16 @@ def get_finnhub_company_insider_transactions(
     if len(data) == 0:
         return ""
 
-    result_str = ""
-
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
-                seen_dicts.append(entry)
+    # one hash-set pass over the filings, then aggregate instead of listing every transaction
+    summary = summarize_insider_transactions(dedupe_entries(data, TRANSACTION_KEY))
 
     return (
-        f"## {ticker} insider transactions from {before} to {curr_date}:\n"
-        + result_str
-        + "The change field reflects the variation in share count—here a negative number indicates a reduction in holdings—while share specifies the total number of shares involved. The transactionPrice denotes the per-share price at which the trade was executed, and transactionDate marks when the transaction occurred. The name field identifies the insider making the trade, and transactionCode (e.g., S for sale) clarifies the nature of the transaction. FilingDate records when the transaction was officially reported, and the unique id links to the specific SEC filing, as indicated by the source. Additionally, the symbol ties the transaction to a particular company, isDerivative flags whether the trade involves derivative securities, and currency notes the currency context of the transaction."
+        f"## {ticker} insider transactions from {before} to {curr_date}:\n\n"
+        + "### By insider:\n"
+        + summary["by_insider"].to_string()
+        + "\n\n### By month:\n"
+        + summary["by_month"].to_string()
+        + "\n\nEach row aggregates the reported transactions of an insider or of a calendar month (by transaction date). transactions counts the deduplicated transactions, buys and sells count the transactions that increased or reduced holdings, net_shares is the net change in share count (negative means net selling) and net_value is the net notional value in the filing currency (share change times transaction price, so awards and gifts reported at a zero price add shares but no value). last_transaction is the date of the latest transaction in the group."
     )
 
 
@@ -240,35 +274,16 @@ def get_simfin_balance_sheet(
     if not isinstance(ticker, str) or not ticker.strip():
         raise ValueError("Error: 'ticker' must be a non-empty string.")
 
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "balance_sheet",
-        "companies",
-        "us",
-        f"us-balance-{freq}.csv",
+    # as-of lookup in the per-ticker store sorted by Publish Date
+    latest_balance_sheet = get_latest_statement(
+        ticker, "balance_sheet", freq, curr_date, DATA_DIR
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_balance_sheet is None:
         print("No balance sheet available before the given current date.")
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
 
@@ -291,35 +306,16 @@ def get_simfin_cashflow(
     if not isinstance(ticker, str) or not ticker.strip():
         raise ValueError("Error: 'ticker' must be a non-empty string.")
 
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "cash_flow",
-        "companies",
-        "us",
-        f"us-cashflow-{freq}.csv",
+    # as-of lookup in the per-ticker store sorted by Publish Date
+    latest_cash_flow = get_latest_statement(
+        ticker, "cashflow", freq, curr_date, DATA_DIR
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_cash_flow is None:
         print("No cash flow statement available before the given current date.")
         return ""
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_cash_flow = latest_cash_flow.drop("SimFinId")
 
@@ -342,35 +338,14 @@ def get_simfin_income_statements(
     if not isinstance(ticker, str) or not ticker.strip():
         raise ValueError("Error: 'ticker' must be a non-empty string.")
 
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "income_statements",
-        "companies",
-        "us",
-        f"us-income-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    # as-of lookup in the per-ticker store sorted by Publish Date
+    latest_income = get_latest_statement(ticker, "income", freq, curr_date, DATA_DIR)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_income is None:
         print("No income statement available before the given current date.")
         return ""
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_income = latest_income.drop("SimFinId")
 
@@ -381,6 +356,36 @@ def get_simfin_income_statements(
     )
 
 
+def get_simfin_statements_batch(
+    pairs: Annotated[
+        pd.DataFrame, "frame with 'ticker' and 'date' (yyyy-mm-dd) columns"
+    ],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+) -> Dict[str, pd.DataFrame]:
+    """
+    Retrieve the latest balance sheet, cash flow statement and income statement
+    published on or before each (ticker, date) pair, e.g. for every trade date of
+    a backtest, with one merge-as-of pass per statement type.
+
+    Returns
+        dict: "balance_sheet", "cashflow" and "income" frames aligned with `pairs`,
+        NaN where no statement was published yet
+    """
+    if not {"ticker", "date"}.issubset(pairs.columns):
+        raise ValueError("Error: 'pairs' must have 'ticker' and 'date' columns.")
+
+    pairs = pairs.rename(columns={"ticker": "Ticker", "date": "Date"})
+    return {
+        statement: get_statements_as_of(pairs, statement, freq, DATA_DIR).drop(
+            columns=["Statement Row", "SimFinId"], errors="ignore"
+        )
+        for statement in ("balance_sheet", "cashflow", "income")
+    }
+
+
 def get_google_news(
     query: Annotated[str, "Query to search with"],
     curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
@@ -399,9 +404,14 @@ def get_google_news(
 
     news_str = ""
 
-    for news in news_results:
+    stories = collapse_near_duplicates(
+        news_results, _news_text("title", "snippet"), lambda news: news.get("source")
+    )
+    for story in stories:
+        news = story["item"]
         news_str += (
-            f"### {news['title']} (source: {news['source']}) \n\n{news['snippet']}\n\n"
+            f"### {news['title']} (source: {news['source']}){story_suffix(story)} "
+            f"\n\n{news['snippet']}\n\n"
         )
 
     if len(news_results) == 0:
@@ -433,25 +443,35 @@ def get_reddit_global_news(
     # iterate from start_date to end_date
     curr_date = datetime.strptime(before, "%Y-%m-%d")
 
+    if online:
+        # one listing per subreddit for the whole window, bucketed by day
+        online_posts = fetch_top_from_category_online_window(
+            "global_news",
+            before,
+            start_date.strftime("%Y-%m-%d"),
+            max_limit_per_day,
+            subreddit_map={"global_news": ["worldnews"]},
+        )
+    else:
+        # one scan of the subreddit files for the whole window
+        offline_posts = fetch_top_from_category_window(
+            "global_news",
+            before,
+            start_date.strftime("%Y-%m-%d"),
+            max_limit_per_day,
+            [None],
+            data_path=os.path.join(DATA_DIR, "reddit_data"),
+        )
+
     total_iterations = (start_date - curr_date).days + 1
     pbar = tqdm(desc=f"Getting Global News on {start_date}", total=total_iterations)
 
     while curr_date <= start_date:
         curr_date_str = curr_date.strftime("%Y-%m-%d")
         if not online:
-            fetch_result = fetch_top_from_category(
-                "global_news",
-                curr_date_str,
-                max_limit_per_day,
-                data_path=os.path.join(DATA_DIR, "reddit_data"),
-            )
+            fetch_result = offline_posts[(None, curr_date_str)]
         else:
-            fetch_result = fetch_top_from_category_online(
-                "global_news",
-                curr_date_str,
-                max_limit_per_day,
-                subreddit_map={"global_news": ["worldnews"]},
-            )
+            fetch_result = online_posts[curr_date_str]
         posts.extend(fetch_result)
         curr_date += relativedelta(days=1)
         pbar.update(1)
@@ -462,11 +482,12 @@ def get_reddit_global_news(
         return ""
 
     news_str = ""
-    for post in posts:
+    for story in collapse_near_duplicates(posts, _news_text("title", "content")):
+        post, suffix = story["item"], story_suffix(story)
         if post["content"] == "":
-            news_str += f"### {post['title']}\n\n"
+            news_str += f"### {post['title']}{suffix}\n\n"
         else:
-            news_str += f"### {post['title']}\n\n{post['content']}\n\n"
+            news_str += f"### {post['title']}{suffix}\n\n{post['content']}\n\n"
 
     return f"## Global News Reddit, from {before} to {curr_date}:\n{news_str}"
 
@@ -499,6 +520,27 @@ def get_reddit_company_news(
     # iterate from start_date to end_date
     curr_date = datetime.strptime(before, "%Y-%m-%d")
 
+    if online:
+        # one listing per subreddit for the whole window, bucketed by day
+        online_posts = fetch_top_from_category_online_window(
+            "company_news",
+            before,
+            start_date.strftime("%Y-%m-%d"),
+            max_limit_per_day,
+            ticker,
+            subreddit_map={"company_news": ["stocks"]},
+        )
+    else:
+        # one scan of the subreddit files for the whole window
+        offline_posts = fetch_top_from_category_window(
+            "company_news",
+            before,
+            start_date.strftime("%Y-%m-%d"),
+            max_limit_per_day,
+            [ticker],
+            data_path=os.path.join(DATA_DIR, "reddit_data"),
+        )
+
     total_iterations = (start_date - curr_date).days + 1
     pbar = tqdm(
         desc=f"Getting Company News for {ticker} on {start_date}",
@@ -508,21 +550,9 @@ def get_reddit_company_news(
     while curr_date <= start_date:
         curr_date_str = curr_date.strftime("%Y-%m-%d")
         if not online:
-            fetch_result = fetch_top_from_category(
-                "company_news",
-                curr_date_str,
-                max_limit_per_day,
-                ticker,
-                data_path=os.path.join(DATA_DIR, "reddit_data"),
-            )
+            fetch_result = offline_posts[(ticker, curr_date_str)]
         else:
-            fetch_result = fetch_top_from_category_online(
-                "company_news",
-                curr_date_str,
-                max_limit_per_day,
-                ticker,
-                subreddit_map={"company_news": ["stocks"]},
-            )
+            fetch_result = online_posts[curr_date_str]
         posts.extend(fetch_result)
         curr_date += relativedelta(days=1)
 
@@ -534,11 +564,12 @@ def get_reddit_company_news(
         return ""
 
     news_str = ""
-    for post in posts:
+    for story in collapse_near_duplicates(posts, _news_text("title", "content")):
+        post, suffix = story["item"], story_suffix(story)
         if post["content"] == "":
-            news_str += f"### {post['title']}\n\n"
+            news_str += f"### {post['title']}{suffix}\n\n"
         else:
-            news_str += f"### {post['title']}\n\n{post['content']}\n\n"
+            news_str += f"### {post['title']}{suffix}\n\n{post['content']}\n\n"
 
     return f"##{ticker} News Reddit, from {before} to {curr_date}:\n\n{news_str}"
 
@@ -635,39 +666,26 @@ def get_stock_stats_indicators_window(
     curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date - relativedelta(days=look_back_days)
 
-    if not online:
-        # read from YFin data
-        data = pd.read_csv(
-            os.path.join(
-                DATA_DIR,
-                f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
+    # look the window up in the precomputed indicator matrix, only trading dates are kept
+    indicator_values = pd.Series(dtype=float)
+    if get_exchange_calendar().trading_days_between(before, end_date):
+        try:
+            indicator_values = get_indicator_window(
+                symbol,
+                indicator,
+                before.strftime("%Y-%m-%d"),
+                end_date,
+                os.path.join(DATA_DIR, "market_data", "price_data"),
+                online=online,
             )
-        )
-        data["Date"] = pd.to_datetime(data["Date"], utc=True)
-        dates_in_df = data["Date"].astype(str).str[:10]
-
-        ind_string = ""
-        while curr_date >= before:
-            # only do the trading dates
-            if curr_date.strftime("%Y-%m-%d") in dates_in_df.values:
-                indicator_value = get_stockstats_indicator(
-                    symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-                )
-
-                ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
-
-            curr_date = curr_date - relativedelta(days=1)
-    else:
-        # online gathering
-        ind_string = ""
-        while curr_date >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
+        except Exception as e:
+            print(
+                f"Error getting stockstats indicator data for indicator {indicator} from {before.strftime('%Y-%m-%d')} to {end_date}: {e}"
             )
 
-            ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
-
-            curr_date = curr_date - relativedelta(days=1)
+    ind_string = ""
+    for date, indicator_value in reversed(list(indicator_values.items())):
+        ind_string += f"{date}: {indicator_value}\n"
 
     result_str = (
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
@@ -691,14 +709,33 @@ def get_stockstats_indicator(
     curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
     curr_date = curr_date.strftime("%Y-%m-%d")
 
+    # no need to load the price history on weekends and exchange holidays
+    if not get_exchange_calendar().is_trading_day(curr_date):
+        return "N/A: Not a trading day (weekend or holiday)"
+
     try:
-        indicator_value = StockstatsUtils.get_stock_stats(
-            symbol,
-            indicator,
-            curr_date,
-            os.path.join(DATA_DIR, "market_data", "price_data"),
-            online=online,
-        )
+        if indicator in SUPPORTED_INDICATORS:
+            indicator_values = get_indicator_window(
+                symbol,
+                indicator,
+                curr_date,
+                curr_date,
+                os.path.join(DATA_DIR, "market_data", "price_data"),
+                online=online,
+            )
+            indicator_value = (
+                indicator_values.iloc[0]
+                if not indicator_values.empty
+                else "N/A: Not a trading day (weekend or holiday)"
+            )
+        else:
+            indicator_value = StockstatsUtils.get_stock_stats(
+                symbol,
+                indicator,
+                curr_date,
+                os.path.join(DATA_DIR, "market_data", "price_data"),
+                online=online,
+            )
     except Exception as e:
         print(
             f"Error getting stockstats indicator data for indicator {indicator} on {curr_date}: {e}"
@@ -719,23 +756,10 @@ def get_YFin_data_window(
     start_date = before.strftime("%Y-%m-%d")
 
     # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
+    data = load_price_data(symbol, os.path.join(DATA_DIR, "market_data", "price_data"))
 
     # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    filtered_data = slice_price_data(data, start_date, curr_date)
 
     # Set pandas display options to show the full DataFrame
     with pd.option_context(
@@ -749,6 +773,11 @@ def get_YFin_data_window(
     )
 
 
+@cached_response(
+    "yfinance",
+    as_of="end_date",
+    should_cache=lambda result: not result.startswith("No data found"),
+)
 def get_YFin_data_online(
     symbol: Annotated[str, "ticker symbol of the company"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -823,29 +852,16 @@ def get_YFin_data(
             f"Error: start_date {start_date} is after end_date {end_date}."
         )
 
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
-    if end_date > "2025-03-25":
+    if end_date > PRICE_DATA_END:
         raise Exception(
-            f"Get_YFin_Data: {end_date} is outside of the data range of 2015-01-01 to 2025-03-25"
+            f"Get_YFin_Data: {end_date} is outside of the data range of 2015-01-01 to {PRICE_DATA_END}"
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
+    # read in data
+    data = load_price_data(symbol, os.path.join(DATA_DIR, "market_data", "price_data"))
 
     # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    filtered_data = slice_price_data(data, start_date, end_date)
 
     # remove the index from the dataframe
     filtered_data = filtered_data.reset_index(drop=True)
@@ -853,13 +869,20 @@ def get_YFin_data(
     return filtered_data
 
 
+@lru_cache(maxsize=None)
+def get_openai_client() -> OpenAI:
+    """Process-wide OpenAI client, its connection pool is shared by all calls."""
+    return OpenAI()
+
+
+@cached_response("openai", as_of="curr_date")
 def get_stock_news_openai(ticker, curr_date):
 
     # Validate ticker
     if not isinstance(ticker, str) or not ticker.strip():
         raise ValueError("Error: 'ticker' must be a non-empty string.")
 
-    client = OpenAI()
+    client = get_openai_client()
 
     response = client.responses.create(
         model="gpt-4.1-mini",
@@ -892,8 +915,9 @@ def get_stock_news_openai(ticker, curr_date):
     return response.output[1].content[0].text
 
 
+@cached_response("openai", as_of="curr_date")
 def get_global_news_openai(curr_date):
-    client = OpenAI()
+    client = get_openai_client()
 
     response = client.responses.create(
         model="gpt-4.1-mini",
@@ -926,13 +950,14 @@ def get_global_news_openai(curr_date):
     return response.output[1].content[0].text
 
 
+@cached_response("openai", as_of="curr_date")
 def get_fundamentals_openai(ticker, curr_date):
 
     # Validate ticker
     if not isinstance(ticker, str) or not ticker.strip():
         raise ValueError("Error: 'ticker' must be a non-empty string.")
 
-    client = OpenAI()
+    client = get_openai_client()
 
     response = client.responses.create(
         model="gpt-4.1-mini",
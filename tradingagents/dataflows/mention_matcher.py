@@ -0,0 +1,130 @@
+import os
+import re
+import json
+import hashlib
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Annotated, Dict, List, Set
+from .reddit_index import INDEX_DIR_NAME, build_lock, read_index, write_index
+
+
+class MentionMatcher:
+    """
+    Finds which tickers a text mentions. Every alias of every ticker is escaped
+    and compiled once into a single case-insensitive alternation, bounded so
+    that aliases only match whole words (e.g. "Intel" does not match "Intelligence").
+    """
+
+    def __init__(
+        self, aliases: Annotated[Dict[str, List[str]], "ticker -> names it goes by"]
+    ):
+        self.aliases = {
+            ticker: sorted({alias.strip() for alias in names if alias.strip()})
+            for ticker, names in aliases.items()
+        }
+        self._tickers_by_alias = defaultdict(set)
+        for ticker, names in self.aliases.items():
+            for alias in names:
+                self._tickers_by_alias[alias.lower()].add(ticker)
+
+        # longest aliases first, so "Johnson & Johnson" wins over "Johnson"
+        alternation = "|".join(
+            re.escape(alias)
+            for alias in sorted(self._tickers_by_alias, key=len, reverse=True)
+        )
+        self._pattern = re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+        self.signature = hashlib.sha1(
+            json.dumps(self.aliases, sort_keys=True).encode()
+        ).hexdigest()
+
+    @property
+    def tickers(self) -> Set[str]:
+        return set(self.aliases)
+
+    def mentions(self, *texts: str) -> Set[str]:
+        """Tickers mentioned in any of the texts, in one scan of each text."""
+        tickers = set()
+        for text in texts:
+            for match in self._pattern.finditer(text or ""):
+                tickers |= self._tickers_by_alias[match.group(0).lower()]
+        return tickers
+
+    def mentions_post(self, post: dict) -> Set[str]:
+        return self.mentions(post.get("title", ""), post.get("selftext", ""))
+
+
+# Parsed mention indexes, keyed by JSONL path and checked against its signature
+_loaded_mention_indexes: Dict[str, dict] = {}
+_loaded_mention_indexes_lock = threading.Lock()
+
+
+def mention_index_path(data_path: str, category: str, data_file: str) -> str:
+    """Path of the ticker -> posts inverted index of a subreddit JSONL file."""
+    return os.path.join(
+        data_path, INDEX_DIR_NAME, category, data_file + ".mentions.json"
+    )
+
+
+def _signature(jsonl_path: str, matcher: MentionMatcher) -> list:
+    stat = os.stat(jsonl_path)
+    return [stat.st_size, stat.st_mtime, matcher.signature]
+
+
+def build_mention_index(jsonl_path: str, matcher: MentionMatcher) -> dict:
+    """
+    Tag every post of a subreddit file with the tickers it mentions and invert
+    the tags into {day: {ticker: [position of the post within the day]}}, where
+    positions follow the file order used by the day-offset index.
+    """
+    days = defaultdict(lambda: defaultdict(list))
+    posts_per_day = defaultdict(int)
+    with open(jsonl_path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            post = json.loads(line)
+            day = datetime.utcfromtimestamp(post["created_utc"]).strftime("%Y-%m-%d")
+            for ticker in matcher.mentions_post(post):
+                days[day][ticker].append(posts_per_day[day])
+            posts_per_day[day] += 1
+    return {
+        "signature": _signature(jsonl_path, matcher),
+        "days": {day: dict(tickers) for day, tickers in days.items()},
+    }
+
+
+def load_mention_index(
+    data_path: Annotated[str, "path to the reddit_data folder"],
+    category: Annotated[str, "category folder of the subreddit file"],
+    data_file: Annotated[str, "name of the subreddit JSONL file"],
+    matcher: Annotated[MentionMatcher, "matcher the index is built with"],
+) -> dict:
+    """
+    Load the inverted mention index of a subreddit file, building (and
+    persisting) it when it is missing, the file changed or the aliases changed.
+    """
+    jsonl_path = os.path.join(data_path, category, data_file)
+    signature = _signature(jsonl_path, matcher)
+
+    with _loaded_mention_indexes_lock:
+        index = _loaded_mention_indexes.get(jsonl_path)
+    if index is not None and index["signature"] == signature:
+        return index
+
+    path = mention_index_path(data_path, category, data_file)
+    with build_lock(path):
+        # another thread may have loaded or built it while we waited
+        with _loaded_mention_indexes_lock:
+            index = _loaded_mention_indexes.get(jsonl_path)
+        if index is not None and index["signature"] == signature:
+            return index
+
+        index = read_index(path)
+        if index is None or index["signature"] != signature:
+            index = build_mention_index(jsonl_path, matcher)
+            write_index(index, path)
+
+        with _loaded_mention_indexes_lock:
+            _loaded_mention_indexes[jsonl_path] = index
+        return index
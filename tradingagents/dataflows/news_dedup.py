@@ -0,0 +1,121 @@
+import re
+import hashlib
+import numpy as np
+from collections import defaultdict
+from typing import Annotated, Callable, Dict, List, Optional
+
+# MinHash signature length, split into LSH bands of BAND_ROWS rows: stories
+# with a shingle Jaccard similarity around (1 / N_BANDS) ** (1 / BAND_ROWS)
+# (~0.5) or more become candidates, then are checked against THRESHOLD
+N_PERMUTATIONS = 64
+BAND_ROWS = 4
+THRESHOLD = 0.5
+SHINGLE_SIZE = 2
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_rng = np.random.default_rng(20240101)
+_PERM_A = _rng.integers(1, _MERSENNE_PRIME, N_PERMUTATIONS, dtype=np.uint64)
+_PERM_B = _rng.integers(0, _MERSENNE_PRIME, N_PERMUTATIONS, dtype=np.uint64)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> List[str]:
+    """Word n-grams of the lowercased alphanumeric tokens of a text."""
+    tokens = _TOKEN.findall((text or "").lower())
+    if len(tokens) <= size:
+        return [" ".join(tokens)] if tokens else []
+    return [" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)]
+
+
+def minhash(text: Annotated[str, "text to fingerprint"]) -> Optional[np.ndarray]:
+    """
+    MinHash signature of the word shingles of a text: the fraction of equal
+    positions of two signatures estimates the Jaccard similarity of their
+    shingle sets. None for texts without words.
+    """
+    hashes = np.array(
+        [
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "big")
+            for s in set(shingles(text))
+        ],
+        dtype=np.uint64,
+    )
+    if len(hashes) == 0:
+        return None
+    hashes %= np.uint64(_MERSENNE_PRIME)
+    # (a * x + b) mod p stays below 2**63 for a, x, b < 2**31
+    permuted = (_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]) % np.uint64(
+        _MERSENNE_PRIME
+    )
+    return permuted.min(axis=1)
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_signatures(
+    signatures: Annotated[List[Optional[np.ndarray]], "MinHash of every item"],
+    threshold: Annotated[float, "smallest similarity of duplicates"] = THRESHOLD,
+) -> List[int]:
+    """
+    Cluster label of every signature (the index of the first member of its
+    cluster). Signatures are hashed band by band and only items sharing a band
+    bucket are compared, so the cost stays close to linear in the number of
+    items. Items without a signature are never merged.
+    """
+    parent = list(range(len(signatures)))
+    for start in range(0, N_PERMUTATIONS, BAND_ROWS):
+        buckets = defaultdict(list)
+        for i, signature in enumerate(signatures):
+            if signature is not None:
+                buckets[signature[start : start + BAND_ROWS].tobytes()].append(i)
+        for members in buckets.values():
+            for a, i in enumerate(members):
+                for j in members[a + 1 :]:
+                    root_i, root_j = _find(parent, i), _find(parent, j)
+                    if root_i == root_j:
+                        continue
+                    if np.mean(signatures[i] == signatures[j]) >= threshold:
+                        # the earliest item stays the root of its cluster
+                        parent[max(root_i, root_j)] = min(root_i, root_j)
+    return [_find(parent, i) for i in range(len(signatures))]
+
+
+def collapse_near_duplicates(
+    items: Annotated[List[dict], "news items, in display order"],
+    text: Annotated[Callable[[dict], str], "text fingerprinted for an item"],
+    source: Annotated[
+        Optional[Callable[[dict], str]], "source name of an item, if any"
+    ] = None,
+    threshold: float = THRESHOLD,
+) -> List[Dict]:
+    """
+    Collapse near-duplicate stories. Each story is kept once, at the position of
+    its first occurrence, with the number of items reporting it and their
+    distinct sources.
+    Returns:
+        list: {"item": first item of the story, "count": int, "sources": list}
+    """
+    labels = cluster_signatures([minhash(text(item)) for item in items], threshold)
+    stories = {}
+    for item, label in zip(items, labels):
+        story = stories.setdefault(label, {"item": item, "count": 0, "sources": []})
+        story["count"] += 1
+        name = source(item) if source else None
+        if name and name not in story["sources"]:
+            story["sources"].append(name)
+    return list(stories.values())
+
+
+def story_suffix(story: Dict) -> str:
+    """' [reported N times: sources]' for stories seen more than once."""
+    if story["count"] == 1:
+        return ""
+    if story["sources"]:
+        return f" [reported {story['count']} times: {', '.join(story['sources'])}]"
+    return f" [reported {story['count']} times]"
@@ -0,0 +1,298 @@
+import os
+import glob
+import threading
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from collections import defaultdict
+from typing import Annotated, List, Optional
+from .atomic_write import atomic_path
+from .frame_cache import frame_cache
+
+# Date range covered by the bundled offline Yahoo Finance price files
+PRICE_DATA_START = "2015-01-01"
+PRICE_DATA_END = "2025-03-25"
+PRICE_FILE_STEM = "{symbol}-YFin-data-" + f"{PRICE_DATA_START}-{PRICE_DATA_END}"
+
+# Years of history fetched the first time a symbol is cached online
+ONLINE_HISTORY_YEARS = 15
+
+# Serializes updates of the same symbol's online cache within the process
+_online_cache_locks = defaultdict(threading.Lock)
+_online_cache_locks_guard = threading.Lock()
+# Serializes the one-time CSV -> Parquet conversion of the same file
+_conversion_locks = defaultdict(threading.Lock)
+_conversion_locks_guard = threading.Lock()
+
+
+def price_csv_path(symbol: str, price_dir: str) -> str:
+    """Path of the raw CSV price file for a symbol."""
+    return os.path.join(price_dir, PRICE_FILE_STEM.format(symbol=symbol) + ".csv")
+
+
+def price_parquet_path(symbol: str, price_dir: str) -> str:
+    """Path of the columnar (Parquet) copy of a symbol's price file."""
+    return os.path.join(price_dir, PRICE_FILE_STEM.format(symbol=symbol) + ".parquet")
+
+
+def parse_price_csv(csv_path: str) -> pd.DataFrame:
+    """
+    Parse a YFin price CSV into a frame indexed by a typed, sorted DatetimeIndex.
+    The time and timezone suffix of the "Date" column is dropped so that the index
+    holds the trading date as it appears in the file.
+    """
+    data = pd.read_csv(csv_path)
+    dates = pd.to_datetime(data["Date"].astype(str).str[:10], format="%Y-%m-%d")
+    data = data.drop(columns="Date")
+    data.index = pd.DatetimeIndex(dates, name="Date")
+    return data.sort_index()
+
+
+def write_parquet_atomic(data: pd.DataFrame, path: str) -> None:
+    with atomic_path(path) as tmp_path:
+        data.to_parquet(tmp_path)
+
+
+def convert_price_csv(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    price_dir: Annotated[str, "directory where the price files are stored"],
+) -> str:
+    """
+    Convert a symbol's price CSV to Parquet next to the original file.
+    Returns:
+        str: path of the written Parquet file
+    """
+    parquet_path = price_parquet_path(symbol, price_dir)
+    write_parquet_atomic(
+        parse_price_csv(price_csv_path(symbol, price_dir)), parquet_path
+    )
+    return parquet_path
+
+
+def convert_all_price_csvs(
+    price_dir: Annotated[str, "directory where the price files are stored"],
+) -> List[str]:
+    """
+    One-time conversion of every bundled price CSV in price_dir to Parquet.
+    Returns:
+        list: symbols that were converted
+    """
+    suffix = PRICE_FILE_STEM.format(symbol="") + ".csv"
+    symbols = []
+    for csv_path in sorted(glob.glob(os.path.join(price_dir, "*" + suffix))):
+        symbol = os.path.basename(csv_path)[: -len(suffix)]
+        convert_price_csv(symbol, price_dir)
+        symbols.append(symbol)
+    return symbols
+
+
+def load_price_data(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    price_dir: Annotated[str, "directory where the price files are stored"],
+) -> pd.DataFrame:
+    """
+    Load the offline price history of a symbol, indexed by trading date.
+
+    Reads the Parquet copy when it is at least as recent as the CSV, otherwise
+    parses the CSV and converts it so that later calls take the fast path. If no
+    Parquet engine is installed, the parsed CSV is returned without conversion.
+    Parquet reads go through the shared in-memory frame cache.
+    """
+    csv_path = price_csv_path(symbol, price_dir)
+    parquet_path = price_parquet_path(symbol, price_dir)
+
+    def parquet_is_current():
+        csv_exists = os.path.exists(csv_path)
+        return os.path.exists(parquet_path) and (
+            not csv_exists
+            or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+        )
+
+    if parquet_is_current():
+        return frame_cache.get(parquet_path, pd.read_parquet)
+
+    with _conversion_locks_guard:
+        lock = _conversion_locks[parquet_path]
+
+    with lock:
+        # another thread may have converted the file while we waited
+        if parquet_is_current():
+            return frame_cache.get(parquet_path, pd.read_parquet)
+
+        if not os.path.exists(csv_path):
+            raise FileNotFoundError(f"No price data found for {symbol} in {price_dir}")
+
+        data = parse_price_csv(csv_path)
+        try:
+            write_parquet_atomic(data, parquet_path)
+        except ImportError:
+            # pyarrow / fastparquet not installed, keep serving the parsed CSV
+            pass
+        return data
+
+
+def slice_price_data(
+    data: pd.DataFrame,
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+) -> pd.DataFrame:
+    """
+    Return the rows between start_date and end_date (inclusive) with a "Date"
+    column, numbered by their position in the price history like the rows of
+    the raw CSV. Unlike the CSV, whose dates read "yyyy-mm-dd 00:00:00-05:00",
+    the dates are formatted as yyyy-mm-dd: the store only keeps trading dates.
+    """
+    start = data.index.searchsorted(pd.Timestamp(start_date))
+    stop = data.index.searchsorted(pd.Timestamp(end_date), side="right")
+    window = data.iloc[start:stop]
+    window = window.set_index(window.index.strftime("%Y-%m-%d").rename("Date"))
+    return window.reset_index().set_index(pd.RangeIndex(start, stop))
+
+
+def online_cache_path(symbol: str, cache_dir: str) -> str:
+    """Path of the per-symbol online price cache."""
+    return os.path.join(cache_dir, f"{symbol}-YFin-data.parquet")
+
+
+def _download_prices(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    data = yf.download(
+        symbol,
+        start=start_date,
+        end=end_date,
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+    if data.index.tz is not None:
+        data.index = data.index.tz_localize(None)
+    data.index = pd.DatetimeIndex(data.index, name="Date").normalize()
+    return data
+
+
+def _merge_legacy_cache_files(symbol: str, cache_dir: str) -> Optional[pd.DataFrame]:
+    """
+    Fold the date-stamped `{symbol}-YFin-data-{start}-{end}.csv` files written by
+    older versions into one frame and delete them.
+    """
+    legacy_files = glob.glob(os.path.join(cache_dir, f"{symbol}-YFin-data-*-*.csv"))
+    if not legacy_files:
+        return None
+    # oldest download first, so the most recent one wins on overlapping dates;
+    # names end with "-{start}-{end}.csv", both dates YYYY-mm-dd
+    legacy_files.sort(key=lambda path: (path[-14:-4], path[-25:-15]))
+
+    frames = []
+    for path in legacy_files:
+        try:
+            frames.append(parse_price_csv(path))
+        except (KeyError, ValueError):
+            # failed downloads were saved without a usable Date column
+            pass
+        os.remove(path)
+    return _merge_prices(frames) if frames else None
+
+
+def _merge_prices(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    merged = pd.concat([frame for frame in frames if frame is not None])
+    return merged[~merged.index.duplicated(keep="last")].sort_index()
+
+
+def _same_adjustment(cached: pd.DataFrame, new_bars: pd.DataFrame) -> bool:
+    """
+    Whether the freshly downloaded bars share the adjustment basis of the cache,
+    i.e. their prices on the dates both hold are unchanged. A split or dividend
+    since the last update re-bases the whole adjusted history.
+    """
+    overlap = new_bars.index.intersection(cached.index)
+    columns = [
+        column
+        for column in ("Open", "High", "Low", "Close")
+        if column in cached.columns and column in new_bars.columns
+    ]
+    if overlap.empty or not columns:
+        return False
+    return np.allclose(
+        cached.loc[overlap, columns].to_numpy(dtype=float),
+        new_bars.loc[overlap, columns].to_numpy(dtype=float),
+        rtol=1e-6,
+        equal_nan=True,
+    )
+
+
+def load_online_price_data(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    cache_dir: Annotated[str, "directory where the online price cache is stored"],
+    today: Annotated[Optional[str], "override of today's date, YYYY-mm-dd"] = None,
+) -> pd.DataFrame:
+    """
+    Load a symbol's online price history, indexed by trading date.
+
+    The full history is downloaded once and stored in a single per-symbol file.
+    Later calls, at most once per day, download the bars from the last cached
+    one on; prices are split and dividend adjusted, so when that overlapping bar
+    no longer matches the cache the full history is downloaded again. Updates go
+    through an atomic rename, so concurrent readers always see a complete file.
+    """
+    today = pd.Timestamp(today or pd.Timestamp.today()).normalize()
+    cache_file = online_cache_path(symbol, cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    with _online_cache_locks_guard:
+        lock = _online_cache_locks[symbol]
+
+    with lock:
+        cached = (
+            frame_cache.get(cache_file, pd.read_parquet)
+            if os.path.exists(cache_file)
+            else None
+        )
+        legacy = _merge_legacy_cache_files(symbol, cache_dir)
+        if legacy is not None:
+            cached = _merge_prices([cached, legacy])
+
+        # the cache was already brought up to date today
+        if (
+            legacy is None
+            and cached is not None
+            and pd.Timestamp.fromtimestamp(os.path.getmtime(cache_file)).normalize()
+            >= today
+        ):
+            return cached
+
+        history_start = today - pd.DateOffset(years=ONLINE_HISTORY_YEARS)
+        incremental = cached is not None and not cached.empty
+        # the last cached bar is downloaded again to check the adjustment basis
+        start_date = cached.index[-1] if incremental else history_start
+
+        if start_date < today:
+            new_bars = _download_prices(
+                symbol, start_date.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+            )
+            if (
+                incremental
+                and not new_bars.empty
+                and not _same_adjustment(cached, new_bars)
+            ):
+                history = _download_prices(
+                    symbol,
+                    history_start.strftime("%Y-%m-%d"),
+                    today.strftime("%Y-%m-%d"),
+                )
+                if not history.empty:
+                    cached, new_bars = None, history
+            if not new_bars.empty:
+                cached = _merge_prices([cached, new_bars])
+
+        if cached is None:
+            raise ValueError(f"No online price data available for {symbol}")
+
+        write_parquet_atomic(cached, cache_file)
+        return cached
+
+
+if __name__ == "__main__":
+    from .config import get_config
+
+    price_dir = os.path.join(get_config()["data_dir"], "market_data", "price_data")
+    converted = convert_all_price_csvs(price_dir)
+    print(f"Converted {len(converted)} price files in {price_dir}: {converted}")
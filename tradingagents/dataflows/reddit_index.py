@@ -0,0 +1,142 @@
+import os
+import json
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Annotated, Dict, Iterator, List
+from .atomic_write import write_json_atomic
+
+# Indexes live next to the category folders, so that the number of files in a
+# category (used to split the post limit between subreddits) is unchanged
+INDEX_DIR_NAME = ".index"
+
+# Parsed indexes, keyed by JSONL path and checked against its size and mtime
+_loaded_indexes: Dict[str, dict] = {}
+_loaded_indexes_lock = threading.Lock()
+# One lock per indexed file, so that concurrent callers build it only once
+_build_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+
+def index_path(data_path: str, category: str, data_file: str) -> str:
+    """Path of the day-offset index of a subreddit JSONL file."""
+    return os.path.join(data_path, INDEX_DIR_NAME, category, data_file + ".idx.json")
+
+
+def _file_signature(jsonl_path: str) -> List[float]:
+    stat = os.stat(jsonl_path)
+    return [stat.st_size, stat.st_mtime]
+
+
+def build_day_index(jsonl_path: str) -> dict:
+    """
+    Scan a subreddit JSONL file once and record the byte offset of every post,
+    grouped by the UTC day it was created on, in file order.
+    """
+    days = defaultdict(list)
+    offset = 0
+    with open(jsonl_path, "rb") as f:
+        for line in f:
+            if line.strip():
+                created_utc = json.loads(line)["created_utc"]
+                day = datetime.utcfromtimestamp(created_utc).strftime("%Y-%m-%d")
+                days[day].append(offset)
+            offset += len(line)
+    return {"signature": _file_signature(jsonl_path), "days": dict(days)}
+
+
+def build_lock(key: str) -> threading.Lock:
+    """Process-wide lock serializing the builds of one index."""
+    with _loaded_indexes_lock:
+        return _build_locks[key]
+
+
+def write_index(index: dict, path: str) -> None:
+    write_json_atomic(index, path)
+
+
+def read_index(path: str):
+    """A persisted index, or None when it is missing or unreadable."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_day_index(
+    data_path: Annotated[str, "path to the reddit_data folder"],
+    category: Annotated[str, "category folder of the subreddit file"],
+    data_file: Annotated[str, "name of the subreddit JSONL file"],
+) -> dict:
+    """
+    Load the day-offset index of a subreddit file, building (and persisting) it
+    when it is missing or the file changed since it was built.
+    """
+    jsonl_path = os.path.join(data_path, category, data_file)
+    signature = _file_signature(jsonl_path)
+
+    with _loaded_indexes_lock:
+        index = _loaded_indexes.get(jsonl_path)
+    if index is not None and index["signature"] == signature:
+        return index
+
+    with build_lock(jsonl_path):
+        # another thread may have loaded or built it while we waited
+        with _loaded_indexes_lock:
+            index = _loaded_indexes.get(jsonl_path)
+        if index is not None and index["signature"] == signature:
+            return index
+
+        path = index_path(data_path, category, data_file)
+        index = read_index(path)
+        if index is None or index["signature"] != signature:
+            index = build_day_index(jsonl_path)
+            write_index(index, path)
+
+        with _loaded_indexes_lock:
+            _loaded_indexes[jsonl_path] = index
+        return index
+
+
+def read_posts_on_day(
+    data_path: Annotated[str, "path to the reddit_data folder"],
+    category: Annotated[str, "category folder of the subreddit file"],
+    data_file: Annotated[str, "name of the subreddit JSONL file"],
+    date: Annotated[str, "UTC day, YYYY-mm-dd"],
+) -> Iterator[dict]:
+    """Parsed posts of a subreddit created on a UTC day, in file order."""
+    offsets = load_day_index(data_path, category, data_file)["days"].get(date, [])
+    if not offsets:
+        return
+    with open(os.path.join(data_path, category, data_file), "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            yield json.loads(f.readline())
+
+
+def build_reddit_indexes(
+    data_path: Annotated[str, "path to the reddit_data folder"],
+) -> List[str]:
+    """
+    One-time builder of the day-offset index of every subreddit file.
+    Returns:
+        list: indexed files, relative to data_path
+    """
+    indexed = []
+    for category in sorted(os.listdir(data_path)):
+        category_dir = os.path.join(data_path, category)
+        if category == INDEX_DIR_NAME or not os.path.isdir(category_dir):
+            continue
+        for data_file in sorted(os.listdir(category_dir)):
+            if data_file.endswith(".jsonl"):
+                load_day_index(data_path, category, data_file)
+                indexed.append(os.path.join(category, data_file))
+    return indexed
+
+
+if __name__ == "__main__":
+    from .config import get_config
+
+    data_path = os.path.join(get_config()["data_dir"], "reddit_data")
+    indexed = build_reddit_indexes(data_path)
+    print(f"Indexed {len(indexed)} subreddit files in {data_path}")
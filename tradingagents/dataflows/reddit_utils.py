@@ -3,10 +3,17 @@ import time
 import json
 from datetime import datetime, timedelta
 from contextlib import contextmanager
-from typing import Annotated, List, Dict
+from typing import Annotated, List, Dict, Optional, Tuple
+from functools import lru_cache
 import os
 import re
 import praw
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from .reddit_index import read_posts_on_day
+from .mention_matcher import MentionMatcher, load_mention_index
+from . import http_client
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -74,109 +81,249 @@ def fetch_top_from_category(
     if not isinstance(max_limit, int) or max_limit <= 0:
         raise ValueError("max_limit must be a positive integer.")
 
-    base_path = data_path
+    return fetch_top_from_category_window(
+        category, date, date, max_limit, [query], data_path
+    )[(query, date)]
+
+
+def company_aliases() -> Dict[str, List[str]]:
+    """Names each ticker of ticker_to_company goes by, the ticker included."""
+    return {
+        ticker: company_name.split(" OR ") + [ticker]
+        for ticker, company_name in ticker_to_company.items()
+    }
+
+
+# Compiled once, matches every ticker of ticker_to_company in a single scan
+COMPANY_MATCHER = MentionMatcher(company_aliases())
+
+
+@lru_cache(maxsize=256)
+def _query_matcher(query: str) -> MentionMatcher:
+    # tickers outside ticker_to_company are matched on the query itself
+    return MentionMatcher({query: [query]})
+
+
+@lru_cache(maxsize=1024)
+def _cached_posts_on_day(data_path, category, data_file, date, signature):
+    # signature (size, mtime) of the file invalidates the entry when it changes
+    return tuple(read_posts_on_day(data_path, category, data_file, date))
+
+
+def _posts_on_day(data_path: str, category: str, data_file: str, date: str):
+    stat = os.stat(os.path.join(data_path, category, data_file))
+    return _cached_posts_on_day(
+        data_path, category, data_file, date, (stat.st_size, stat.st_mtime)
+    )
 
-    all_content = []
 
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
+def fetch_top_from_category_window(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    start_date: Annotated[str, "First date of the window, YYYY-mm-dd."],
+    end_date: Annotated[str, "Last date of the window, YYYY-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    queries: Annotated[
+        List[Optional[str]], "Tickers (or None for no filter) to fetch posts for."
+    ],
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+) -> Dict[Tuple[Optional[str], str], List[Dict]]:
+    """
+    Bulk version of fetch_top_from_category for a whole date window and ticker
+    list. Each subreddit file is read once per day of the window, whatever the
+    number of tickers, and parsed days are memoized across calls. The posts of
+    every (query, date) are exactly those fetch_top_from_category returns: per
+    subreddit, the top max_limit // number-of-files posts by upvotes.
+    """
+    # Validate category
+    if not isinstance(category, str) or not category.strip():
+        raise ValueError("Category must be a non-empty string.")
+    try:
+        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+    except ValueError:
+        raise ValueError(
+            f"Dates '{start_date}' and '{end_date}' must be in 'YYYY-MM-DD' format."
+        )
+
+    # Validate max_limit
+    if not isinstance(max_limit, int) or max_limit <= 0:
+        raise ValueError("max_limit must be a positive integer.")
+
+    base_path = data_path
+    data_files = os.listdir(os.path.join(base_path, category))
+
+    if max_limit < len(data_files):
         raise ValueError(
             "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
         )
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
+    limit_per_subreddit = max_limit // len(data_files)
+
+    # only company news are filtered on the company's name (query)
+    filtered_queries = {query for query in queries if "company" in category and query}
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
+    dates = [
+        (start_dt + timedelta(days=i)).strftime("%Y-%m-%d")
+        for i in range((end_dt - start_dt).days + 1)
+    ]
+    results = {(query, date): [] for query in queries for date in dates}
+
+    for data_file in data_files:
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
             continue
 
-        all_content_curr_subreddit = []
+        # inverted ticker -> posts index of the file, built once and persisted
+        mention_index = (
+            load_mention_index(base_path, category, data_file, COMPANY_MATCHER)
+            if filtered_queries & COMPANY_MATCHER.tickers
+            else None
+        )
 
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
+        for date in dates:
+            # seek straight to the posts of the date through the day-offset index
+            day_posts = _posts_on_day(base_path, category, data_file, date)
 
-                parsed_line = json.loads(line)
+            for query in queries:
+                if query not in filtered_queries:
+                    matching_posts = day_posts
+                elif query in COMPANY_MATCHER.tickers:
+                    positions = mention_index["days"].get(date, {}).get(query, [])
+                    matching_posts = [day_posts[i] for i in positions]
+                else:
+                    matcher = _query_matcher(query)
+                    matching_posts = [
+                        post for post in day_posts if matcher.mentions_post(post)
+                    ]
 
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
+                all_content_curr_subreddit = [
+                    {
+                        "title": parsed_line["title"],
+                        "content": parsed_line["selftext"],
+                        "url": parsed_line["url"],
+                        "upvotes": parsed_line["ups"],
+                        "posted_date": date,
+                    }
+                    for parsed_line in matching_posts
+                ]
 
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if query not in ticker_to_company:
-                        company_name = query
-                    else:
-                        company_name = ticker_to_company[query]
-                    if "OR" in company_name:
-                        search_terms = company_name.split(" OR ")
-                    else:
-                        search_terms = [company_name]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
-                        continue
-
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
+                # sort all_content_curr_subreddit by upvotes in descending order
+                all_content_curr_subreddit.sort(
+                    key=lambda x: x["upvotes"], reverse=True
+                )
+                results[(query, date)].extend(
+                    all_content_curr_subreddit[:limit_per_subreddit]
+                )
 
-                all_content_curr_subreddit.append(post)
+    return results
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
+# A Reddit listing page holds at most 100 posts and a listing at most 1000
+REDDIT_PAGE_SIZE = 100
+REDDIT_MAX_LISTING = 1000
+# Subreddit listings fetched concurrently
+REDDIT_MAX_WORKERS = 4
 
-    return all_content
+# Smallest "top" listing covering posts up to that many seconds old
+_TIME_FILTERS = [
+    ("day", 24 * 3600),
+    ("week", 7 * 24 * 3600),
+    ("month", 31 * 24 * 3600),
+    ("year", 366 * 24 * 3600),
+]
 
+# PRAW clients are not thread-safe: every worker of the long-lived pool keeps
+# its own client for the life of the process, while their requests all go
+# through the one pooled keep-alive session of http_client
+_reddit_clients = threading.local()
+_reddit_pool = None
+_reddit_pool_lock = threading.Lock()
 
-def fetch_top_from_category_online(
+
+def get_reddit_client() -> praw.Reddit:
+    """
+    Long-lived Reddit client of the calling thread, sending its requests
+    through the process-wide pooled session http_client.get_session("reddit").
+    """
+    client = getattr(_reddit_clients, "client", None)
+    if client is None:
+        client = praw.Reddit(
+            client_id=os.environ["REDDIT_CLIENT_ID"],
+            client_secret=os.environ["REDDIT_CLIENT_SECRET"],
+            user_agent="script:trading_agents:v1.0 (by u/SpiritQueasy3662)",
+            requestor_kwargs={"session": http_client.get_session("reddit")},
+        )
+        _reddit_clients.client = client
+    return client
+
+
+def _get_reddit_pool() -> ThreadPoolExecutor:
+    global _reddit_pool
+    with _reddit_pool_lock:
+        if _reddit_pool is None:
+            _reddit_pool = ThreadPoolExecutor(
+                max_workers=REDDIT_MAX_WORKERS, thread_name_prefix="reddit"
+            )
+        return _reddit_pool
+
+
+def _top_listing_params(start_epoch: int, n_days: int) -> Tuple[str, int]:
+    """time_filter of the smallest listing reaching start_epoch, and its size."""
+    age = time.time() - start_epoch
+    time_filter = next((name for name, span in _TIME_FILTERS if age <= span), "all")
+    return time_filter, min(REDDIT_PAGE_SIZE * n_days, REDDIT_MAX_LISTING)
+
+
+def _fetch_subreddit_top(
+    subreddit_name: str, time_filter: str, limit: int
+) -> List[Dict]:
+    """One rate-limited pull of the top listing of a subreddit."""
+    http_client.get_rate_limiter("reddit").acquire(-(-limit // REDDIT_PAGE_SIZE))
+    subreddit = get_reddit_client().subreddit(subreddit_name)
+    return [
+        {
+            "created_utc": int(submission.created_utc),
+            "title": submission.title,
+            "selftext": getattr(submission, "selftext", ""),
+            "url": submission.url,
+            "score": submission.score,
+        }
+        for submission in subreddit.top(time_filter=time_filter, limit=limit)
+    ]
+
+
+def fetch_top_from_category_online_window(
     category: Annotated[str, "Comma-separated list of subreddits or a category name."],
-    date: Annotated[str, "Date to fetch top posts from."],
-    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    start_date: Annotated[str, "First date of the window, YYYY-mm-dd."],
+    end_date: Annotated[str, "Last date of the window, YYYY-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
     query: Annotated[str, "Optional query to search for in the subreddit."] = None,
     subreddit_map: Dict[str, List[str]] = None,  # Map category to list of subreddits
-) -> List[Dict]:
+) -> Dict[str, List[Dict]]:
     """
-    Fetch top posts from Reddit online for a given category and date using Reddit API (PRAW).
+    Fetch top posts from Reddit online for every date of a window. The top
+    listing of each subreddit is pulled once for the whole window, concurrently
+    across subreddits and through the shared rate limiter, then bucketed by day.
+    Returns:
+        dict: date -> posts of that date, as fetch_top_from_category_online
     """
-    reddit_client = praw.Reddit(
-        client_id=os.environ["REDDIT_CLIENT_ID"],
-        client_secret=os.environ["REDDIT_CLIENT_SECRET"],
-        user_agent="script:trading_agents:v1.0 (by u/SpiritQueasy3662)",
-    )
-    if reddit_client is None:
-        raise ValueError("A PRAW Reddit client instance must be provided.")
-
     # Validate category
     if not isinstance(category, str) or not category.strip():
         raise ValueError("Category must be a non-empty string.")
     try:
-        date_dt = datetime.strptime(date, "%Y-%m-%d")
+        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
     except ValueError:
-        raise ValueError(f"Date '{date}' must be in 'YYYY-MM-DD' format.")
+        raise ValueError(
+            f"Dates '{start_date}' and '{end_date}' must be in 'YYYY-MM-DD' format."
+        )
+    if end_dt < start_dt:
+        raise ValueError("end_date must not be before start_date.")
 
     if not isinstance(max_limit, int) or max_limit <= 0:
         raise ValueError("max_limit must be a positive integer.")
@@ -187,44 +334,77 @@ def fetch_top_from_category_online(
     else:
         subreddits = [s.strip() for s in category.split(",") if s.strip()]
 
-    all_content = []
     limit_per_subreddit = max_limit // len(subreddits) if subreddits else max_limit
 
-    # Calculate start and end timestamps for the date
-    start_epoch = int(datetime(date_dt.year, date_dt.month, date_dt.day).timestamp())
-    end_epoch = int((date_dt + timedelta(days=1)).timestamp())
-
-    for subreddit_name in subreddits:
-        subreddit = reddit_client.subreddit(subreddit_name)
-        count = 0
-        for submission in subreddit.top(
-            time_filter="day", limit=100
-        ):  # Fetch top 100 for the day
-            created_utc = int(submission.created_utc)
-            if not (start_epoch <= created_utc < end_epoch):
+    # [start, end) timestamps of every date of the window
+    dates = [start_dt + timedelta(days=i) for i in range((end_dt - start_dt).days + 1)]
+    day_bounds = [
+        (
+            date_dt.strftime("%Y-%m-%d"),
+            int(datetime(date_dt.year, date_dt.month, date_dt.day).timestamp()),
+            int((date_dt + timedelta(days=1)).timestamp()),
+        )
+        for date_dt in dates
+    ]
+    time_filter, listing_limit = _top_listing_params(day_bounds[0][1], len(dates))
+
+    pool = _get_reddit_pool()
+    listings = pool.map(
+        lambda name: _fetch_subreddit_top(name, time_filter, listing_limit),
+        subreddits,
+    )
+
+    results = {date: [] for date, _, _ in day_bounds}
+    for listing in listings:
+        counts = defaultdict(int)
+        for submission in listing:
+            created_utc = submission["created_utc"]
+            date = next(
+                (
+                    date
+                    for date, start_epoch, end_epoch in day_bounds
+                    if start_epoch <= created_utc < end_epoch
+                ),
+                None,
+            )
+            if date is None or counts[date] >= limit_per_subreddit:
                 continue
             if query:
                 # Check if query is in title or selftext
                 if not (
-                    re.search(query, submission.title, re.IGNORECASE)
-                    or re.search(
-                        query, getattr(submission, "selftext", ""), re.IGNORECASE
-                    )
+                    re.search(query, submission["title"], re.IGNORECASE)
+                    or re.search(query, submission["selftext"], re.IGNORECASE)
                 ):
                     continue
-            post_obj = {
-                "title": submission.title,
-                "content": getattr(submission, "selftext", ""),
-                "url": submission.url,
-                "upvotes": submission.score,
-                "posted_date": datetime.utcfromtimestamp(created_utc).strftime(
-                    "%Y-%m-%d"
-                ),
-            }
-            all_content.append(post_obj)
-            count += 1
-            if count >= limit_per_subreddit:
-                break
-
-    all_content.sort(key=lambda x: x["upvotes"], reverse=True)
-    return all_content[:max_limit]
+            results[date].append(
+                {
+                    "title": submission["title"],
+                    "content": submission["selftext"],
+                    "url": submission["url"],
+                    "upvotes": submission["score"],
+                    "posted_date": datetime.utcfromtimestamp(created_utc).strftime(
+                        "%Y-%m-%d"
+                    ),
+                }
+            )
+            counts[date] += 1
+
+    for date, posts in results.items():
+        posts.sort(key=lambda x: x["upvotes"], reverse=True)
+        results[date] = posts[:max_limit]
+    return results
+
+
+def fetch_top_from_category_online(
+    category: Annotated[str, "Comma-separated list of subreddits or a category name."],
+    date: Annotated[str, "Date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    subreddit_map: Dict[str, List[str]] = None,  # Map category to list of subreddits
+) -> List[Dict]:
+    """
+    Fetch top posts from Reddit online for a given category and date using Reddit API (PRAW).
+    """
+    return fetch_top_from_category_online_window(
+        category, date, date, max_limit, query, subreddit_map
+    )[date]
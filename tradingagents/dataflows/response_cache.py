@@ -0,0 +1,267 @@
+import os
+import json
+import time
+import hashlib
+import inspect
+import functools
+import threading
+from concurrent.futures import Future
+from datetime import date, datetime
+from typing import Annotated, Any, Callable, Dict, Optional
+from .atomic_write import write_json_atomic
+from .config import get_config
+
+# Seconds a response stays fresh when its window reaches today; responses about
+# windows that ended before today never expire
+VENDOR_TTLS = {
+    "finnhub": 15 * 60,
+    "newsapi": 60 * 60,
+    "google": 60 * 60,
+    "yfinance": 15 * 60,
+    "openai": 60 * 60,
+}
+DEFAULT_TTL = 15 * 60
+DEFAULT_MAX_MB = 512
+
+
+def _as_of_day(value) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y"):
+        try:
+            return datetime.strptime(str(value), fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+class ResponseCache:
+    """
+    Content-addressed on-disk cache of online responses. Entries are JSON files
+    named by the SHA-256 of (vendor, function, normalized arguments), written
+    atomically, and evicted least recently used first once the cache outgrows
+    max_bytes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Annotated[str, "directory holding the entries"],
+        max_bytes: Annotated[int, "size bound of the cache"] = DEFAULT_MAX_MB << 20,
+        ttls: Annotated[Optional[Dict[str, float]], "vendor -> seconds"] = None,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttls = {**VENDOR_TTLS, **(ttls or {})}
+        self._lock = threading.Lock()
+        self._sizes = None  # path -> size, scanned on first write
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(vendor: str, name: str, arguments: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"vendor": vendor, "name": name, "arguments": arguments},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ".json")
+
+    def ttl_for(self, vendor: str, as_of) -> Optional[float]:
+        """None (never expires) for windows that ended before today."""
+        as_of_day = _as_of_day(as_of) if as_of is not None else None
+        if as_of_day is not None and as_of_day < date.today():
+            return None
+        return self.ttls.get(vendor, DEFAULT_TTL)
+
+    def get(self, key: str):
+        """Return (True, value) on a fresh hit, (False, None) otherwise."""
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return False, None
+
+        if entry["expires"] is not None and entry["expires"] < time.time():
+            with self._lock:
+                self.expired += 1
+                self.misses += 1
+            return False, None
+
+        # reads refresh the recency used by the eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return True, entry["value"]
+
+    def put(self, key: str, value, ttl: Optional[float]) -> None:
+        path = self._path(key)
+        entry = {
+            "created": time.time(),
+            "expires": None if ttl is None else time.time() + ttl,
+            "value": value,
+        }
+        write_json_atomic(entry, path)
+
+        with self._lock:
+            self.writes += 1
+            sizes = self._scan()
+            sizes[path] = os.path.getsize(path)
+            self._evict(sizes)
+
+    def _scan(self) -> Dict[str, int]:
+        if self._sizes is None:
+            self._sizes = {}
+            for root, _, files in os.walk(self.cache_dir):
+                for file_name in files:
+                    if file_name.endswith(".json"):
+                        path = os.path.join(root, file_name)
+                        self._sizes[path] = os.path.getsize(path)
+        return self._sizes
+
+    def _evict(self, sizes: Dict[str, int]) -> None:
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        def last_used(path):
+            try:
+                return os.path.getmtime(path)
+            except OSError:
+                return 0.0
+
+        for path in sorted(sizes, key=last_used):
+            if total <= self.max_bytes:
+                break
+            total -= sizes.pop(path)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in list(self._scan()):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._sizes = {}
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            sizes = self._scan()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "entries": len(sizes),
+                "bytes": sum(sizes.values()),
+            }
+
+
+_caches: Dict[str, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+# key -> Future of the call computing it, shared by concurrent callers
+_in_flight: Dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Response cache configured by response_cache*, None when disabled."""
+    config = get_config()
+    if not config.get("response_cache", True):
+        return None
+    cache_dir = config.get("response_cache_dir") or os.path.join(
+        config["data_cache_dir"], "responses"
+    )
+    with _caches_lock:
+        cache = _caches.get(cache_dir)
+        if cache is None:
+            cache = ResponseCache(
+                cache_dir,
+                int(config.get("response_cache_max_mb", DEFAULT_MAX_MB)) << 20,
+                config.get("response_cache_ttls"),
+            )
+            _caches[cache_dir] = cache
+        return cache
+
+
+def cached_response(
+    vendor: Annotated[str, "vendor the response comes from"],
+    as_of: Annotated[Optional[str], "argument holding the last day of the window"],
+    should_cache: Callable[[Any], bool] = bool,
+):
+    """
+    Cache the JSON-serializable result of an online data function. Arguments
+    are bound to the signature (defaults applied, strings stripped) so equal
+    calls share one entry, and concurrent misses of the same entry wait for a
+    single call. Results rejected by should_cache (by default, empty ones) and
+    exceptions are not cached.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_response_cache()
+            if cache is None:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {
+                key: value.strip() if isinstance(value, str) else value
+                for key, value in bound.arguments.items()
+            }
+            key = cache.make_key(vendor, name, arguments)
+
+            hit, value = cache.get(key)
+            if hit:
+                return value
+
+            # single flight: concurrent callers of the same key wait for one call
+            with _in_flight_lock:
+                future = _in_flight.get(key)
+                leader = future is None
+                if leader:
+                    future = _in_flight[key] = Future()
+            if not leader:
+                return future.result()
+
+            try:
+                value = func(*args, **kwargs)
+                if should_cache(value):
+                    ttl = cache.ttl_for(vendor, arguments.get(as_of) if as_of else None)
+                    cache.put(key, value, ttl)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with _in_flight_lock:
+                    del _in_flight[key]
+            future.set_result(value)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -1,12 +1,38 @@
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
 from typing import Annotated
-import os
 from .config import get_config
+from .price_store import load_price_data, load_online_price_data
 
 
 class StockstatsUtils:
+    @staticmethod
+    def load_stock_data(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ):
+        """
+        Load the price history of a symbol wrapped as a stockstats frame, with a
+        "Date" column formatted as YYYY-mm-dd and sorted by date.
+        """
+        try:
+            if not online:
+                data = load_price_data(symbol, data_dir)
+            else:
+                data = load_online_price_data(symbol, get_config()["data_cache_dir"])
+        except FileNotFoundError:
+            raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+
+        data = data.set_index(data.index.strftime("%Y-%m-%d")).reset_index()
+        return wrap(data)
+
     @staticmethod
     def get_stock_stats(
         symbol: Annotated[str, "ticker symbol for the company"],
@@ -27,69 +53,60 @@ class StockstatsUtils:
     ):
 
         try:
-            pd.to_datetime(curr_date)
+            curr_date = pd.to_datetime(curr_date).strftime("%Y-%m-%d")
         except Exception:
             raise ValueError(
                 f"Error: curr_date '{curr_date}' is not a valid date string (expected YYYY-mm-dd)."
             )
 
-        df = None
-        data = None
-
-        if not online:
-            try:
-                data = pd.read_csv(
-                    os.path.join(
-                        data_dir,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
-                df = wrap(data)
-            except FileNotFoundError:
-                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
-        else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
-
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
-
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
-
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
+        df = StockstatsUtils.load_stock_data(symbol, data_dir, online)
 
         df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
+        matching_rows = df[df["Date"] == curr_date]
 
         if not matching_rows.empty:
             indicator_value = matching_rows[indicator].values[0]
             return indicator_value
         else:
             return "N/A: Not a trading day (weekend or holiday)"
+
+    @staticmethod
+    def get_stock_stats_window(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "start date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "end date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.Series:
+        """
+        Compute an indicator once over the full history and return its values on
+        the trading days between start_date and end_date (inclusive), indexed by
+        YYYY-mm-dd date strings in ascending order.
+        """
+        try:
+            start_date = pd.to_datetime(start_date).strftime("%Y-%m-%d")
+            end_date = pd.to_datetime(end_date).strftime("%Y-%m-%d")
+        except Exception:
+            raise ValueError(
+                f"Error: '{start_date}' / '{end_date}' are not valid date strings (expected YYYY-mm-dd)."
+            )
+
+        df = StockstatsUtils.load_stock_data(symbol, data_dir, online)
+
+        values = df[indicator]  # trigger stockstats to calculate the indicator
+        in_window = ((df["Date"] >= start_date) & (df["Date"] <= end_date)).values
+
+        return pd.Series(
+            values.values[in_window],
+            index=pd.Index(df["Date"].values[in_window], name="Date"),
+            name=indicator,
+        )
@@ -0,0 +1,35 @@
+import json
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from tradingagents.dataflows.atomic_write import atomic_path, write_json_atomic
+
+
+def test_concurrent_writers_never_share_a_temp_file(tmp_path):
+    path = str(tmp_path / "state" / "value.json")
+    barrier = threading.Barrier(8)
+
+    def work(i):
+        barrier.wait()
+        for _ in range(20):
+            write_json_atomic({"writer": i, "payload": "x" * 10_000}, path)
+            with open(path) as f:
+                assert len(json.load(f)["payload"]) == 10_000
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(work, range(8)))
+
+    assert [p.name for p in (tmp_path / "state").iterdir()] == ["value.json"]
+
+
+def test_failed_write_keeps_the_old_file(tmp_path):
+    path = tmp_path / "value.json"
+    write_json_atomic({"v": 1}, str(path))
+    with pytest.raises(RuntimeError):
+        with atomic_path(str(path)) as tmp:
+            with open(tmp, "w") as f:
+                f.write("{partial")
+            raise RuntimeError("write failed")
+
+    assert json.loads(path.read_text()) == {"v": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["value.json"]
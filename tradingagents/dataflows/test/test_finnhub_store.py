@@ -0,0 +1,109 @@
+import os
+import json
+import sqlite3
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from tradingagents.dataflows import finnhub_store, interface
+from tradingagents.dataflows.finnhub_store import (
+    finnhub_json_path,
+    finnhub_store_path,
+    import_finnhub_data,
+    query_range,
+)
+
+
+def _write_json(data_dir, data_type, data, ticker="AAPL"):
+    path = finnhub_json_path(ticker, data_type, str(data_dir))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f)
+    return path
+
+
+NEWS = {
+    "2024-01-05": [{"headline": "C", "summary": "c"}],
+    "2024-01-03": [{"headline": "B", "summary": "b"}],
+    "2024-01-04": [],
+    "2024-01-01": [{"headline": "A", "summary": "a"}],
+}
+
+
+def test_query_range_matches_json_filter(tmp_path):
+    """Same days, in the same order, as filtering the whole JSON file."""
+    _write_json(tmp_path, "news_data", NEWS)
+    result = query_range("AAPL", "2024-01-02", "2024-01-05", "news_data", str(tmp_path))
+    assert list(result) == ["2024-01-05", "2024-01-03"]
+    assert result["2024-01-03"] == NEWS["2024-01-03"]
+
+
+def test_range_query_uses_the_index(tmp_path):
+    _write_json(tmp_path, "news_data", NEWS)
+    query_range("AAPL", "2024-01-01", "2024-01-05", "news_data", str(tmp_path))
+    with sqlite3.connect(finnhub_store_path(str(tmp_path))) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT payload FROM finnhub_data WHERE ticker = 'AAPL' "
+            "AND data_type = 'news_data' AND period = '' AND date BETWEEN '2024' AND '2025'"
+        ).fetchall()
+    assert "finnhub_data_range" in str(plan)
+
+
+def test_store_follows_json_updates(tmp_path):
+    path = _write_json(tmp_path, "news_data", NEWS)
+    query_range("AAPL", "2024-01-01", "2024-01-05", "news_data", str(tmp_path))
+
+    _write_json(tmp_path, "news_data", {"2024-01-02": [{"headline": "D"}]})
+    os.utime(path, (0, 0))
+    result = query_range("AAPL", "2024-01-01", "2024-01-05", "news_data", str(tmp_path))
+    assert result == {"2024-01-02": [{"headline": "D"}]}
+
+    # once imported, the JSON file is no longer needed
+    os.remove(path)
+    assert query_range("AAPL", "2024-01-01", "2024-01-05", "news_data", str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        query_range("MSFT", "2024-01-01", "2024-01-05", "news_data", str(tmp_path))
+
+
+def test_import_finnhub_data_and_insider_sentiment(tmp_path, monkeypatch):
+    entry = {"year": 2024, "month": 1, "change": 10, "mspr": 0.5}
+    _write_json(
+        tmp_path, "insider_senti", {"2024-01-02": [entry], "2024-01-03": [entry]}
+    )
+    _write_json(tmp_path, "news_data", NEWS)
+    assert import_finnhub_data(str(tmp_path)) == [
+        os.path.join("insider_senti", "AAPL_data_formatted.json"),
+        os.path.join("news_data", "AAPL_data_formatted.json"),
+    ]
+
+    monkeypatch.setattr(interface, "DATA_DIR", str(tmp_path))
+    report = interface.get_finnhub_company_insider_sentiment("AAPL", "2024-01-05", 5)
+    assert report.count("### 2024-1:\nChange: 10\n") == 1
+
+
+def test_concurrent_first_queries_import_once(tmp_path, monkeypatch):
+    _write_json(tmp_path, "news_data", NEWS)
+    imports = []
+    import_file = finnhub_store.import_finnhub_file
+
+    def counting_import(*args):
+        imports.append(args[1:])
+        time.sleep(0.05)  # let the other first queries find the file missing
+        return import_file(*args)
+
+    monkeypatch.setattr(finnhub_store, "import_finnhub_file", counting_import)
+    barrier = threading.Barrier(8)
+
+    def work(_):
+        barrier.wait()
+        return query_range(
+            "AAPL", "2024-01-01", "2024-01-05", "news_data", str(tmp_path)
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(work, range(8)))
+
+    assert len(imports) == 1
+    assert all(
+        list(result) == ["2024-01-05", "2024-01-03", "2024-01-01"] for result in results
+    )
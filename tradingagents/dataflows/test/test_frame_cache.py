@@ -0,0 +1,72 @@
+import os
+import threading
+import pandas as pd
+from unittest.mock import Mock
+from tradingagents.dataflows.frame_cache import FrameCache
+
+
+def _write(path, value):
+    pd.DataFrame({"Close": [value]}).to_parquet(path)
+
+
+def test_repeated_loads_are_hits(tmp_path):
+    path = str(tmp_path / "a.parquet")
+    _write(path, 1.0)
+    cache = FrameCache()
+    loader = Mock(side_effect=pd.read_parquet)
+
+    first = cache.get(path, loader)
+    first.loc[0, "Close"] = 99.0  # callers get their own copy
+    second = cache.get(path, loader)
+
+    assert loader.call_count == 1
+    assert second.loc[0, "Close"] == 1.0
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+
+def test_modified_file_is_reloaded(tmp_path):
+    path = str(tmp_path / "a.parquet")
+    _write(path, 1.0)
+    cache = FrameCache()
+    cache.get(path, pd.read_parquet)
+
+    _write(path, 2.0)
+    os.utime(path, (0, 0))
+    assert cache.get(path, pd.read_parquet).loc[0, "Close"] == 2.0
+    assert cache.stats()["misses"] == 2
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    paths = [str(tmp_path / f"{name}.parquet") for name in "abc"]
+    for path in paths:
+        _write(path, 1.0)
+    cache = FrameCache(max_entries=2)
+    cache.get(paths[0], pd.read_parquet)
+    cache.get(paths[1], pd.read_parquet)
+    cache.get(paths[0], pd.read_parquet)
+    cache.get(paths[2], pd.read_parquet)  # evicts paths[1]
+
+    cache.get(paths[0], pd.read_parquet)
+    cache.get(paths[1], pd.read_parquet)
+    assert cache.stats() == {"hits": 2, "misses": 4, "evictions": 2, "size": 2}
+
+
+def test_concurrent_readers(tmp_path):
+    path = str(tmp_path / "a.parquet")
+    _write(path, 1.0)
+    cache = FrameCache()
+    results = []
+
+    def read():
+        for _ in range(50):
+            results.append(cache.get(path, pd.read_parquet).loc[0, "Close"])
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [1.0] * 400
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 400 and stats["size"] == 1
@@ -0,0 +1,130 @@
+import os
+import pandas as pd
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.fundamentals_store import (
+    fundamentals_store_dir,
+    get_latest_statement,
+    simfin_csv_path,
+)
+
+
+def _write_balance_csv(data_dir, statement="balance_sheet"):
+    path = simfin_csv_path(statement, "quarterly", str(data_dir))
+    os.makedirs(os.path.dirname(path))
+    pd.DataFrame(
+        {
+            "Ticker": ["AAPL", "MSFT", "AAPL", "AAPL", "MSFT"],
+            "SimFinId": [1, 2, 1, 1, 2],
+            "Report Date": [
+                "2023-12-31",
+                "2023-12-31",
+                "2023-09-30",
+                "2024-03-31",
+                "2024-03-31",
+            ],
+            "Publish Date": [
+                "2024-02-02",
+                "2024-01-30",
+                "2023-11-03",
+                "2024-05-03",
+                "2024-04-25",
+            ],
+            "Total Assets": [100, 200, 90, 110, 210],
+        }
+    ).to_csv(path, sep=";", index=False)
+    return path
+
+
+def test_as_of_lookup(tmp_path):
+    _write_balance_csv(tmp_path)
+    latest = get_latest_statement(
+        "AAPL", "balance_sheet", "quarterly", "2024-05-02", str(tmp_path)
+    )
+    assert latest["Total Assets"] == 100
+    assert latest.name == 0  # row label of the original file
+    latest = get_latest_statement(
+        "AAPL", "balance_sheet", "quarterly", "2024-05-03", str(tmp_path)
+    )
+    assert latest["Total Assets"] == 110
+    assert (
+        get_latest_statement(
+            "AAPL", "balance_sheet", "quarterly", "2023-11-02", str(tmp_path)
+        )
+        is None
+    )
+    assert (
+        get_latest_statement(
+            "TSLA", "balance_sheet", "quarterly", "2024-05-03", str(tmp_path)
+        )
+        is None
+    )
+    store_dir = fundamentals_store_dir("balance_sheet", "quarterly", str(tmp_path))
+    assert sorted(os.listdir(store_dir)) == ["AAPL.parquet", "MSFT.parquet", "_BUILT"]
+
+
+def test_store_is_rebuilt_when_csv_changes(tmp_path):
+    csv_path = _write_balance_csv(tmp_path)
+    get_latest_statement(
+        "AAPL", "balance_sheet", "quarterly", "2024-06-01", str(tmp_path)
+    )
+
+    df = pd.read_csv(csv_path, sep=";")
+    df.loc[3, "Total Assets"] = 120
+    df.to_csv(csv_path, sep=";", index=False)
+    os.utime(csv_path, (os.path.getmtime(csv_path) + 10,) * 2)
+
+    latest = get_latest_statement(
+        "AAPL", "balance_sheet", "quarterly", "2024-06-01", str(tmp_path)
+    )
+    assert latest["Total Assets"] == 120
+
+
+def test_get_simfin_balance_sheet_matches_full_scan(tmp_path, monkeypatch):
+    """The store returns the same report as filtering the whole CSV."""
+    csv_path = _write_balance_csv(tmp_path)
+    monkeypatch.setattr(interface, "DATA_DIR", str(tmp_path))
+
+    df = pd.read_csv(csv_path, sep=";")
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+    curr_date_dt = pd.to_datetime("2024-03-01", utc=True).normalize()
+    filtered = df[(df["Ticker"] == "AAPL") & (df["Publish Date"] <= curr_date_dt)]
+    expected = filtered.loc[filtered["Publish Date"].idxmax()].drop("SimFinId")
+
+    result = interface.get_simfin_balance_sheet("AAPL", "quarterly", "2024-03-01")
+    assert result.startswith(
+        "## quarterly balance sheet for AAPL released on 2024-02-02: \n"
+        + str(expected)
+        + "\n\n"
+    )
+    assert interface.get_simfin_balance_sheet("AAPL", "quarterly", "2023-01-01") == ""
+
+
+def test_get_simfin_statements_batch(tmp_path, monkeypatch):
+    """Every pair gets the same statement as the single-pair lookup."""
+    for statement in ("balance_sheet", "cashflow", "income"):
+        _write_balance_csv(tmp_path, statement)
+    monkeypatch.setattr(interface, "DATA_DIR", str(tmp_path))
+    pairs = pd.DataFrame(
+        {
+            "ticker": ["MSFT", "AAPL", "AAPL", "TSLA", "AAPL"],
+            "date": [
+                "2024-05-01",
+                "2024-05-03",
+                "2023-01-01",
+                "2024-05-03",
+                "2024-02-02",
+            ],
+        },
+        index=list("abcde"),
+    )
+    batch = interface.get_simfin_statements_batch(pairs, "quarterly")
+
+    assert set(batch) == {"balance_sheet", "cashflow", "income"}
+    balance = batch["balance_sheet"]
+    assert list(balance.index) == list("abcde")
+    assert "SimFinId" not in balance.columns
+    assert balance["Total Assets"].tolist()[:2] == [210, 110]
+    assert balance.loc[["c", "d"], "Total Assets"].isna().all()
+    assert balance.loc["e", "Total Assets"] == 100
+    assert batch["income"].equals(balance)
@@ -0,0 +1,74 @@
+import threading
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+from tradingagents.dataflows import googlenews_utils, response_cache
+from tradingagents.dataflows.googlenews_utils import getNewsData, getNewsData_api
+
+
+@pytest.fixture(autouse=True)
+def no_response_cache():
+    with patch.object(response_cache, "get_response_cache", return_value=None):
+        yield
+
+
+def _newsapi_response(page, total):
+    start = (page - 1) * 100
+    articles = [
+        {"title": f"article {i}", "url": f"u{i}", "source": {"name": "s"}}
+        for i in range(start, min(start + 100, total))
+    ]
+    return SimpleNamespace(
+        status_code=200,
+        text="",
+        json=lambda: {"totalResults": total, "articles": articles},
+    )
+
+
+def test_newsapi_pages_after_the_first_are_fetched_concurrently():
+    # pages 2 and 3 must be in flight together to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    requested = []
+
+    def fake_get(vendor, url, params):
+        assert vendor == "newsapi"
+        requested.append(params["page"])
+        if params["page"] > 1:
+            barrier.wait()
+        return _newsapi_response(params["page"], total=250)
+
+    with patch.object(googlenews_utils.http_client, "get", side_effect=fake_get):
+        results = getNewsData_api("AAPL", "2024-01-01", "2024-01-08")
+
+    assert sorted(requested) == [1, 2, 3]
+    assert [r["title"] for r in results] == [f"article {i}" for i in range(250)]
+
+
+def _google_page(page, last_page):
+    items = "".join(
+        f'<div class="SoaBEf"><a href="l{page}-{i}"></a>'
+        f'<div class="MBeuO">title {page}-{i}</div><div class="GI74Re">s</div>'
+        f'<div class="LfVVr">d</div><div class="NUnG9d"><span>src</span></div></div>'
+        for i in range(2)
+    )
+    next_link = '<a id="pnnext" href="#">Next</a>' if page < last_page else ""
+    return SimpleNamespace(content=f"<html>{items}{next_link}</html>".encode())
+
+
+def test_google_pages_stop_at_the_last_page():
+    requested = []
+
+    def fake_request(url, headers):
+        page = int(parse_qs(urlparse(url).query)["start"][0]) // 10
+        requested.append(page)
+        return _google_page(page, last_page=4)
+
+    with patch.object(googlenews_utils, "make_request", side_effect=fake_request):
+        results = getNewsData("AAPL", "2024-01-01", "2024-01-08")
+
+    assert [r["title"] for r in results] == [
+        f"title {page}-{i}" for page in range(5) for i in range(2)
+    ]
+    # no request is spent past the last page
+    assert requested == list(range(5))
@@ -0,0 +1,98 @@
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from tradingagents.dataflows import http_client
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so pooled connections are reused
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.clients.add(self.client_address)
+            rate_limited = server.throttle > 0
+            server.throttle -= 1
+        status, body = (429, b"slow down") if rate_limited else (200, b'{"ok": 1}')
+        self.send_response(status)
+        if rate_limited:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.clients = set()
+    server.throttle = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}/news"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def stub_vendor():
+    http_client.set_rate_limit("stub", rate=1000, capacity=1000)
+    http_client.http_metrics.reset()
+    yield "stub"
+
+
+def test_requests_reuse_pooled_connections(stub_server):
+    server, url = stub_server
+    for _ in range(5):
+        response = http_client.get("stub", url)
+        assert response.json() == {"ok": 1}
+
+    assert server.requests == 5
+    assert len(server.clients) == 1
+    assert http_client.get_session("stub") is http_client.get_session("stub")
+
+
+def test_429_is_retried_and_recorded(stub_server):
+    server, url = stub_server
+    server.throttle = 2
+
+    response = http_client.get("stub", url, backoff_base=0.001)
+    assert response.status_code == 200
+    assert server.requests == 3
+
+    stats = http_client.http_metrics.stats("stub")
+    assert stats["requests"] == 3
+    assert stats["rate_limited"] == 2
+    assert 0 < stats["p50_latency"] <= stats["max_latency"]
+
+
+def test_retries_give_up_with_the_last_response(stub_server):
+    server, url = stub_server
+    server.throttle = 10
+
+    response = http_client.get("stub", url, max_retries=1, backoff_base=0.001)
+    assert response.status_code == 429
+    assert server.requests == 2
+
+
+def test_vendor_bucket_is_shared_across_threads(stub_server):
+    server, url = stub_server
+    http_client.set_rate_limit("stub", rate=50, capacity=1)
+
+    threads = [
+        threading.Thread(target=http_client.get, args=("stub", url)) for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 5 of the 6 requests had to wait for a token refilled at 50 per second
+    assert server.requests == 6
+    assert http_client.http_metrics.stats("stub")["throttle_wait"] >= 0.09
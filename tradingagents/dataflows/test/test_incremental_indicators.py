@@ -0,0 +1,63 @@
+import json
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from tradingagents.dataflows.indicator_store import compute_indicator_matrix
+from tradingagents.dataflows.incremental_indicators import (
+    INCREMENTAL_INDICATORS,
+    IncrementalIndicators,
+    checkpoint_path,
+    save_checkpoint,
+    update_indicators,
+)
+
+
+def _prices(days=400):
+    rng = np.random.default_rng(1)
+    dates = pd.bdate_range("2023-01-02", periods=days, name="Date")
+    close = 100 + np.cumsum(rng.normal(0, 1, days))
+    return pd.DataFrame(
+        {
+            "Open": close + rng.normal(0, 0.3, days),
+            "High": close + rng.uniform(0.1, 2, days),
+            "Low": close - rng.uniform(0.1, 2, days),
+            "Close": close,
+            "Volume": rng.integers(1_000, 1_000_000, days),
+        },
+        index=dates,
+    )
+
+
+def test_incremental_matches_stockstats():
+    """Advancing bar by bar reproduces the stockstats values on every bar."""
+    data = _prices()
+    expected = compute_indicator_matrix(data)[INCREMENTAL_INDICATORS]
+    actual = IncrementalIndicators("AAPL").update_frame(data)
+    pd.testing.assert_frame_equal(actual, expected, rtol=1e-9, check_freq=False)
+
+
+def test_update_indicators_resumes_from_checkpoint(tmp_path):
+    """A daily run only processes the bars after the checkpoint."""
+    data = _prices()
+    first = update_indicators("AAPL", data.iloc[:-5], str(tmp_path))
+    assert len(first) == len(data) - 5
+    assert (tmp_path / "AAPL-indicator-state.json").exists()
+    assert checkpoint_path("AAPL", str(tmp_path)).endswith(".json")
+
+    # the full history is passed again, only the five new bars are computed
+    tail = update_indicators("AAPL", data, str(tmp_path))
+    assert list(tail.index) == list(data.index[-5:])
+    expected = compute_indicator_matrix(data)[INCREMENTAL_INDICATORS].iloc[-5:]
+    pd.testing.assert_frame_equal(tail, expected, rtol=1e-9, check_freq=False)
+
+    assert update_indicators("AAPL", data, str(tmp_path)).empty
+
+
+def test_concurrent_checkpoint_saves(tmp_path):
+    engine = IncrementalIndicators("AAPL")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: save_checkpoint(engine, str(tmp_path)), range(32)))
+
+    with open(checkpoint_path("AAPL", str(tmp_path))) as f:
+        assert json.load(f)["symbol"] == "AAPL"
+    assert len(list(tmp_path.iterdir())) == 1
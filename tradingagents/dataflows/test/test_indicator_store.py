@@ -0,0 +1,70 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.indicator_store import (
+    SUPPORTED_INDICATORS,
+    build_all_indicator_matrices,
+    get_indicator_window,
+    indicator_matrix_path,
+)
+from tradingagents.dataflows.price_store import price_csv_path
+from tradingagents.dataflows.stockstats_utils import StockstatsUtils
+
+
+@pytest.fixture
+def price_dir(tmp_path):
+    """A data dir holding a year of synthetic business-day prices for AAPL."""
+    price_dir = tmp_path / "market_data" / "price_data"
+    price_dir.mkdir(parents=True)
+    dates = pd.bdate_range("2023-01-02", "2024-01-31")
+    rng = np.random.default_rng(1)
+    close = 100 + np.cumsum(rng.normal(0, 1, len(dates)))
+    pd.DataFrame(
+        {
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Open": close - 0.5,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(1_000, 10_000, len(dates)),
+        }
+    ).to_csv(price_csv_path("AAPL", str(price_dir)), index=False)
+    return price_dir
+
+
+def test_indicator_matrix_matches_stockstats(price_dir):
+    """Every precomputed column equals the on-demand stockstats computation."""
+    assert build_all_indicator_matrices(str(price_dir)) == ["AAPL"]
+    for indicator in SUPPORTED_INDICATORS:
+        expected = StockstatsUtils.get_stock_stats_window(
+            "AAPL", indicator, "2023-12-01", "2024-01-31", str(price_dir)
+        )
+        looked_up = get_indicator_window(
+            "AAPL", indicator, "2023-12-01", "2024-01-31", str(price_dir)
+        )
+        pd.testing.assert_series_equal(looked_up, expected, check_names=False)
+
+
+def test_indicator_matrix_rebuilt_when_prices_change(price_dir):
+    get_indicator_window("AAPL", "rsi", "2024-01-02", "2024-01-31", str(price_dir))
+    matrix_path = indicator_matrix_path("AAPL", str(price_dir))
+    os.utime(matrix_path, (0, 0))
+    get_indicator_window("AAPL", "rsi", "2024-01-02", "2024-01-31", str(price_dir))
+    assert os.path.getmtime(matrix_path) > 0
+
+
+def test_get_stock_stats_indicators_window_uses_matrix(price_dir, monkeypatch):
+    """The report tool looks values up without recomputing the indicator."""
+    monkeypatch.setattr(interface, "DATA_DIR", str(price_dir.parent.parent))
+    build_all_indicator_matrices(str(price_dir))
+    with patch.object(
+        StockstatsUtils, "load_stock_data", side_effect=AssertionError
+    ) as mock_load:
+        result = interface.get_stock_stats_indicators_window(
+            "AAPL", "macd", "2024-01-14", 10, False
+        )
+    mock_load.assert_not_called()
+    assert "2024-01-12: " in result
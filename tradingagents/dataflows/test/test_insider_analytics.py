@@ -0,0 +1,71 @@
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.insider_analytics import (
+    TRANSACTION_KEY,
+    dedupe_entries,
+    summarize_insider_transactions,
+)
+
+
+def _trade(name, date, change, price, code="S", filing_id="f1"):
+    return {
+        "id": filing_id,
+        "name": name,
+        "filingDate": date,
+        "transactionDate": date,
+        "transactionCode": code,
+        "change": change,
+        "share": 1000 + change,
+        "transactionPrice": price,
+        "isDerivative": False,
+        "symbol": "AAPL",
+    }
+
+
+TRADES = {
+    "2024-01-03": [
+        _trade("COOK TIMOTHY", "2024-01-03", -100, 180.0),
+        _trade("COOK TIMOTHY", "2024-01-03", -100, 180.0),
+    ],
+    # the same filing reappears on the next day of the formatted file
+    "2024-01-04": [
+        _trade("COOK TIMOTHY", "2024-01-03", -100, 180.0),
+        _trade("ADAMS KATHERINE", "2024-01-04", 50, 0.0, code="A", filing_id="f2"),
+    ],
+    "2024-02-01": [_trade("COOK TIMOTHY", "2024-02-01", 20, 190.0, code="P")],
+}
+
+
+def test_dedupe_entries_keeps_first_occurrences():
+    entries = dedupe_entries(TRADES, TRANSACTION_KEY)
+    assert [(entry["name"], entry["change"]) for entry in entries] == [
+        ("COOK TIMOTHY", -100),
+        ("ADAMS KATHERINE", 50),
+        ("COOK TIMOTHY", 20),
+    ]
+
+
+def test_summarize_insider_transactions():
+    summary = summarize_insider_transactions(dedupe_entries(TRADES, TRANSACTION_KEY))
+    by_insider = summary["by_insider"]
+    assert list(by_insider.index) == ["COOK TIMOTHY", "ADAMS KATHERINE"]
+    cook = by_insider.loc["COOK TIMOTHY"]
+    assert (cook["transactions"], cook["buys"], cook["sells"]) == (2, 1, 1)
+    assert cook["net_shares"] == -80
+    assert cook["net_value"] == -100 * 180.0 + 20 * 190.0
+    assert cook["last_transaction"] == "2024-02-01"
+
+    by_month = summary["by_month"]
+    assert list(by_month.index) == ["2024-01", "2024-02"]
+    assert by_month.loc["2024-01", "net_shares"] == -50
+
+
+def test_insider_transactions_report_is_a_summary(monkeypatch):
+    monkeypatch.setattr(interface, "get_data_in_range", lambda *args: TRADES)
+    report = interface.get_finnhub_company_insider_transactions(
+        "AAPL", "2024-02-05", 60
+    )
+    assert report.startswith(
+        "## AAPL insider transactions from 2023-12-07 to 2024-02-05:"
+    )
+    assert "### By insider:" in report and "### By month:" in report
+    assert report.count("COOK TIMOTHY") == 1
@@ -1,34 +1,59 @@
 import pytest
+import pandas as pd
 from unittest.mock import patch, MagicMock
 from tradingagents.dataflows import interface
 
 
-@patch("tradingagents.dataflows.interface.fetch_top_from_category")
+def _window_of(posts):
+    """fetch_top_from_category_window stand-in returning the posts every day."""
+
+    def window(category, start_date, end_date, max_limit, queries, data_path):
+        dates = pd.date_range(start_date, end_date).strftime("%Y-%m-%d")
+        return {(query, date): posts for query in queries for date in dates}
+
+    return window
+
+
+@patch("tradingagents.dataflows.interface.fetch_top_from_category_window")
 def test_get_reddit_global_news_empty(mock_fetch):
     """
     Test get_reddit_global_news returns an empty string if no posts are found.
     """
-    mock_fetch.return_value = []
+    mock_fetch.side_effect = _window_of([])
     result = interface.get_reddit_global_news("2024-06-20", 1, 5)
     assert result == ""
 
 
-@patch("tradingagents.dataflows.interface.fetch_top_from_category")
+@patch("tradingagents.dataflows.interface.fetch_top_from_category_window")
 def test_get_reddit_global_news_with_posts(mock_fetch):
     """
     Test get_reddit_global_news returns a formatted string if posts exist.
     """
-    mock_fetch.return_value = [
-        {"title": "Headline 1", "content": "Some news content."},
-        {"title": "Headline 2", "content": ""},
-    ]
+    mock_fetch.side_effect = _window_of(
+        [
+            {"title": "Headline 1", "content": "Some news content."},
+            {"title": "Headline 2", "content": ""},
+        ]
+    )
     result = interface.get_reddit_global_news("2024-06-20", 1, 5)
+    # the subreddit files are scanned once for the whole window
+    mock_fetch.assert_called_once()
     assert isinstance(result, str)
     assert "Headline 1" in result
     assert "Some news content." in result
     assert "Headline 2" in result
 
 
+@patch("tradingagents.dataflows.interface.fetch_top_from_category_window")
+def test_get_reddit_company_news_reads_each_day_of_one_window(mock_fetch):
+    mock_fetch.side_effect = _window_of([{"title": "NVDA beats", "content": ""}])
+    result = interface.get_reddit_company_news("NVDA", "2024-06-20", 2, 6)
+    assert "### NVDA beats [reported 3 times]" in result
+    mock_fetch.assert_called_once()
+    category, start_date, end_date, max_limit, queries = mock_fetch.call_args.args
+    assert (start_date, end_date, queries) == ("2024-06-18", "2024-06-20", ["NVDA"])
+
+
 def test_get_finnhub_news_online():
     result = interface.get_finnhub_news_online("AAPL", "2025-06-20", 5)
     print(result)
@@ -0,0 +1,92 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from tradingagents.dataflows import mention_matcher
+from tradingagents.dataflows.mention_matcher import (
+    MentionMatcher,
+    load_mention_index,
+    mention_index_path,
+)
+from tradingagents.dataflows.reddit_utils import (
+    COMPANY_MATCHER,
+    fetch_top_from_category,
+)
+from tradingagents.dataflows.test.test_reddit_index import _post, _write_jsonl
+
+
+def test_aliases_match_whole_words_only():
+    matcher = MentionMatcher({"INTC": ["Intel"], "V": ["Visa", "V"]})
+    assert matcher.mentions("Intel beats estimates") == {"INTC"}
+    assert matcher.mentions("Artificial intelligence is everywhere") == set()
+    assert matcher.mentions("Buying a TV with my VISA card") == {"V"}
+
+
+def test_aliases_are_literal_and_case_insensitive():
+    matcher = MentionMatcher({"SNAP": ["Snap Inc."]})
+    assert matcher.mentions("snap inc. layoffs") == {"SNAP"}
+    assert matcher.mentions("Snap Inc, layoffs") == set()
+    assert COMPANY_MATCHER.mentions("johnson & johnson talc") == {"JNJ"}
+
+
+def test_one_scan_tags_every_ticker():
+    post = _post("Apple vs Microsoft", "2024-01-01", 1, 3, selftext="and NVDA")
+    assert COMPANY_MATCHER.mentions_post(post) == {"AAPL", "MSFT", "NVDA"}
+
+
+def test_company_filter_is_a_lookup_in_the_persisted_index(tmp_path):
+    posts = [
+        _post("Apple and Meta", "2024-01-01", 1, 5),
+        _post("Pineapple prices", "2024-01-01", 2, 9),
+        _post("Facebook rebrand", "2024-01-01", 3, 1),
+        _post("Apple again", "2024-01-02", 1, 2),
+    ]
+    _write_jsonl(str(tmp_path / "company_news" / "stocks.jsonl"), posts)
+
+    titles = [
+        post["title"]
+        for post in fetch_top_from_category(
+            "company_news", "2024-01-01", 10, "META", data_path=str(tmp_path)
+        )
+    ]
+    assert titles == ["Apple and Meta", "Facebook rebrand"]
+
+    path = mention_index_path(str(tmp_path), "company_news", "stocks.jsonl")
+    with open(path) as f:
+        index = json.load(f)
+    assert index["days"]["2024-01-01"]["AAPL"] == [0]
+    assert index["days"]["2024-01-02"]["AAPL"] == [0]
+
+    # the persisted index is reused, posts are not tagged again
+    mention_index = load_mention_index(
+        str(tmp_path), "company_news", "stocks.jsonl", COMPANY_MATCHER
+    )
+    mention_matcher._loaded_mention_indexes.clear()
+    with patch.object(mention_matcher, "build_mention_index") as build:
+        assert (
+            load_mention_index(
+                str(tmp_path), "company_news", "stocks.jsonl", COMPANY_MATCHER
+            )
+            == mention_index
+        )
+    build.assert_not_called()
+
+
+def test_concurrent_loads_build_the_mention_index_once(tmp_path):
+    _write_jsonl(
+        str(tmp_path / "company_news" / "stocks.jsonl"),
+        [_post("Apple and Meta", "2024-01-01", 1, 5)],
+    )
+    build = mention_matcher.build_mention_index
+    with patch.object(mention_matcher, "build_mention_index", side_effect=build) as spy:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            indexes = list(
+                pool.map(
+                    lambda _: load_mention_index(
+                        str(tmp_path), "company_news", "stocks.jsonl", COMPANY_MATCHER
+                    ),
+                    range(16),
+                )
+            )
+
+    assert spy.call_count == 1
+    assert all(index["days"]["2024-01-01"]["META"] == [0] for index in indexes)
@@ -0,0 +1,56 @@
+from unittest.mock import patch
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.news_dedup import (
+    collapse_near_duplicates,
+    minhash,
+    story_suffix,
+)
+
+STORY = (
+    "Apple shares rose on Thursday after the company reported quarterly revenue "
+    "above analyst estimates, driven by strong iPhone sales in China and record "
+    "services income"
+)
+
+
+def test_syndicated_copies_collapse_with_their_sources():
+    items = [
+        {"headline": STORY, "source": "Reuters"},
+        {"headline": "Nvidia unveils a new data center GPU", "source": "Reuters"},
+        {
+            "headline": "UPDATE 1 - " + STORY.replace("Thursday", "Thu"),
+            "source": "Yahoo",
+        },
+        {"headline": STORY + ".", "source": "Reuters"},
+    ]
+    stories = collapse_near_duplicates(
+        items, lambda item: item["headline"], lambda item: item["source"]
+    )
+
+    assert [story["item"] for story in stories] == items[:2]
+    assert [story["count"] for story in stories] == [3, 1]
+    assert stories[0]["sources"] == ["Reuters", "Yahoo"]
+    assert story_suffix(stories[0]) == " [reported 3 times: Reuters, Yahoo]"
+    assert story_suffix(stories[1]) == ""
+
+
+def test_distinct_and_empty_items_are_kept():
+    items = [{"t": ""}, {"t": ""}, {"t": "Fed holds rates"}, {"t": "ECB cuts rates"}]
+    stories = collapse_near_duplicates(items, lambda item: item["t"])
+    assert [story["count"] for story in stories] == [1, 1, 1, 1]
+    assert minhash("") is None
+
+
+def test_reddit_news_is_collapsed(tmp_path):
+    posts = [
+        {"title": STORY, "content": ""},
+        {"title": "Oil falls on demand worries", "content": "Brent dropped 2%."},
+    ]
+    window = {(None, "2024-06-19"): posts, (None, "2024-06-20"): posts}
+    with patch.object(interface, "fetch_top_from_category_window", return_value=window):
+        # the same posts are returned for both days of the window
+        result = interface.get_reddit_global_news("2024-06-20", 1, 5)
+
+    assert result.count(STORY) == 1
+    assert f"### {STORY} [reported 2 times]" in result
+    assert result.count("Oil falls on demand worries") == 1
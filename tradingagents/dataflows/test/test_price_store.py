@@ -0,0 +1,168 @@
+import os
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from unittest.mock import patch
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.price_store import (
+    convert_all_price_csvs,
+    load_online_price_data,
+    load_price_data,
+    online_cache_path,
+    price_csv_path,
+    price_parquet_path,
+    slice_price_data,
+    write_parquet_atomic,
+)
+
+
+def _write_price_csv(price_dir, symbol="AAPL"):
+    pd.DataFrame(
+        {
+            "Date": [
+                "2024-01-03 00:00:00-05:00",
+                "2024-01-02 00:00:00-05:00",
+                "2024-01-04 00:00:00-05:00",
+            ],
+            "Open": [1.0, 2.0, 3.0],
+            "High": [1.5, 2.5, 3.5],
+            "Low": [0.5, 1.5, 2.5],
+            "Close": [1.2, 2.2, 3.2],
+            "Volume": [100, 200, 300],
+        }
+    ).to_csv(price_csv_path(symbol, str(price_dir)), index=False)
+
+
+def test_load_price_data_converts_to_parquet(tmp_path):
+    """The first load converts the CSV and returns a sorted DatetimeIndex."""
+    _write_price_csv(tmp_path)
+    data = load_price_data("AAPL", str(tmp_path))
+    assert isinstance(data.index, pd.DatetimeIndex)
+    assert data.index.is_monotonic_increasing
+    assert list(data["Open"]) == [2.0, 1.0, 3.0]
+    assert os.path.exists(price_parquet_path("AAPL", str(tmp_path)))
+
+
+def test_concurrent_parquet_writes_and_conversion(tmp_path):
+    _write_price_csv(tmp_path)
+    data = load_price_data("AAPL", str(tmp_path))
+    os.remove(price_parquet_path("AAPL", str(tmp_path)))
+    target = str(tmp_path / "shared.parquet")
+
+    def work(_):
+        for _ in range(10):
+            write_parquet_atomic(data, target)
+        return load_price_data("AAPL", str(tmp_path))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(work, range(8)))
+
+    assert all(result.equals(data) for result in results)
+    assert pd.read_parquet(target).equals(data)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_load_price_data_reads_parquet_without_csv(tmp_path):
+    """Once converted, the store does not need the CSV anymore."""
+    _write_price_csv(tmp_path)
+    assert convert_all_price_csvs(str(tmp_path)) == ["AAPL"]
+    os.remove(price_csv_path("AAPL", str(tmp_path)))
+    data = load_price_data("AAPL", str(tmp_path))
+    assert len(data) == 3
+
+
+def test_load_price_data_missing_symbol(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_price_data("MSFT", str(tmp_path))
+
+
+def test_slice_price_data_is_inclusive(tmp_path):
+    _write_price_csv(tmp_path)
+    window = slice_price_data(
+        load_price_data("AAPL", str(tmp_path)), "2024-01-02", "2024-01-03"
+    )
+    assert list(window["Date"]) == ["2024-01-02", "2024-01-03"]
+    window = slice_price_data(
+        load_price_data("AAPL", str(tmp_path)), "2024-01-03", "2024-01-06"
+    )
+    # rows keep their position in the price history, as in the raw CSV
+    assert list(window.index) == [1, 2]
+    assert list(window["Date"]) == ["2024-01-03", "2024-01-04"]
+
+
+def test_get_YFin_data_reads_from_store(tmp_path, monkeypatch):
+    price_dir = tmp_path / "market_data" / "price_data"
+    price_dir.mkdir(parents=True)
+    _write_price_csv(price_dir)
+    monkeypatch.setattr(interface, "DATA_DIR", str(tmp_path))
+    result = interface.get_YFin_data("AAPL", "2024-01-03", "2024-01-04")
+    assert list(result["Date"]) == ["2024-01-03", "2024-01-04"]
+    assert list(result["Close"]) == [1.2, 3.2]
+    assert list(result.index) == [0, 1]
+
+
+def _bars(start, end, factor=1.0):
+    # prices depend on the date only, so overlapping downloads agree
+    dates = pd.bdate_range(start, end, name="Date")
+    close = dates.dayofyear.to_numpy(dtype=float) * factor
+    return pd.DataFrame({"Close": close, "Volume": 100}, index=dates)
+
+
+@patch("tradingagents.dataflows.price_store.yf")
+def test_load_online_price_data_fetches_only_the_tail(mock_yf, tmp_path):
+    """The history is downloaded once, later days only request the missing bars."""
+    mock_yf.download.return_value = _bars("2024-01-01", "2024-01-09")
+    data = load_online_price_data("AAPL", str(tmp_path), today="2024-01-10")
+    assert data.index[-1] == pd.Timestamp("2024-01-09")
+    assert mock_yf.download.call_args.kwargs["start"] == "2009-01-10"
+
+    # same day: served from the cache without a request
+    load_online_price_data("AAPL", str(tmp_path), today="2024-01-10")
+    assert mock_yf.download.call_count == 1
+
+    # next day: only the bars from the last cached one on are requested
+    os.utime(online_cache_path("AAPL", str(tmp_path)), (0, 0))
+    mock_yf.download.return_value = _bars("2024-01-09", "2024-01-10")
+    data = load_online_price_data("AAPL", str(tmp_path), today="2024-01-11")
+    assert mock_yf.download.call_count == 2
+    assert mock_yf.download.call_args.kwargs["start"] == "2024-01-09"
+    assert mock_yf.download.call_args.kwargs["end"] == "2024-01-11"
+    assert len(data) == 8
+
+
+@patch("tradingagents.dataflows.price_store.yf")
+def test_load_online_price_data_refetches_after_a_split(mock_yf, tmp_path):
+    """A re-based overlapping bar replaces the whole cached history."""
+    mock_yf.download.return_value = _bars("2024-01-01", "2024-01-09")
+    load_online_price_data("AAPL", str(tmp_path), today="2024-01-10")
+
+    # a 2:1 split halves every adjusted price, the old ones included
+    os.utime(online_cache_path("AAPL", str(tmp_path)), (0, 0))
+    mock_yf.download.side_effect = [
+        _bars("2024-01-09", "2024-01-10", factor=0.5),
+        _bars("2024-01-01", "2024-01-10", factor=0.5),
+    ]
+    data = load_online_price_data("AAPL", str(tmp_path), today="2024-01-11")
+    assert mock_yf.download.call_args.kwargs["start"] == "2009-01-11"
+    pd.testing.assert_frame_equal(
+        data, _bars("2024-01-01", "2024-01-10", factor=0.5), check_freq=False
+    )
+
+
+@patch("tradingagents.dataflows.price_store.yf")
+def test_load_online_price_data_merges_legacy_files(mock_yf, tmp_path):
+    """Date-stamped cache files from older runs are merged and removed."""
+    # an older download on a stale adjustment basis, and the latest one
+    stale = tmp_path / "AAPL-YFin-data-2009-01-05-2024-01-05.csv"
+    _bars("2024-01-01", "2024-01-05", 2.0).reset_index().to_csv(stale, index=False)
+    legacy = tmp_path / "AAPL-YFin-data-2009-01-09-2024-01-09.csv"
+    _bars("2024-01-01", "2024-01-09").reset_index().to_csv(legacy, index=False)
+    mock_yf.download.return_value = _bars("2024-01-09", "2024-01-10")
+
+    data = load_online_price_data("AAPL", str(tmp_path), today="2024-01-11")
+    assert not legacy.exists() and not stale.exists()
+    assert mock_yf.download.call_count == 1
+    assert mock_yf.download.call_args.kwargs["start"] == "2024-01-09"
+    assert data.index.is_unique and len(data) == 8
+    # the most recent download wins on the dates both files hold
+    assert list(data["Close"]) == list(_bars("2024-01-01", "2024-01-10")["Close"])
@@ -0,0 +1,41 @@
+import threading
+from tradingagents.dataflows.rate_limit import TokenBucket
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_burst_then_refill_rate():
+    clock = _FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert not bucket.try_acquire()
+    assert bucket.acquire() == 0.5
+    assert bucket.acquire(2) == 1.0
+    assert clock.now == 1.5
+
+
+def test_concurrent_acquires_never_exceed_the_budget():
+    bucket = TokenBucket(rate=1000, capacity=5)
+    acquired = []
+
+    def worker():
+        for _ in range(10):
+            bucket.acquire()
+            acquired.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(acquired) == 40
@@ -0,0 +1,122 @@
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import patch
+from tradingagents.dataflows import reddit_index
+from tradingagents.dataflows.reddit_index import (
+    build_reddit_indexes,
+    index_path,
+    load_day_index,
+    read_posts_on_day,
+)
+from tradingagents.dataflows.reddit_utils import fetch_top_from_category
+
+
+def _post(title, day, hour, ups, selftext=""):
+    created = datetime.strptime(day, "%Y-%m-%d").replace(hour=hour, tzinfo=timezone.utc)
+    return {
+        "created_utc": created.timestamp(),
+        "title": title,
+        "selftext": selftext,
+        "url": f"https://reddit.com/{title}",
+        "ups": ups,
+    }
+
+
+def _write_jsonl(path, posts):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        for post in posts:
+            f.write(json.dumps(post) + "\n\n")
+
+
+def test_read_posts_on_day_seeks_to_the_day(tmp_path):
+    posts = [
+        _post("a", "2024-01-02", 23, 5),
+        _post("b", "2024-01-03", 0, 7),
+        _post("c", "2024-01-02", 1, 9),
+    ]
+    _write_jsonl(str(tmp_path / "global_news" / "worldnews.jsonl"), posts)
+
+    titles = [
+        post["title"]
+        for post in read_posts_on_day(
+            str(tmp_path), "global_news", "worldnews.jsonl", "2024-01-02"
+        )
+    ]
+    assert titles == ["a", "c"]
+    assert os.path.exists(index_path(str(tmp_path), "global_news", "worldnews.jsonl"))
+    assert not list(
+        read_posts_on_day(str(tmp_path), "global_news", "worldnews.jsonl", "2024-01-04")
+    )
+
+
+def test_index_is_rebuilt_when_the_file_changes(tmp_path):
+    path = str(tmp_path / "global_news" / "worldnews.jsonl")
+    _write_jsonl(path, [_post("a", "2024-01-02", 1, 5)])
+    assert build_reddit_indexes(str(tmp_path)) == [
+        os.path.join("global_news", "worldnews.jsonl")
+    ]
+
+    _write_jsonl(path, [_post("a", "2024-01-02", 1, 5), _post("b", "2024-01-02", 2, 1)])
+    titles = [
+        post["title"]
+        for post in read_posts_on_day(
+            str(tmp_path), "global_news", "worldnews.jsonl", "2024-01-02"
+        )
+    ]
+    assert titles == ["a", "b"]
+
+
+def test_concurrent_loads_build_the_index_once(tmp_path):
+    _write_jsonl(
+        str(tmp_path / "company_news" / "stocks.jsonl"),
+        [_post("a", "2024-01-02", 1, 5)],
+    )
+    path = index_path(str(tmp_path), "company_news", "stocks.jsonl")
+    os.makedirs(os.path.dirname(path))
+    with open(path, "w") as f:
+        f.write('{"signature": [1,')  # left over by an interrupted write
+
+    build = reddit_index.build_day_index
+    with patch.object(reddit_index, "build_day_index", side_effect=build) as spy:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            indexes = list(
+                pool.map(
+                    lambda _: load_day_index(
+                        str(tmp_path), "company_news", "stocks.jsonl"
+                    ),
+                    range(16),
+                )
+            )
+
+    assert spy.call_count == 1
+    assert all(index["days"] == {"2024-01-02": [0]} for index in indexes)
+    assert os.listdir(os.path.dirname(path)) == ["stocks.jsonl.idx.json"]
+
+
+def test_fetch_top_from_category_uses_the_index(tmp_path):
+    _write_jsonl(
+        str(tmp_path / "company_news" / "stocks.jsonl"),
+        [
+            _post("Apple beats", "2024-01-02", 10, 3),
+            _post("Tesla misses", "2024-01-02", 11, 8),
+            _post("AAPL buyback", "2024-01-02", 12, 6, "apple"),
+            _post("Apple old news", "2024-01-01", 12, 60),
+        ],
+    )
+    _write_jsonl(
+        str(tmp_path / "company_news" / "investing.jsonl"),
+        [_post("iPhone sales", "2024-01-02", 9, 4, "Apple Inc.")],
+    )
+    posts = fetch_top_from_category(
+        "company_news", "2024-01-02", 4, "AAPL", data_path=str(tmp_path)
+    )
+    # two files share the limit, the index folder does not count as a subreddit
+    assert sorted(post["title"] for post in posts) == [
+        "AAPL buyback",
+        "Apple beats",
+        "iPhone sales",
+    ]
+    assert all(post["posted_date"] == "2024-01-02" for post in posts)
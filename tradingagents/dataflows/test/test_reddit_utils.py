@@ -0,0 +1,125 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+from tradingagents.dataflows import reddit_utils
+from tradingagents.dataflows.reddit_utils import (
+    fetch_top_from_category,
+    fetch_top_from_category_window,
+)
+from tradingagents.dataflows.test.test_reddit_index import _post, _write_jsonl
+
+DAYS = ["2024-01-01", "2024-01-02", "2024-01-03"]
+
+
+def _write_company_news(data_path):
+    _write_jsonl(
+        str(data_path / "company_news" / "stocks.jsonl"),
+        [
+            _post(f"{company} post {i}", day, i, ups=i * 3 % 7)
+            for day in DAYS
+            for i, company in enumerate(["Apple", "Nvidia", "Microsoft", "Apple"] * 2)
+        ],
+    )
+    _write_jsonl(
+        str(data_path / "company_news" / "investing.jsonl"),
+        [_post("NVDA earnings", day, 5, ups=2) for day in DAYS],
+    )
+
+
+def test_window_matches_per_day_fetch(tmp_path):
+    """Every (ticker, day) gets what the single-day fetcher returns."""
+    _write_company_news(tmp_path)
+    window = fetch_top_from_category_window(
+        "company_news", DAYS[0], DAYS[-1], 4, ["AAPL", "NVDA", "MSFT"], str(tmp_path)
+    )
+    assert set(window) == {(t, d) for t in ["AAPL", "NVDA", "MSFT"] for d in DAYS}
+    for (ticker, day), posts in window.items():
+        assert posts == fetch_top_from_category(
+            "company_news", day, 4, ticker, data_path=str(tmp_path)
+        )
+    assert sorted(post["title"] for post in window[("NVDA", DAYS[1])]) == [
+        "NVDA earnings",
+        "Nvidia post 1",
+        "Nvidia post 5",
+    ]
+
+
+def test_files_are_read_once_per_day(tmp_path):
+    _write_company_news(tmp_path)
+    reddit_utils._cached_posts_on_day.cache_clear()
+
+    with patch.object(
+        reddit_utils, "read_posts_on_day", wraps=reddit_utils.read_posts_on_day
+    ) as read_posts:
+        fetch_top_from_category_window(
+            "company_news", DAYS[0], DAYS[-1], 4, ["AAPL", "NVDA"], str(tmp_path)
+        )
+        assert read_posts.call_count == 2 * len(DAYS)
+
+        # later per-ticker calls are served from the parsed days
+        for day in DAYS:
+            fetch_top_from_category(
+                "company_news", day, 4, "MSFT", data_path=str(tmp_path)
+            )
+        assert read_posts.call_count == 2 * len(DAYS)
+
+
+class _FakeSubreddit:
+    def __init__(self, submissions):
+        self.submissions = submissions
+        self.calls = []
+
+    def top(self, time_filter, limit):
+        self.calls.append((time_filter, limit))
+        return iter(self.submissions[:limit])
+
+
+def test_online_window_pulls_each_subreddit_once():
+    # local-day bounds are used to bucket posts, as in the single-day fetcher
+    def local(day, hour):
+        return datetime.strptime(day, "%Y-%m-%d").replace(hour=hour).timestamp()
+
+    subreddits = {
+        "stocks": _FakeSubreddit(
+            [
+                SimpleNamespace(
+                    created_utc=local(day, hour),
+                    title=f"AAPL {day} {hour}",
+                    selftext="",
+                    url="u",
+                    score=hour,
+                )
+                for day in DAYS
+                for hour in (1, 5, 9)
+            ]
+            + [
+                SimpleNamespace(
+                    created_utc=local(DAYS[0], 3),
+                    title="unrelated",
+                    selftext="",
+                    url="u",
+                    score=99,
+                )
+            ]
+        ),
+        "investing": _FakeSubreddit([]),
+    }
+    client = SimpleNamespace(subreddit=lambda name: subreddits[name])
+
+    with patch.object(reddit_utils, "get_reddit_client", return_value=client):
+        window = reddit_utils.fetch_top_from_category_online_window(
+            "stocks,investing", DAYS[0], DAYS[-1], 4, "AAPL"
+        )
+        single_day = reddit_utils.fetch_top_from_category_online(
+            "stocks,investing", DAYS[1], 4, "AAPL"
+        )
+
+    assert list(window) == DAYS
+    # 4 posts per day split over 2 subreddits, best first
+    assert [post["title"] for post in window[DAYS[0]]] == [
+        f"AAPL {DAYS[0]} 5",
+        f"AAPL {DAYS[0]} 1",
+    ]
+    assert single_day == window[DAYS[1]]
+    assert len(subreddits["stocks"].calls) == 2
+    assert subreddits["stocks"].calls[0][1] == 100 * len(DAYS)
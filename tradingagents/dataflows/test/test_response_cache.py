@@ -0,0 +1,118 @@
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from tradingagents.dataflows import interface, response_cache
+from tradingagents.dataflows.response_cache import ResponseCache, cached_response
+
+
+def _cached_fetcher(cache, calls):
+    @cached_response("finnhub", as_of="end_date")
+    def fetch(ticker, end_date, look_back_days=7):
+        calls.append((ticker, end_date, look_back_days))
+        return [{"ticker": ticker, "end_date": end_date}] if ticker != "NONE" else []
+
+    return fetch
+
+
+def test_equal_calls_share_one_entry(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    calls = []
+    with patch.object(response_cache, "get_response_cache", return_value=cache):
+        fetch = _cached_fetcher(cache, calls)
+        first = fetch("AAPL", "2024-01-05")
+        assert fetch(" AAPL", end_date="2024-01-05", look_back_days=7) == first
+        fetch("AAPL", "2024-01-05", 3)
+        # empty results are not cached
+        fetch("NONE", "2024-01-05")
+        fetch("NONE", "2024-01-05")
+
+    assert len(calls) == 4
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["writes"] == 2
+    assert stats["entries"] == 2
+
+
+def test_windows_reaching_today_expire(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttls={"finnhub": 60})
+    today = date.today().isoformat()
+    assert cache.ttl_for("finnhub", "2024-01-05") is None
+    assert cache.ttl_for("finnhub", today) == 60
+    assert cache.ttl_for("newsapi", (date.today() + timedelta(days=1))) == 3600
+
+    calls = []
+    with patch.object(response_cache, "get_response_cache", return_value=cache):
+        fetch = _cached_fetcher(cache, calls)
+        fetch("AAPL", today)
+        fetch("AAPL", today)
+        assert len(calls) == 1
+        with patch.object(response_cache.time, "time", return_value=time.time() + 120):
+            fetch("AAPL", today)
+    assert len(calls) == 2
+    assert cache.stats()["expired"] == 1
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=250)
+    keys = [cache.make_key("newsapi", "f", {"i": i}) for i in range(3)]
+    for i, key in enumerate(keys[:2]):
+        cache.put(key, "x" * 50, None)
+        os.utime(cache._path(key), (i, i))
+    # reading the oldest entry makes the other one the eviction candidate
+    assert cache.get(keys[0]) == (True, "x" * 50)
+    cache.put(keys[2], "x" * 50, None)
+
+    assert cache.get(keys[0])[0]
+    assert not cache.get(keys[1])[0]
+    assert cache.get(keys[2])[0]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_concurrent_misses_share_one_call(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    release = threading.Event()
+    calls = []
+
+    @cached_response("openai", as_of="curr_date")
+    def search(curr_date):
+        calls.append(curr_date)
+        release.wait(5)
+        return f"news of {curr_date}"
+
+    with patch.object(response_cache, "get_response_cache", return_value=cache):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(search, "2024-01-05") for _ in range(8)]
+            time.sleep(0.1)
+            release.set()
+            results = [future.result() for future in futures]
+        # later callers, e.g. other processes, read the persisted entry
+        assert search("2024-01-05") == "news of 2024-01-05"
+
+    assert calls == ["2024-01-05"]
+    assert results == ["news of 2024-01-05"] * 8
+
+
+def test_global_news_search_is_shared_across_tickers(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    text = SimpleNamespace(text="macro news")
+    client = MagicMock()
+    client.responses.create.return_value = SimpleNamespace(
+        output=[None, SimpleNamespace(content=[text])]
+    )
+
+    with patch.object(
+        response_cache, "get_response_cache", return_value=cache
+    ), patch.object(interface, "get_openai_client", return_value=client):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(
+                    lambda _: interface.get_global_news_openai("2024-01-05"), range(50)
+                )
+            )
+
+    assert results == ["macro news"] * 50
+    assert client.responses.create.call_count == 1
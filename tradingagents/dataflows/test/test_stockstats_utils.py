@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+from tradingagents.dataflows import interface, indicator_store
+from tradingagents.dataflows.price_store import load_price_data, price_csv_path
+from tradingagents.dataflows.stockstats_utils import StockstatsUtils
+
+
+@pytest.fixture
+def price_dir(tmp_path):
+    """A data dir holding a year of synthetic business-day prices for AAPL."""
+    price_dir = tmp_path / "market_data" / "price_data"
+    price_dir.mkdir(parents=True)
+    dates = pd.bdate_range("2023-01-02", "2024-01-31")
+    close = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, len(dates)))
+    pd.DataFrame(
+        {
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Open": close - 0.5,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": 1_000_000,
+        }
+    ).to_csv(price_csv_path("AAPL", str(price_dir)), index=False)
+    return price_dir
+
+
+def test_get_stock_stats_window_matches_single_day(price_dir):
+    """Every value in the window equals the single-day lookup for that date."""
+    window = StockstatsUtils.get_stock_stats_window(
+        "AAPL", "rsi", "2024-01-01", "2024-01-14", str(price_dir)
+    )
+    assert list(window.index) == [
+        d.strftime("%Y-%m-%d") for d in pd.bdate_range("2024-01-01", "2024-01-12")
+    ]
+    for date, value in window.items():
+        assert value == StockstatsUtils.get_stock_stats(
+            "AAPL", "rsi", date, str(price_dir)
+        )
+
+
+def test_get_stock_stats_indicators_window_online_matches_offline(
+    price_dir, monkeypatch
+):
+    """Online and offline paths format the same window identically."""
+    monkeypatch.setattr(interface, "DATA_DIR", str(price_dir.parent.parent))
+    offline = interface.get_stock_stats_indicators_window(
+        "AAPL", "close_10_ema", "2024-01-14", 10, False
+    )
+    cache_dir = str(price_dir.parent / "cache")
+    monkeypatch.setattr(
+        indicator_store, "get_config", lambda: {"data_cache_dir": cache_dir}
+    )
+    monkeypatch.setattr(
+        indicator_store,
+        "load_online_price_data",
+        lambda symbol, _: load_price_data(symbol, str(price_dir)),
+    )
+    online = interface.get_stock_stats_indicators_window(
+        "AAPL", "close_10_ema", "2024-01-14", 10, True
+    )
+    assert online == offline
+    assert "2024-01-12: " in offline
+    assert "2024-01-13" not in offline
@@ -0,0 +1,61 @@
+import pandas as pd
+from datetime import datetime
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.trading_calendar import (
+    TradingCalendar,
+    get_exchange_calendar,
+)
+
+
+def test_exchange_calendar_skips_weekends_and_holidays():
+    calendar = get_exchange_calendar()
+    assert calendar.is_trading_day("2024-06-18")
+    assert not calendar.is_trading_day("2024-06-19")  # Juneteenth
+    assert not calendar.is_trading_day("2024-03-29")  # Good Friday
+    assert not calendar.is_trading_day("2024-06-22")  # Saturday
+    assert not calendar.is_trading_day("2021-12-24")  # Christmas observed
+    assert calendar.is_trading_day("2021-12-31")  # Saturday New Year not observed
+    assert len(calendar.trading_days_between("2024-01-01", "2024-12-31")) == 252
+
+
+def test_neighbour_queries():
+    calendar = get_exchange_calendar()
+    assert calendar.prev_trading_day("2024-07-05") == "2024-07-03"
+    assert calendar.prev_trading_day("2024-07-05", inclusive=True) == "2024-07-05"
+    assert calendar.next_trading_day("2024-07-03") == "2024-07-05"
+    assert calendar.next_trading_day(datetime(2024, 7, 4), inclusive=True) == (
+        "2024-07-05"
+    )
+    assert calendar.trading_days_between("2024-06-15", "2024-06-20") == [
+        "2024-06-17",
+        "2024-06-18",
+        "2024-06-20",
+    ]
+
+
+def test_calendar_from_prices():
+    data = pd.DataFrame(
+        {"Close": [1.0, 2.0, 3.0]},
+        index=pd.to_datetime(["2024-01-05", "2024-01-02", "2024-01-03"]),
+    )
+    calendar = TradingCalendar.from_prices(data)
+    assert calendar.days == ["2024-01-02", "2024-01-03", "2024-01-05"]
+    assert calendar.prev_trading_day("2024-01-02") is None
+    assert calendar.next_trading_day("2024-01-05") is None
+    assert calendar.next_trading_day("2024-01-04") == "2024-01-05"
+
+
+def test_indicator_lookup_skips_holidays(monkeypatch):
+    """Non trading days are answered without loading any price data."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("price data should not be loaded")
+
+    monkeypatch.setattr(interface, "get_indicator_window", fail)
+    assert interface.get_stockstats_indicator("AAPL", "rsi", "2024-12-25", False) == (
+        "N/A: Not a trading day (weekend or holiday)"
+    )
+    window = interface.get_stock_stats_indicators_window(
+        "AAPL", "rsi", "2024-12-25", 0, True
+    )
+    assert window.startswith("## rsi values from 2024-12-25 to 2024-12-25:\n\n\n\n")
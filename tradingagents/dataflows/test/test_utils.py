@@ -35,3 +35,10 @@ def test_get_next_weekday_weekend():
     date = "2024-06-22"  # Saturday
     result = get_next_weekday(date)
     assert result.weekday() == 0  # Monday
+
+
+def test_get_next_weekday_holiday():
+    """Test get_next_weekday skips exchange holidays."""
+    date = "2024-07-04"  # Independence Day
+    result = get_next_weekday(date)
+    assert str(result).startswith("2024-07-05")
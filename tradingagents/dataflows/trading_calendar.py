@@ -0,0 +1,130 @@
+import bisect
+import pandas as pd
+from datetime import datetime
+from functools import lru_cache
+from typing import Annotated, Iterable, List, Optional, Union
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMartinLutherKingJr,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday,
+)
+
+DateLike = Union[str, datetime, pd.Timestamp]
+
+# First year covered by the exchange calendar, the last one is a few years ahead of today
+EXCHANGE_CALENDAR_START = "2000-01-01"
+EXCHANGE_CALENDAR_YEARS_AHEAD = 5
+
+
+class NYSEHolidayCalendar(AbstractHolidayCalendar):
+    """Regular full-day closures of the New York Stock Exchange."""
+
+    rules = [
+        # a New Year's Day falling on Saturday is not observed on the Friday before
+        Holiday("New Year's Day", month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday(
+            "Juneteenth",
+            month=6,
+            day=19,
+            start_date="2022-06-19",
+            observance=nearest_workday,
+        ),
+        Holiday("Independence Day", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas", month=12, day=25, observance=nearest_workday),
+    ]
+
+
+def _to_date_str(date: DateLike) -> str:
+    if isinstance(date, str):
+        return datetime.strptime(date[:10], "%Y-%m-%d").strftime("%Y-%m-%d")
+    return date.strftime("%Y-%m-%d")
+
+
+class TradingCalendar:
+    """
+    Sorted index of trading days answering membership and neighbour queries with
+    a binary search. Dates are accepted as YYYY-mm-dd strings or datetimes and
+    returned as YYYY-mm-dd strings.
+    """
+
+    def __init__(self, trading_days: Annotated[Iterable[DateLike], "trading days"]):
+        self.days: List[str] = sorted({_to_date_str(day) for day in trading_days})
+
+    @classmethod
+    def from_prices(
+        cls, data: Annotated[pd.DataFrame, "price history indexed by trading date"]
+    ) -> "TradingCalendar":
+        """Calendar of the days present in a price history."""
+        return cls(data.index.strftime("%Y-%m-%d"))
+
+    @classmethod
+    def from_holidays(
+        cls,
+        start_date: Annotated[DateLike, "first day of the calendar"],
+        end_date: Annotated[DateLike, "last day of the calendar"],
+        holidays: Annotated[
+            Optional[AbstractHolidayCalendar], "exchange holiday rules"
+        ] = None,
+    ) -> "TradingCalendar":
+        """Calendar of the weekdays between two dates that are not exchange holidays."""
+        holidays = (holidays or NYSEHolidayCalendar()).holidays(start_date, end_date)
+        weekdays = pd.bdate_range(start_date, end_date)
+        return cls(weekdays.difference(holidays).strftime("%Y-%m-%d"))
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def is_trading_day(self, date: DateLike) -> bool:
+        date = _to_date_str(date)
+        i = bisect.bisect_left(self.days, date)
+        return i < len(self.days) and self.days[i] == date
+
+    def prev_trading_day(
+        self, date: DateLike, inclusive: bool = False
+    ) -> Optional[str]:
+        """Last trading day before `date` (or on it, if inclusive), None if there is none."""
+        date = _to_date_str(date)
+        if inclusive:
+            i = bisect.bisect_right(self.days, date)
+        else:
+            i = bisect.bisect_left(self.days, date)
+        return self.days[i - 1] if i > 0 else None
+
+    def next_trading_day(
+        self, date: DateLike, inclusive: bool = False
+    ) -> Optional[str]:
+        """First trading day after `date` (or on it, if inclusive), None if there is none."""
+        date = _to_date_str(date)
+        if inclusive:
+            i = bisect.bisect_left(self.days, date)
+        else:
+            i = bisect.bisect_right(self.days, date)
+        return self.days[i] if i < len(self.days) else None
+
+    def trading_days_between(
+        self, start_date: DateLike, end_date: DateLike
+    ) -> List[str]:
+        """Trading days between start_date and end_date, both inclusive."""
+        lo = bisect.bisect_left(self.days, _to_date_str(start_date))
+        hi = bisect.bisect_right(self.days, _to_date_str(end_date))
+        return self.days[lo:hi]
+
+
+@lru_cache(maxsize=1)
+def get_exchange_calendar() -> TradingCalendar:
+    """Shared NYSE calendar built from the holiday rules."""
+    end_year = pd.Timestamp.today().year + EXCHANGE_CALENDAR_YEARS_AHEAD
+    return TradingCalendar.from_holidays(EXCHANGE_CALENDAR_START, f"{end_year}-12-31")
@@ -3,6 +3,7 @@ import json
 import pandas as pd
 from datetime import date, timedelta, datetime
 from typing import Annotated
+from .trading_calendar import get_exchange_calendar
 
 SavePathType = Annotated[str, "File path to save data. If None, data is not saved."]
 
@@ -28,10 +29,18 @@ def decorate_all_methods(decorator):
 
 
 def get_next_weekday(date):
-
+    """
+    Return `date` if the exchange is open on it, otherwise the next trading day,
+    skipping weekends and exchange holidays.
+    """
     if not isinstance(date, datetime):
         date = datetime.strptime(date, "%Y-%m-%d")
 
+    next_trading_day = get_exchange_calendar().next_trading_day(date, inclusive=True)
+    if next_trading_day is not None:
+        return datetime.strptime(next_trading_day, "%Y-%m-%d")
+
+    # outside of the exchange calendar, only skip weekends
     if date.weekday() >= 5:
         days_to_add = 7 - date.weekday()
         next_weekday = date + timedelta(days=days_to_add)
@@ -13,12 +13,26 @@ DEFAULT_CONFIG = {
     # Risk management settings
     "risk_level": "medium",  # Options: low, medium, high, no_guidance
     # LLM settings
+    "llm_provider": "openai",  # "fake": scripted offline model, for benchmarks
+    "fake_llm_decision": "BUY",  # decision every report of the fake model argues
     "deep_think_llm": "o4-mini",
     "quick_think_llm": "gpt-4o-mini",
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    "memory_dir": "./chroma",  # persistent Chroma memories of the agents
+    # Graph settings
+    "parallel_analysts": False,  # run the analysts as concurrent branches
+    "parallel_debate_openings": False,  # bull and bear researchers open concurrently
+    "parallel_risk_openings": False,  # risk debaters open concurrently
+    # LLM record/replay: None, "record", "replay" or "replay_or_record"
+    "llm_cassette_mode": None,
+    "llm_cassette_path": None,  # defaults to data_cache_dir/llm_cassette.sqlite
     # Tool settings
     "online_tools": True,
+    # On-disk cache of online tool responses (in data_cache_dir/responses)
+    "response_cache": True,
+    "response_cache_max_mb": 512,
+    "response_cache_ttls": {},  # vendor -> seconds, for windows reaching today
 }
@@ -0,0 +1,228 @@
+# TradingAgents/graph/fake_llm.py
+
+import re
+import time
+import hashlib
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import BaseTool, StructuredTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from tradingagents.agents import Toolkit
+
+# Same size as text-embedding-ada-002, so fake and real memories can share a collection
+EMBEDDING_DIM = 1536
+LOOK_BACK_DAYS = 7
+# rows of the table every fake tool answers with
+TOOL_OUTPUT_ROWS = 40
+
+# prompt marker -> role of the node asking; the earliest marker of the first
+# message wins, as debate histories quote the other roles
+_ROLES = [
+    ("extract the investment decision", "signal"),
+    ("Bull Analyst", "bull researcher"),
+    ("Bear Analyst", "bear researcher"),
+    ("portfolio manager and debate facilitator", "research manager"),
+    ("Risk Management Judge", "risk manager"),
+    ("Risky Risk Analyst", "risky analyst"),
+    ("Safe/Conservative Risk Analyst", "safe analyst"),
+    ("Neutral Risk Analyst", "neutral analyst"),
+    ("trading agent analyzing market data", "trader"),
+    ("analyzing financial markets", "market analyst"),
+    ("social media", "social media analyst"),
+    ("news researcher", "news analyst"),
+    ("fundamental information", "fundamentals analyst"),
+]
+# roles whose report ends with the transaction proposal
+_PROPOSING_ROLES = ("trader", "risk manager")
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# analyst system prompts end with "the current date is {date}. ... {ticker}"
+_ANALYST_CONTEXT = re.compile(r"current date is (\d{4}-\d{2}-\d{2})\.[^\n]* (\S+)\s*$")
+# later nodes find the ticker in the canned reports they are given
+_REPORT_TICKER = re.compile(r"report on (\S+) for")
+
+
+def _text(message: BaseMessage) -> str:
+    if isinstance(message.content, str):
+        return message.content
+    return " ".join(
+        part.get("text", "") if isinstance(part, dict) else str(part)
+        for part in message.content
+    )
+
+
+def fake_embedding(text: str) -> List[float]:
+    """Deterministic unit vector of the hashed words of a text."""
+    vector = np.zeros(EMBEDDING_DIM)
+    for word in re.findall(r"\w+", text.lower()):
+        digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+        index = int.from_bytes(digest[:4], "big") % EMBEDDING_DIM
+        vector[index] += 1.0 if digest[4] & 1 else -1.0
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        vector[0] = 1.0
+        norm = 1.0
+    return (vector / norm).tolist()
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Offline, deterministic stand-in for the chat models. With tools bound it
+    first calls every tool once, with arguments built from the ticker and date
+    of the prompt, then answers the tool results with a canned report; without
+    tools it answers with a canned report of the node's role. The signal
+    extraction prompt gets the bare decision.
+    """
+
+    decision: str = "BUY"
+    report_sentences: int = 12
+    # seconds every call sleeps, to stand in for the latency of a remote model
+    latency: float = 0.0
+    calls: int = 0
+    # (role, start, end) perf_counter interval of every call, as calls finish
+    call_log: List[Tuple[str, float, float]] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {
+            "decision": self.decision,
+            "report_sentences": self.report_sentences,
+            "latency": self.latency,
+        }
+
+    def bind_tools(self, tools, **kwargs):
+        specs = []
+        for tool in tools:
+            function = convert_to_openai_tool(tool)["function"]
+            specs.append(
+                {
+                    "name": function["name"],
+                    "args": list(function.get("parameters", {}).get("properties", {})),
+                }
+            )
+        return self.bind(tools=specs, **kwargs)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.calls += 1
+        start = time.perf_counter()
+        if self.latency:
+            time.sleep(self.latency)
+        prompt = "\n".join(_text(message) for message in messages)
+        ticker, trade_date = self._context(messages, prompt)
+        role = self._role(_text(messages[0]) if messages else "")
+        self.call_log.append((role, start, time.perf_counter()))
+
+        if tools and not isinstance(messages[-1], ToolMessage):
+            message = AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": tool["name"],
+                        "args": self._tool_args(tool["args"], ticker, trade_date),
+                        "id": f"call_{i}_{tool['name']}",
+                    }
+                    for i, tool in enumerate(tools)
+                ],
+            )
+        else:
+            message = AIMessage(content=self._report(role, ticker, trade_date))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @staticmethod
+    def _context(messages: List[BaseMessage], prompt: str):
+        match = _ANALYST_CONTEXT.search(_text(messages[0])) if messages else None
+        if match:
+            return match.group(2), match.group(1)
+        ticker = _REPORT_TICKER.search(prompt)
+        date = _DATE.search(prompt)
+        return (
+            ticker.group(1) if ticker else "the company",
+            date.group(0) if date else None,
+        )
+
+    @staticmethod
+    def _role(text: str) -> str:
+        found = [(text.find(marker), role) for marker, role in _ROLES]
+        found = [(position, role) for position, role in found if position >= 0]
+        return min(found)[1] if found else "assistant"
+
+    @staticmethod
+    def _tool_args(names: List[str], ticker: str, trade_date: Optional[str]):
+        start_date = trade_date
+        if trade_date:
+            start = datetime.strptime(trade_date, "%Y-%m-%d")
+            start_date = (start - timedelta(days=LOOK_BACK_DAYS)).strftime("%Y-%m-%d")
+        values = {
+            "curr_date": trade_date,
+            "end_date": trade_date,
+            "start_date": start_date,
+            "look_back_days": LOOK_BACK_DAYS,
+            "indicator": "rsi",
+            "freq": "quarterly",
+        }
+        return {name: values.get(name, ticker) for name in names}
+
+    def _report(self, role: str, ticker: str, trade_date: Optional[str]) -> str:
+        if role == "signal":
+            return self.decision
+
+        lines = [f"## {role.title()} report on {ticker} for {trade_date}", ""]
+        lines += [
+            f"Point {i + 1}: the evidence reviewed by the {role} supports a"
+            f" {self.decision} position on {ticker}."
+            for i in range(self.report_sentences)
+        ]
+        lines += ["", "| Point | Stance |", "| --- | --- |"]
+        lines += [f"| {i + 1} | {self.decision} |" for i in range(3)]
+        if role in _PROPOSING_ROLES:
+            lines += ["", f"FINAL TRANSACTION PROPOSAL: **{self.decision}**"]
+        return "\n".join(lines)
+
+
+def _canned_tool(tool: BaseTool, rows: int) -> StructuredTool:
+    def run(**kwargs) -> str:
+        call = ", ".join(f"{key}={value}" for key, value in sorted(kwargs.items()))
+        lines = [f"## {tool.name}({call})", "", "| Row | Value | Change |"]
+        lines += [
+            f"| {i} | {100 + i * 0.5:.2f} | {i % 7 - 3:+d}% |" for i in range(rows)
+        ]
+        return "\n".join(lines)
+
+    return StructuredTool.from_function(
+        func=run,
+        name=tool.name,
+        description=tool.description,
+        args_schema=tool.args_schema,
+    )
+
+
+class FakeToolkit(Toolkit):
+    """
+    Toolkit whose tools keep their names and argument schemas but answer with
+    a canned table instead of reading the data vendors, so whole graph runs
+    need neither network nor the offline data files.
+    """
+
+    def __init__(self, config=None, rows: int = TOOL_OUTPUT_ROWS):
+        super().__init__(config)
+        for name in dir(Toolkit):
+            tool = getattr(Toolkit, name)
+            if isinstance(tool, BaseTool):
+                setattr(self, name, _canned_tool(tool, rows))
@@ -0,0 +1,218 @@
+# TradingAgents/graph/llm_cassette.py
+
+import os
+import json
+import zlib
+import sqlite3
+import hashlib
+import threading
+from contextlib import closing
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage, messages_from_dict, message_to_dict
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import ConfigDict
+
+# record: always call the model and (over)write the cassette
+# replay: answer from the cassette only, a missing entry is an error
+# replay_or_record: answer from the cassette, call and record on a miss
+CASSETTE_MODES = ("record", "replay", "replay_or_record")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cassette (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL
+);
+"""
+
+
+class CassetteMissError(LookupError):
+    """A replay-only cassette has no recording for a request."""
+
+
+class Cassette:
+    """
+    Request-hash -> response store for LLM and embedding calls, kept in a
+    SQLite file as zlib-compressed JSON.
+    """
+
+    def __init__(self, path: str, mode: str):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Cassette mode must be one of {CASSETTE_MODES}.")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        payload = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT value FROM cassette WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else json.loads(zlib.decompress(row[0]))
+
+    def put(self, key: str, value: Any) -> None:
+        blob = zlib.compress(json.dumps(value).encode())
+        with closing(self._connect()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO cassette VALUES (?, ?)", (key, blob))
+
+    def call(
+        self,
+        request: Dict[str, Any],
+        compute: Callable[[], Any],
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda value: value,
+    ) -> Any:
+        """Replay the response recorded for `request`, or compute and record it."""
+        key = self.make_key(request)
+        if self.mode != "record":
+            recorded = self.get(key)
+            if recorded is not None:
+                with self._lock:
+                    self.hits += 1
+                return decode(recorded)
+            with self._lock:
+                self.misses += 1
+            if self.mode == "replay":
+                raise CassetteMissError(
+                    f"No recording in {self.path} for request {key[:12]}"
+                )
+
+        value = compute()
+        self.put(key, encode(value))
+        with self._lock:
+            self.recorded += 1
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "recorded": self.recorded}
+
+
+def _message_request(message: BaseMessage) -> Dict[str, Any]:
+    """The parts of a message sent to the model (ids and metadata excluded)."""
+    request = {"type": message.type, "content": message.content}
+    if getattr(message, "name", None):
+        request["name"] = message.name
+    if getattr(message, "tool_calls", None):
+        request["tool_calls"] = [
+            {"name": call["name"], "args": call["args"], "id": call.get("id")}
+            for call in message.tool_calls
+        ]
+    if getattr(message, "tool_call_id", None):
+        request["tool_call_id"] = message.tool_call_id
+    return request
+
+
+def _encode_result(result: ChatResult) -> Dict[str, Any]:
+    return {
+        "generations": [
+            {
+                "message": message_to_dict(generation.message),
+                "generation_info": generation.generation_info,
+            }
+            for generation in result.generations
+        ],
+        "llm_output": json.loads(json.dumps(result.llm_output, default=str)),
+    }
+
+
+def _decode_result(recorded: Dict[str, Any]) -> ChatResult:
+    return ChatResult(
+        generations=[
+            ChatGeneration(
+                message=messages_from_dict([generation["message"]])[0],
+                generation_info=generation["generation_info"],
+            )
+            for generation in recorded["generations"]
+        ],
+        llm_output=recorded["llm_output"],
+    )
+
+
+class CassetteChatModel(BaseChatModel):
+    """
+    Chat model answering from a cassette. Requests are keyed by the model's
+    parameters, the messages, the stop words and the bound arguments (e.g.
+    tools), so byte-identical prompts of a rerun replay without any call.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    llm: BaseChatModel
+    cassette: Cassette
+
+    @property
+    def _llm_type(self) -> str:
+        return f"cassette-{self.llm._llm_type}"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return self.llm._identifying_params
+
+    def bind_tools(self, tools, **kwargs):
+        # let the wrapped model format the tools, and bind what it would bind
+        binding = self.llm.bind_tools(tools, **kwargs)
+        return self.bind(**binding.kwargs)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        request = {
+            "llm": self.llm._llm_type,
+            "params": self.llm._identifying_params,
+            "messages": [_message_request(message) for message in messages],
+            "stop": stop,
+            "kwargs": kwargs,
+        }
+        return self.cassette.call(
+            request,
+            lambda: self.llm._generate(messages, stop=stop, **kwargs),
+            _encode_result,
+            _decode_result,
+        )
+
+
+_cassettes: Dict[tuple, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(config: Dict[str, Any]) -> Optional[Cassette]:
+    """Cassette configured by llm_cassette_mode / llm_cassette_path, if any."""
+    mode = config.get("llm_cassette_mode")
+    if not mode:
+        return None
+    path = config.get("llm_cassette_path") or os.path.join(
+        config["data_cache_dir"], "llm_cassette.sqlite"
+    )
+    with _cassettes_lock:
+        cassette = _cassettes.get((path, mode))
+        if cassette is None:
+            cassette = _cassettes[(path, mode)] = Cassette(path, mode)
+        return cassette
+
+
+def wrap_llm(llm: BaseChatModel, cassette: Optional[Cassette]) -> BaseChatModel:
+    """The model itself without a cassette, else the model behind the cassette."""
+    if cassette is None:
+        return llm
+    return CassetteChatModel(llm=llm, cassette=cassette)
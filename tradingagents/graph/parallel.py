@@ -0,0 +1,115 @@
+# TradingAgents/graph/parallel.py
+
+from typing import Callable, Dict, List
+
+# debaters in their speaking order: (speaker, prefix of their state keys)
+INVESTMENT_SPEAKERS = [("Bull", "bull"), ("Bear", "bear")]
+RISK_SPEAKERS = [("Risky", "risky"), ("Safe", "safe"), ("Neutral", "neutral")]
+
+
+def create_opening_node(
+    debater_node: Callable[[Dict], Dict],
+    speaker: str,
+    argument: Callable[[Dict], str],
+    openings_key: str,
+) -> Callable[[Dict], Dict]:
+    """
+    Run a debater for its opening statement and record only the argument,
+    under its speaker in the openings channel, so that concurrent openings
+    never write the same debate state.
+    """
+
+    def opening_node(state) -> dict:
+        return {openings_key: {speaker: argument(debater_node(state))}}
+
+    return opening_node
+
+
+def create_investment_openings_join() -> Callable[[Dict], Dict]:
+    """
+    Fold the concurrent Bull and Bear openings into the investment debate
+    state as if the Bull had spoken first: the Bear's opening is the current
+    response and both count, so should_continue_debate hands the next round
+    to the Bull's rebuttal, or the debate to the Research Manager.
+    """
+
+    def investment_openings_join(state) -> dict:
+        investment_debate_state = dict(state["investment_debate_state"])
+        openings = state["investment_openings"]
+        for speaker, key in INVESTMENT_SPEAKERS:
+            argument = openings[speaker]
+            investment_debate_state["history"] = (
+                investment_debate_state.get("history", "") + "\n" + argument
+            )
+            investment_debate_state[f"{key}_history"] = (
+                investment_debate_state.get(f"{key}_history", "") + "\n" + argument
+            )
+            investment_debate_state["current_response"] = argument
+            investment_debate_state["count"] = investment_debate_state["count"] + 1
+
+        return {"investment_debate_state": investment_debate_state}
+
+    return investment_openings_join
+
+
+def create_risk_openings_join() -> Callable[[Dict], Dict]:
+    """
+    Fold the concurrent opening statements into the risk debate state as if
+    the debaters had spoken in rotation, so the sequential rebuttals (and the
+    judge) pick up exactly where a sequential first round would have ended.
+    """
+
+    def risk_openings_join(state) -> dict:
+        risk_debate_state = dict(state["risk_debate_state"])
+        openings = state["risk_openings"]
+        for speaker, key in RISK_SPEAKERS:
+            argument = openings[speaker]
+            risk_debate_state["history"] = (
+                risk_debate_state.get("history", "") + "\n" + argument
+            )
+            risk_debate_state[f"{key}_history"] = (
+                risk_debate_state.get(f"{key}_history", "") + "\n" + argument
+            )
+            risk_debate_state[f"current_{key}_response"] = argument
+            risk_debate_state["latest_speaker"] = speaker
+            risk_debate_state["count"] = risk_debate_state["count"] + 1
+
+        return {"risk_debate_state": risk_debate_state}
+
+    return risk_openings_join
+
+
+def investment_opening_nodes(
+    debaters: Dict[str, Callable[[Dict], Dict]],
+) -> List[tuple]:
+    """(node name, opening node) of the Bull and Bear researchers."""
+    return [
+        (
+            f"{speaker} Opening",
+            create_opening_node(
+                debaters[speaker],
+                speaker,
+                lambda update: update["investment_debate_state"]["current_response"],
+                "investment_openings",
+            ),
+        )
+        for speaker, _ in INVESTMENT_SPEAKERS
+    ]
+
+
+def risk_opening_nodes(debaters: Dict[str, Callable[[Dict], Dict]]) -> List[tuple]:
+    """(node name, opening node) of every risk debater, in speaking order."""
+    return [
+        (
+            f"{speaker} Opening",
+            create_opening_node(
+                debaters[speaker],
+                speaker,
+                lambda update, key=key: update["risk_debate_state"][
+                    f"current_{key}_response"
+                ],
+                "risk_openings",
+            ),
+        )
+        for speaker, key in RISK_SPEAKERS
+    ]
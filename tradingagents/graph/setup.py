@@ -1,8 +1,10 @@
 # TradingAgents/graph/setup.py
 
 from typing import Dict, Any
+from langchain_core.messages import RemoveMessage
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
@@ -10,8 +12,21 @@ from tradingagents.agents.utils.agent_states import AgentState
 from tradingagents.agents.utils.agent_utils import Toolkit
 
 from .conditional_logic import ConditionalLogic
+from .parallel import (
+    create_investment_openings_join,
+    create_risk_openings_join,
+    investment_opening_nodes,
+    risk_opening_nodes,
+)
 
 ALL_SUPPORTED_ANALYSTS = ["market", "social", "news", "fundamentals"]
+# state key each analyst writes its report to
+ANALYST_REPORTS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
 
 
 class GraphSetup:
@@ -30,6 +45,9 @@ class GraphSetup:
         risk_manager_memory,
         conditional_logic: ConditionalLogic,
         risk_level: str = "medium",
+        parallel_analysts: bool = False,
+        parallel_risk_openings: bool = False,
+        parallel_debate_openings: bool = False,
     ):
         """Initialize with required components."""
         self.quick_thinking_llm = quick_thinking_llm
@@ -43,6 +61,45 @@ class GraphSetup:
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
         self.risk_level = risk_level
+        self.parallel_analysts = parallel_analysts
+        self.parallel_risk_openings = parallel_risk_openings
+        self.parallel_debate_openings = parallel_debate_openings
+
+    def _add_analyst_loop(self, workflow, analyst_type, analyst_node, tool_node):
+        """Add an analyst, its tool node and its message clearing to a graph."""
+        name = analyst_type.capitalize()
+        workflow.add_node(f"{name} Analyst", analyst_node)
+        workflow.add_node(f"Msg Clear {name}", create_msg_delete())
+        workflow.add_node(f"tools_{analyst_type}", tool_node)
+        workflow.add_conditional_edges(
+            f"{name} Analyst",
+            getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+            [f"tools_{analyst_type}", f"Msg Clear {name}"],
+        )
+        workflow.add_edge(f"tools_{analyst_type}", f"{name} Analyst")
+
+    def _create_analyst_branch(self, analyst_type, analyst_node, tool_node):
+        """
+        The analyst's tool loop as a subgraph with a message channel of its own,
+        so parallel branches never see (or clear) each other's messages. The
+        branch only hands its report back to the main graph.
+        """
+        branch = StateGraph(AgentState)
+        self._add_analyst_loop(branch, analyst_type, analyst_node, tool_node)
+        branch.add_edge(START, f"{analyst_type.capitalize()} Analyst")
+        branch.add_edge(f"Msg Clear {analyst_type.capitalize()}", END)
+        branch = branch.compile()
+        report_key = ANALYST_REPORTS[analyst_type]
+
+        def analyst_branch_node(state):
+            final_state = branch.invoke(state)
+            # the main channel ends empty, as after the sequential Msg Clear nodes
+            return {
+                report_key: final_state[report_key],
+                "messages": [RemoveMessage(id=REMOVE_ALL_MESSAGES)],
+            }
+
+        return analyst_branch_node
 
     def setup_graph(self, selected_analysts=ALL_SUPPORTED_ANALYSTS):
         """Set up and compile the agent workflow graph.
@@ -66,35 +123,30 @@ class GraphSetup:
         ), f"Trading Agents Graph Setup Error: Duplicate analysts selected! {selected_analysts}"
         # Create analyst nodes
         analyst_nodes = {}
-        delete_nodes = {}
         tool_nodes = {}
 
         if "market" in selected_analysts:
             analyst_nodes["market"] = create_market_analyst(
                 self.quick_thinking_llm, self.toolkit
             )
-            delete_nodes["market"] = create_msg_delete()
             tool_nodes["market"] = self.tool_nodes["market"]
 
         if "social" in selected_analysts:
             analyst_nodes["social"] = create_social_media_analyst(
                 self.quick_thinking_llm, self.toolkit
             )
-            delete_nodes["social"] = create_msg_delete()
             tool_nodes["social"] = self.tool_nodes["social"]
 
         if "news" in selected_analysts:
             analyst_nodes["news"] = create_news_analyst(
                 self.quick_thinking_llm, self.toolkit
             )
-            delete_nodes["news"] = create_msg_delete()
             tool_nodes["news"] = self.tool_nodes["news"]
 
         if "fundamentals" in selected_analysts:
             analyst_nodes["fundamentals"] = create_fundamentals_analyst(
                 self.quick_thinking_llm, self.toolkit
             )
-            delete_nodes["fundamentals"] = create_msg_delete()
             tool_nodes["fundamentals"] = self.tool_nodes["fundamentals"]
 
         # Create researcher and manager nodes
@@ -120,14 +172,6 @@ class GraphSetup:
         # Create workflow
         workflow = StateGraph(AgentState)
 
-        # Add analyst nodes to the graph
-        for analyst_type, node in analyst_nodes.items():
-            workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
-            workflow.add_node(
-                f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
-            )
-            workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
-
         # Add other nodes
         workflow.add_node("Bull Researcher", bull_researcher_node)
         workflow.add_node("Bear Researcher", bear_researcher_node)
@@ -138,31 +182,70 @@ class GraphSetup:
         workflow.add_node("Safe Analyst", safe_analyst)
         workflow.add_node("Risk Judge", risk_manager_node)
 
-        # Define edges
-        # Start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
-
-        # Connect analysts in sequence
-        for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
-
-            # Add conditional edges for current analyst
+        # Nodes the analysts hand over to
+        if self.parallel_debate_openings:
+            # both openings only need the analyst reports and the memories, so
+            # they run concurrently; later rounds are the usual rebuttals
+            openings = investment_opening_nodes(
+                {"Bull": bull_researcher_node, "Bear": bear_researcher_node}
+            )
+            for name, node in openings:
+                workflow.add_node(name, node)
+            workflow.add_node("Debate Openings", create_investment_openings_join())
+            workflow.add_edge([name for name, _ in openings], "Debate Openings")
             workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
+                "Debate Openings",
+                self.conditional_logic.should_continue_debate,
+                {
+                    "Bull Researcher": "Bull Researcher",
+                    "Research Manager": "Research Manager",
+                },
             )
-            workflow.add_edge(current_tools, current_analyst)
+            debate_entries = [name for name, _ in openings]
+        else:
+            debate_entries = ["Bull Researcher"]
 
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
-                workflow.add_edge(current_clear, next_analyst)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+        # Define edges
+        if self.parallel_analysts:
+            # every analyst runs as an independent branch from the start, and
+            # the debate waits for all of them
+            branches = []
+            for analyst_type in selected_analysts:
+                branch_name = f"{analyst_type.capitalize()} Analysis"
+                workflow.add_node(
+                    branch_name,
+                    self._create_analyst_branch(
+                        analyst_type,
+                        analyst_nodes[analyst_type],
+                        tool_nodes[analyst_type],
+                    ),
+                )
+                workflow.add_edge(START, branch_name)
+                branches.append(branch_name)
+            for entry in debate_entries:
+                workflow.add_edge(branches, entry)
+        else:
+            for analyst_type in selected_analysts:
+                self._add_analyst_loop(
+                    workflow,
+                    analyst_type,
+                    analyst_nodes[analyst_type],
+                    tool_nodes[analyst_type],
+                )
+
+            # Start with the first analyst, then connect analysts in sequence
+            first_analyst = selected_analysts[0]
+            workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
+            for i, analyst_type in enumerate(selected_analysts):
+                current_clear = f"Msg Clear {analyst_type.capitalize()}"
+
+                # Connect to next analyst or to the debate if this is the last analyst
+                if i < len(selected_analysts) - 1:
+                    next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
+                    workflow.add_edge(current_clear, next_analyst)
+                else:
+                    for entry in debate_entries:
+                        workflow.add_edge(current_clear, entry)
 
         # Add remaining edges
         workflow.add_conditional_edges(
@@ -182,7 +265,31 @@ class GraphSetup:
             },
         )
         workflow.add_edge("Research Manager", "Trader")
-        workflow.add_edge("Trader", "Risky Analyst")
+        if self.parallel_risk_openings:
+            # the three opening statements only need the trader's plan, so they
+            # run concurrently; later rounds are the usual rotation of rebuttals
+            openings = risk_opening_nodes(
+                {
+                    "Risky": risky_analyst,
+                    "Safe": safe_analyst,
+                    "Neutral": neutral_analyst,
+                }
+            )
+            for name, node in openings:
+                workflow.add_node(name, node)
+                workflow.add_edge("Trader", name)
+            workflow.add_node("Risk Openings", create_risk_openings_join())
+            workflow.add_edge([name for name, _ in openings], "Risk Openings")
+            workflow.add_conditional_edges(
+                "Risk Openings",
+                self.conditional_logic.should_continue_risk_analysis,
+                {
+                    "Risky Analyst": "Risky Analyst",
+                    "Risk Judge": "Risk Judge",
+                },
+            )
+        else:
+            workflow.add_edge("Trader", "Risky Analyst")
         workflow.add_conditional_edges(
             "Risky Analyst",
             self.conditional_logic.should_continue_risk_analysis,
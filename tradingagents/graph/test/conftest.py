@@ -0,0 +1,31 @@
+import copy
+import pytest
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph.fake_llm import FakeToolkit
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+
+@pytest.fixture
+def offline_graph(tmp_path, monkeypatch):
+    """
+    Factory of graphs running on the fake chat model and toolkit, with their
+    memories and state logs in tmp_path.
+    """
+    monkeypatch.chdir(tmp_path)
+
+    def make(
+        selected_analysts=("market", "social", "news", "fundamentals"),
+        **config_overrides,
+    ):
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config.update(
+            llm_provider="fake",
+            response_cache=False,
+            memory_dir=str(tmp_path / "chroma"),
+            **config_overrides,
+        )
+        return TradingAgentsGraph(
+            list(selected_analysts), config=config, toolkit=FakeToolkit(config)
+        )
+
+    return make
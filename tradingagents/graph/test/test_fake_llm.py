@@ -0,0 +1,90 @@
+import copy
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph.fake_llm import (
+    EMBEDDING_DIM,
+    FakeChatModel,
+    FakeToolkit,
+    fake_embedding,
+)
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+ANALYST_PROMPT = [
+    SystemMessage(
+        content="You are a helpful AI assistant.\nYou are a news researcher."
+        "For your reference, the current date is 2024-05-10. We are looking at"
+        " the company NVDA"
+    ),
+    HumanMessage(content="NVDA"),
+]
+
+
+def test_bound_tools_are_called_with_prompt_context():
+    toolkit = FakeToolkit()
+    llm = FakeChatModel().bind_tools(
+        [toolkit.get_finnhub_news, toolkit.get_reddit_news]
+    )
+    message = llm.invoke(ANALYST_PROMPT)
+    assert [call["name"] for call in message.tool_calls] == [
+        "get_finnhub_news",
+        "get_reddit_news",
+    ]
+    assert message.tool_calls[0]["args"] == {
+        "ticker": "NVDA",
+        "start_date": "2024-05-03",
+        "end_date": "2024-05-10",
+    }
+
+    results = ANALYST_PROMPT + [
+        message,
+        ToolMessage(content="news", tool_call_id=message.tool_calls[0]["id"]),
+    ]
+    report = llm.invoke(results)
+    assert not report.tool_calls
+    assert report.content.startswith("## News Analyst report on NVDA for 2024-05-10")
+
+
+def test_role_comes_from_the_earliest_marker():
+    llm = FakeChatModel(decision="SELL")
+    prompt = "You are a Bear Analyst. Debate so far: Bull Analyst: report on MSFT for"
+    assert llm.invoke(prompt).content.startswith("## Bear Researcher report on MSFT")
+    trader = llm.invoke(
+        [
+            SystemMessage(content="You are a trading agent analyzing market data."),
+            HumanMessage(content="## Market Analyst report on MSFT for 2024-05-10"),
+        ]
+    )
+    assert trader.content.endswith("FINAL TRANSACTION PROPOSAL: **SELL**")
+    signal = [SystemMessage(content="Your task is to extract the investment decision")]
+    assert llm.invoke(signal).content == "SELL"
+
+
+def test_fake_embedding_is_deterministic_unit_vector():
+    vector = fake_embedding("Rising rates hit tech stocks")
+    assert len(vector) == EMBEDDING_DIM
+    assert vector == fake_embedding("rising rates hit tech stocks")
+    assert sum(value * value for value in vector) == pytest.approx(1.0)
+
+
+def test_propagate_runs_offline(tmp_path, monkeypatch):
+    (tmp_path / "work").mkdir()
+    monkeypatch.chdir(tmp_path / "work")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config.update(
+        llm_provider="fake",
+        fake_llm_decision="HOLD",
+        response_cache=False,
+        memory_dir=str(tmp_path / "chroma"),
+    )
+    graph = TradingAgentsGraph(
+        ["market", "news"], config=config, toolkit=FakeToolkit(config)
+    )
+    state, decision = graph.propagate("AAPL", "2024-05-10")
+    assert decision == "HOLD"
+    assert state["market_report"].startswith("## Market Analyst report on AAPL")
+    assert "FINAL TRANSACTION PROPOSAL: **HOLD**" in state["final_trade_decision"]
+    # the memories persist under memory_dir, not the working directory
+    assert (tmp_path / "chroma" / "chroma.sqlite3").exists()
+    assert not (tmp_path / "work" / "chroma").exists()
@@ -0,0 +1,96 @@
+import pytest
+from typing import Any, List, Optional
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from tradingagents.graph.llm_cassette import (
+    Cassette,
+    CassetteChatModel,
+    CassetteMissError,
+    get_cassette,
+    wrap_llm,
+)
+
+
+class CountingChatModel(BaseChatModel):
+    """Answers with the last message and the bound tools, counting the calls."""
+
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "counting"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(tools=[tool.__name__ for tool in tools], **kwargs)
+
+    def _generate(
+        self,
+        messages: List[Any],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.calls += 1
+        content = f"{messages[-1].content} (tools: {kwargs.get('tools')})"
+        message = AIMessage(content=content, id=f"run-{self.calls}")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+PROMPT = [SystemMessage(content="You are a trader."), HumanMessage(content="AAPL?")]
+
+
+def get_stock_data():
+    """Stock data tool."""
+
+
+def test_record_then_replay_without_calls(tmp_path):
+    path = str(tmp_path / "cassette.sqlite")
+    recording_llm = CountingChatModel()
+    recorder = wrap_llm(recording_llm, Cassette(path, "record"))
+    recorded = recorder.invoke(PROMPT)
+    recorded_with_tools = recorder.bind_tools([get_stock_data]).invoke(PROMPT)
+    assert recording_llm.calls == 2
+    assert recorded_with_tools.content == "AAPL? (tools: ['get_stock_data'])"
+
+    replaying_llm = CountingChatModel()
+    replayer = wrap_llm(replaying_llm, Cassette(path, "replay"))
+    assert replayer.invoke(PROMPT).content == recorded.content
+    assert replayer.invoke(PROMPT).id == recorded.id
+    assert (
+        replayer.bind_tools([get_stock_data]).invoke(PROMPT).content
+        == recorded_with_tools.content
+    )
+    assert replaying_llm.calls == 0
+
+    with pytest.raises(CassetteMissError):
+        replayer.invoke([HumanMessage(content="MSFT?")])
+
+
+def test_replay_or_record_only_calls_on_a_miss(tmp_path):
+    llm = CountingChatModel()
+    cassette = Cassette(str(tmp_path / "cassette.sqlite"), "replay_or_record")
+    model = wrap_llm(llm, cassette)
+
+    # message ids and metadata are not part of the request
+    first = model.invoke(PROMPT + [AIMessage(content="Buy", id="a")])
+    again = model.invoke(PROMPT + [AIMessage(content="Buy", id="b")])
+    model.invoke(PROMPT + [AIMessage(content="Sell")])
+
+    assert again.content == first.content
+    assert llm.calls == 2
+    assert cassette.stats() == {"hits": 1, "misses": 2, "recorded": 2}
+
+
+def test_cassette_from_config(tmp_path):
+    llm = CountingChatModel()
+    assert get_cassette({"llm_cassette_mode": None}) is None
+    assert wrap_llm(llm, None) is llm
+
+    cassette = get_cassette(
+        {"llm_cassette_mode": "record", "data_cache_dir": str(tmp_path)}
+    )
+    assert cassette.path == str(tmp_path / "llm_cassette.sqlite")
+    assert isinstance(wrap_llm(llm, cassette), CassetteChatModel)
+    with pytest.raises(ValueError):
+        Cassette(str(tmp_path / "other.sqlite"), "rewind")
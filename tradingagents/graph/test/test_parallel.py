@@ -0,0 +1,99 @@
+import pytest
+from tradingagents.graph.conditional_logic import ConditionalLogic
+from tradingagents.graph.parallel import (
+    create_investment_openings_join,
+    create_risk_openings_join,
+    investment_opening_nodes,
+    risk_opening_nodes,
+)
+
+
+def _fake_risk_debater(speaker, key):
+    def node(state):
+        argument = f"{speaker} Analyst: opening"
+        return {"risk_debate_state": {f"current_{key}_response": argument}}
+
+    return node
+
+
+def test_risk_openings_join_in_speaking_order():
+    debaters = {
+        "Risky": _fake_risk_debater("Risky", "risky"),
+        "Safe": _fake_risk_debater("Safe", "safe"),
+        "Neutral": _fake_risk_debater("Neutral", "neutral"),
+    }
+    state = {"risk_debate_state": {"history": "", "count": 0}, "risk_openings": {}}
+    # openings may finish in any order
+    for name, node in reversed(risk_opening_nodes(debaters)):
+        state["risk_openings"].update(node(state)["risk_openings"])
+
+    risk_debate_state = create_risk_openings_join()(state)["risk_debate_state"]
+    assert risk_debate_state["history"] == (
+        "\nRisky Analyst: opening\nSafe Analyst: opening\nNeutral Analyst: opening"
+    )
+    assert risk_debate_state["safe_history"] == "\nSafe Analyst: opening"
+    assert risk_debate_state["current_neutral_response"] == "Neutral Analyst: opening"
+    assert risk_debate_state["latest_speaker"] == "Neutral"
+    assert risk_debate_state["count"] == 3
+
+    state = {"risk_debate_state": risk_debate_state}
+    assert ConditionalLogic().should_continue_risk_analysis(state) == "Risk Judge"
+    logic = ConditionalLogic(max_risk_discuss_rounds=2)
+    assert logic.should_continue_risk_analysis(state) == "Risky Analyst"
+
+
+def test_parallel_risk_openings_match_sequential(offline_graph):
+    sequential, _ = offline_graph(["market"]).propagate("AAPL", "2024-05-10")
+    graph = offline_graph(["market"], parallel_risk_openings=True)
+    assert "Risk Openings" in graph.graph.nodes
+    parallel, _ = graph.propagate("AAPL", "2024-05-10")
+
+    assert parallel["risk_debate_state"] == sequential["risk_debate_state"]
+    assert set(parallel["risk_openings"]) == {"Risky", "Safe", "Neutral"}
+    assert parallel["final_trade_decision"] == sequential["final_trade_decision"]
+
+
+def _fake_researcher(speaker):
+    def node(state):
+        argument = f"{speaker} Analyst: opening"
+        return {"investment_debate_state": {"current_response": argument}}
+
+    return node
+
+
+def test_investment_openings_join_hands_over_to_bull_rebuttal():
+    debaters = {"Bull": _fake_researcher("Bull"), "Bear": _fake_researcher("Bear")}
+    state = {
+        "investment_debate_state": {"history": "", "current_response": "", "count": 0},
+        "investment_openings": {},
+    }
+    for name, node in investment_opening_nodes(debaters):
+        state["investment_openings"].update(node(state)["investment_openings"])
+
+    debate = create_investment_openings_join()(state)["investment_debate_state"]
+    assert debate["history"] == "\nBull Analyst: opening\nBear Analyst: opening"
+    assert debate["bear_history"] == "\nBear Analyst: opening"
+    assert debate["current_response"] == "Bear Analyst: opening"
+    assert debate["count"] == 2
+
+    state = {"investment_debate_state": debate}
+    assert ConditionalLogic().should_continue_debate(state) == "Research Manager"
+    logic = ConditionalLogic(max_debate_rounds=2)
+    assert logic.should_continue_debate(state) == "Bull Researcher"
+
+
+@pytest.mark.parametrize("parallel_analysts", [False, True])
+def test_parallel_debate_openings_match_sequential(offline_graph, parallel_analysts):
+    sequential, _ = offline_graph(["market"]).propagate("AAPL", "2024-05-10")
+    graph = offline_graph(
+        ["market"],
+        parallel_analysts=parallel_analysts,
+        parallel_debate_openings=True,
+        parallel_risk_openings=True,
+    )
+    assert "Debate Openings" in graph.graph.nodes
+    parallel, _ = graph.propagate("AAPL", "2024-05-10")
+
+    assert parallel["investment_debate_state"] == sequential["investment_debate_state"]
+    assert parallel["investment_plan"] == sequential["investment_plan"]
+    assert parallel["final_trade_decision"] == sequential["final_trade_decision"]
@@ -1,5 +1,5 @@
 import pytest
-from tradingagents.graph.setup import GraphSetup
+from tradingagents.graph.setup import ANALYST_REPORTS, GraphSetup
 from tradingagents.agents.utils.agent_utils import Toolkit
 from tradingagents.graph.conditional_logic import ConditionalLogic
 from unittest.mock import MagicMock
@@ -27,3 +27,38 @@ def test_graph_setup_initializes():
     )
     assert gs.risk_level == "medium"
     assert gs.conditional_logic is logic
+
+
+def test_parallel_analysts_match_sequential(offline_graph):
+    sequential, _ = offline_graph().propagate("AAPL", "2024-05-10")
+    graph = offline_graph(parallel_analysts=True)
+    assert "Market Analysis" in graph.graph.nodes
+    parallel, decision = graph.propagate("AAPL", "2024-05-10")
+
+    assert decision == "BUY"
+    for key in ANALYST_REPORTS.values():
+        assert parallel[key] == sequential[key]
+        assert parallel[key].startswith("## ")
+    assert [m.content for m in parallel["messages"]] == [
+        m.content for m in sequential["messages"]
+    ]
+    assert parallel["final_trade_decision"] == sequential["final_trade_decision"]
+
+
+def test_parallel_analysts_overlap(offline_graph):
+    graph = offline_graph(parallel_analysts=True)
+    llm = graph.quick_thinking_llm
+    llm.latency = 0.05
+    graph.graph.invoke(
+        graph.propagator.create_initial_state("AAPL", "2024-05-10"),
+        **graph.propagator.get_graph_args(),
+    )
+    # the first calls of the four analysts are all in flight at once
+    analysts = {"market", "social media", "news", "fundamentals"}
+    first_calls = {}
+    for role, start, end in sorted(llm.call_log, key=lambda call: call[1]):
+        if role.removesuffix(" analyst") in analysts:
+            first_calls.setdefault(role, (start, end))
+    assert len(first_calls) == 4
+    starts, ends = zip(*first_calls.values())
+    assert max(starts) < min(ends)
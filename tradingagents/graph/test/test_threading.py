@@ -14,7 +14,7 @@ def test_trading_agents_graph_thread_safety(monkeypatch):
 
     created_names = []
 
-    def fake_safe_create_memory(name):
+    def fake_safe_create_memory(name, config):
         created_names.append(name)
 
         class DummyMemory:
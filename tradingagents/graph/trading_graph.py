@@ -26,6 +26,8 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .llm_cassette import get_cassette, wrap_llm
+from .fake_llm import FakeChatModel, fake_embedding
 
 
 def _sanitize_filename(name):
@@ -33,11 +35,11 @@ def _sanitize_filename(name):
     return re.sub(r"[^A-Za-z0-9_]", "_", name)
 
 
-def safe_create_memory(name):
+def safe_create_memory(name, config):
     """Thread-safe memory creation or reuse for ChromaDB."""
     from chromadb import PersistentClient
 
-    client = PersistentClient()  # or however you're creating `chroma_client`
+    client = PersistentClient(path=config.get("memory_dir", "./chroma"))
     try:
         collection = client.create_collection(name=name)
     except chromadb.errors.InternalError as e:
@@ -57,6 +59,8 @@ class TradingAgentsGraph:
         selected_analysts=["market", "social", "news", "fundamentals"],
         debug=False,
         config: Dict[str, Any] = None,
+        callbacks=None,
+        toolkit: Toolkit = None,
     ):
         """Initialize the trading agents graph and components.
 
@@ -64,9 +68,12 @@ class TradingAgentsGraph:
             selected_analysts: List of analyst types to include
             debug: Whether to run in debug mode
             config: Configuration dictionary. If None, uses default config
+            callbacks: LangChain callback handlers passed to every graph run
+            toolkit: Toolkit to use instead of one built from the config
         """
         self._owner_thread = threading.get_ident()
         self.debug = debug
+        self.callbacks = callbacks
         # Use a deep copy of DEFAULT_CONFIG if no config is provided
         self.config = copy.deepcopy(DEFAULT_CONFIG) if config is None else config
 
@@ -79,19 +86,39 @@ class TradingAgentsGraph:
             exist_ok=True,
         )
 
-        # Initialize LLMs
-        self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"])
-        self.quick_thinking_llm = ChatOpenAI(
-            model=self.config["quick_think_llm"], temperature=0.1
+        # Initialize LLMs, behind the record/replay cassette when configured
+        self.cassette = get_cassette(self.config)
+        self.deep_thinking_llm = wrap_llm(
+            self._create_llm(self.config["deep_think_llm"]), self.cassette
         )
-        self.toolkit = Toolkit(config=self.config)
+        self.quick_thinking_llm = wrap_llm(
+            self._create_llm(self.config["quick_think_llm"], temperature=0.1),
+            self.cassette,
+        )
+        self.toolkit = toolkit if toolkit is not None else Toolkit(config=self.config)
 
         # Thread-safe memory initialization
-        self.bull_memory = safe_create_memory("bull_memory")
-        self.bear_memory = safe_create_memory("bear_memory")
-        self.trader_memory = safe_create_memory("trader_memory")
-        self.invest_judge_memory = safe_create_memory("invest_judge_memory")
-        self.risk_manager_memory = safe_create_memory("risk_manager_memory")
+        self.bull_memory = safe_create_memory("bull_memory", self.config)
+        self.bear_memory = safe_create_memory("bear_memory", self.config)
+        self.trader_memory = safe_create_memory("trader_memory", self.config)
+        self.invest_judge_memory = safe_create_memory(
+            "invest_judge_memory", self.config
+        )
+        self.risk_manager_memory = safe_create_memory(
+            "risk_manager_memory", self.config
+        )
+        # memory embeddings go through the same cassette (or fake) as the LLM calls
+        offline = self.config.get("llm_provider", "openai") == "fake"
+        for memory in (
+            self.bull_memory,
+            self.bear_memory,
+            self.trader_memory,
+            self.invest_judge_memory,
+            self.risk_manager_memory,
+        ):
+            memory.cassette = self.cassette
+            if offline:
+                memory.embedding_fn = fake_embedding
 
         # Tool nodes
         self.tool_nodes = self._create_tool_nodes()
@@ -110,6 +137,9 @@ class TradingAgentsGraph:
             self.risk_manager_memory,
             self.conditional_logic,
             self.config["risk_level"],
+            parallel_analysts=self.config.get("parallel_analysts", False),
+            parallel_risk_openings=self.config.get("parallel_risk_openings", False),
+            parallel_debate_openings=self.config.get("parallel_debate_openings", False),
         )
 
         self.propagator = Propagator()
@@ -124,6 +154,15 @@ class TradingAgentsGraph:
         # Setup graph
         self.graph = self.graph_setup.setup_graph(selected_analysts)
 
+    def _create_llm(self, model, **kwargs):
+        """Chat model of the configured llm_provider ("openai" or "fake")."""
+        provider = self.config.get("llm_provider", "openai")
+        if provider == "fake":
+            return FakeChatModel(decision=self.config.get("fake_llm_decision", "BUY"))
+        if provider != "openai":
+            raise ValueError(f"Unsupported llm_provider: {provider}")
+        return ChatOpenAI(model=model, **kwargs)
+
     def _check_thread(self):
         if threading.get_ident() != self._owner_thread:
             raise RuntimeError(
@@ -180,6 +219,8 @@ class TradingAgentsGraph:
             company_name, trade_date
         )
         args = self.propagator.get_graph_args()
+        if self.callbacks:
+            args["config"]["callbacks"] = self.callbacks
 
         if self.debug:
             # Debug mode with tracing